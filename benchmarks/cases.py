@@ -0,0 +1,216 @@
+from __future__ import annotations
+from tempfile import TemporaryDirectory
+from typing import Callable, NamedTuple
+from classes.board import Board
+from classes.board_loader import DATABASE_FILES, load_board
+from classes.field import PropertyField, Street
+from classes.game import Game
+from classes.game_state import GameState
+from classes.player import Player
+from classes.simulation import Policy
+from classes import simulation
+import classes.fields_from_json as ffjson
+from classes.board_generator import synthetic_board, write_board_files
+
+SHIPPED_FIELDS_NUM = 10
+BATCH_OPS = 1000
+RICH = 10 ** 9
+
+
+class Benchmark(NamedTuple):
+    """Measured operation.
+
+    Attributes
+    ----------
+    name : str
+        Name of the benchmark in results.
+    setup : callable
+        Function getting number of fields of the board and returning the
+        state used by run, not measured.
+    run : callable
+        Function doing one batch of the operation on the state and
+        returning number of operations done, measured.
+    reset : callable, optional
+        Function bringing the state back before the next batch, not
+        measured.
+    """
+    name: str
+    setup: Callable[[int], object]
+    run: Callable[[object], int]
+    reset: Callable[[object], None] = None
+
+
+def new_board(fields_num: int) -> Board:
+    """Creates the shipped board or a synthetic one of given size."""
+    if fields_num == SHIPPED_FIELDS_NUM:
+        return load_board()
+    return synthetic_board(fields_num)
+
+
+def new_game(fields_num: int, players_num: int = 2, seed: int = 0) -> Game:
+    """Creates prepared game with given seed."""
+    players = [Player(f'player{seat}') for seat in range(players_num)]
+    game = Game(new_board(fields_num), players, seed)
+    game.prepare_game()
+    return game
+
+
+def property_fields(game: Game) -> list[PropertyField]:
+    """Gets all property fields of the board of the game."""
+    board = game.board()
+    return [board.get_field_by_id(field_id)
+            for field_id in board.property_field_ids()]
+
+
+def give_fields(game: Game, player: Player, fields: list[PropertyField]
+                ) -> None:
+    """Makes the player owner of the fields without paying."""
+    for field in fields:
+        player.add_property(field.field_id())
+        field.set_owner(player)
+
+
+def setup_dice_move(fields_num: int) -> Game:
+    return new_game(fields_num)
+
+
+def run_dice_move(game: Game) -> int:
+    for _ in range(BATCH_OPS):
+        game.dice_roll()
+        game.move_pawn_number_of_dots()
+    return BATCH_OPS
+
+
+def setup_pay_rent(fields_num: int) -> Game:
+    game = new_game(fields_num)
+    payer, owner = game.players()
+    field = property_fields(game)[0]
+    give_fields(game, owner, [field])
+    payer.earn_money(RICH)
+    payer.set_position(field.field_id())
+    return game
+
+
+def run_pay_rent(game: Game) -> int:
+    for _ in range(BATCH_OPS):
+        game.pay_rent()
+    return BATCH_OPS
+
+
+def setup_build_house(fields_num: int) -> tuple[Game, list, GameState]:
+    game = new_game(fields_num)
+    player = game.current_player()
+    player.earn_money(RICH)
+    give_fields(game, player, property_fields(game))
+    groups = [group for group in game.board().colour_groups().values()
+              if type(group[0]) is Street]
+    return game, groups, GameState.capture(game)
+
+
+def run_build_house(state: tuple[Game, list, GameState]) -> int:
+    game, groups, _ = state
+    built = 0
+    for group in groups:
+        for _ in range(4):
+            for field in group:
+                game.build_house(field)
+                built += 1
+    return built
+
+
+def reset_build_house(state: tuple[Game, list, GameState]) -> None:
+    game, _, start = state
+    start.restore(game)
+
+
+def setup_owns_all_of_colour(fields_num: int) -> tuple[Game, list]:
+    game = new_game(fields_num)
+    fields = property_fields(game)
+    # whole colour groups and single fields of other groups
+    owned = [field for index, field in enumerate(fields)
+             if field.colour().endswith(('0', '2', '4', '6', '8'))
+             or index % 2]
+    give_fields(game, game.current_player(), owned)
+    return game, fields
+
+
+def run_owns_all_of_colour(state: tuple[Game, list]) -> int:
+    game, fields = state
+    rounds = max(1, BATCH_OPS // len(fields))
+    for _ in range(rounds):
+        for field in fields:
+            game.owns_all_of_colour(field)
+    return rounds * len(fields)
+
+
+def setup_total_fortune(fields_num: int) -> Game:
+    game = new_game(fields_num, players_num=4)
+    players = game.players()
+    for index, field in enumerate(property_fields(game)):
+        give_fields(game, players[index % len(players)], [field])
+    return game
+
+
+def run_total_fortune(game: Game) -> int:
+    players = game.players()
+    for index in range(BATCH_OPS):
+        game.total_fortune(players[index % len(players)])
+    return BATCH_OPS
+
+
+def setup_show_player_status(fields_num: int) -> Game:
+    game = new_game(fields_num)
+    fields = property_fields(game)
+    give_fields(game, game.current_player(), fields[::2])
+    return game
+
+
+def run_show_player_status(game: Game) -> int:
+    game.show_player_status()
+    return 1
+
+
+def setup_load_json(fields_num: int) -> tuple[tuple[str], object]:
+    if fields_num == SHIPPED_FIELDS_NUM:
+        return DATABASE_FILES, None
+    directory = TemporaryDirectory()
+    # the directory object is kept in the state, so files live as long
+    return write_board_files(directory.name, fields_num), directory
+
+
+def run_load_json(state: tuple[tuple[str], object]) -> int:
+    property_file, colour_file, special_file, cards_file = state[0]
+    Board(ffjson.property_fields_from_json(property_file),
+          ffjson.number_of_colour_from_json(colour_file),
+          ffjson.special_fields_from_json(special_file),
+          ffjson.chance_cards_from_json(cards_file))
+    return 1
+
+
+def setup_game(fields_num: int) -> dict:
+    return {'fields_num': fields_num, 'seed': 0, 'game': None}
+
+
+def reset_game(state: dict) -> None:
+    state['game'] = new_game(state['fields_num'], seed=state['seed'])
+    state['seed'] += 1
+
+
+def run_game(state: dict) -> int:
+    simulation.play(state['game'], [Policy(), Policy()], resumed=True)
+    return 1
+
+
+BENCHMARKS = (
+    Benchmark('dice_move', setup_dice_move, run_dice_move),
+    Benchmark('pay_rent', setup_pay_rent, run_pay_rent),
+    Benchmark('build_house', setup_build_house, run_build_house,
+              reset_build_house),
+    Benchmark('owns_all_of_colour', setup_owns_all_of_colour,
+              run_owns_all_of_colour),
+    Benchmark('total_fortune', setup_total_fortune, run_total_fortune),
+    Benchmark('show_player_status', setup_show_player_status,
+              run_show_player_status),
+    Benchmark('load_json', setup_load_json, run_load_json),
+    Benchmark('game', setup_game, run_game, reset_game),
+)
@@ -0,0 +1,211 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter_ns
+import argparse
+import gc
+import json
+import platform
+import sys
+from tabulate import tabulate
+from benchmarks.cases import BENCHMARKS, Benchmark
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_REPEATS = 5
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_OUTPUT = 'benchmark_results.json'
+
+
+def measure(benchmark: Benchmark, fields_num: int,
+            repeats: int = DEFAULT_REPEATS,
+            min_time: float = DEFAULT_MIN_TIME) -> dict:
+    """Measures time of one operation of the benchmark on given board size.
+
+    Every repeat runs at least one batch and then batches until they took
+    min_time seconds.
+    Garbage collection is turned off while a batch runs, like in timeit.
+
+    Returns
+    -------
+    dict
+        Result with best and median nanoseconds per operation of the
+        repeats and number of operations measured.
+    """
+    state = benchmark.setup(fields_num)
+    per_op = []
+    ops_sum = 0
+    for _ in range(repeats):
+        elapsed = 0
+        ops = 0
+        while ops == 0 or elapsed < min_time * 1e9:
+            if benchmark.reset is not None:
+                benchmark.reset(state)
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                start = perf_counter_ns()
+                ops += benchmark.run(state)
+                elapsed += perf_counter_ns() - start
+            finally:
+                if gc_enabled:
+                    gc.enable()
+        per_op.append(elapsed / ops)
+        ops_sum += ops
+    return {'name': benchmark.name, 'fields': fields_num, 'ops': ops_sum,
+            'best_ns': min(per_op), 'median_ns': median(per_op)}
+
+
+def result_key(result: dict) -> str:
+    """Gets key of the result in results file."""
+    return f"{result['name']}/{result['fields']}"
+
+
+def run_benchmarks(sizes: tuple[int] = DEFAULT_SIZES, names: list[str] = None,
+                   repeats: int = DEFAULT_REPEATS,
+                   min_time: float = DEFAULT_MIN_TIME) -> dict:
+    """Runs benchmarks on every board size.
+
+    Parameters
+    ----------
+    sizes : tuple of int, default = DEFAULT_SIZES
+        Numbers of fields of the boards, 10 is the shipped board and other
+        sizes are synthetic boards.
+    names : list of str, optional
+        Names of benchmarks to run (default is all of them).
+    repeats : int, default = DEFAULT_REPEATS
+        Number of repeats of every measurement.
+    min_time : float, default = DEFAULT_MIN_TIME
+        Minimal time of one repeat in seconds.
+
+    Returns
+    -------
+    dict
+        Results in the format of the results file.
+    """
+    results = {}
+    for benchmark in BENCHMARKS:
+        if names and benchmark.name not in names:
+            continue
+        for fields_num in sizes:
+            result = measure(benchmark, fields_num, repeats, min_time)
+            results[result_key(result)] = result
+    return {'version': RESULTS_VERSION,
+            'created': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeats': repeats,
+            'results': results}
+
+
+def save_results(results: dict, filename: str) -> None:
+    """Writes results to json file."""
+    with open(filename, 'w') as fp:
+        json.dump(results, fp, indent=4)
+
+
+def load_results(filename: str) -> dict:
+    """Reads results from json file.
+
+    Raises
+    ------
+    ValueError
+        If the file has results in other version of the format.
+    """
+    with open(filename) as fp:
+        results = json.load(fp)
+    if results.get('version') != RESULTS_VERSION:
+        raise ValueError(f'Unsupported results version in {filename}')
+    return results
+
+
+def compare(results: dict, baseline: dict,
+            threshold: float = DEFAULT_THRESHOLD) -> list[tuple]:
+    """Compares best times of the results with the baseline.
+
+    Parameters
+    ----------
+    results : dict
+        Current results.
+    baseline : dict
+        Stored results.
+    threshold : float, default = DEFAULT_THRESHOLD
+        Relative change of time treated as a regression or improvement.
+
+    Returns
+    -------
+    list of tuple
+        Key, baseline time, current time, ratio and status ('regression',
+        'improvement' or 'ok') of every benchmark present in both.
+    """
+    rows = []
+    for key, result in results['results'].items():
+        stored = baseline['results'].get(key)
+        if stored is None:
+            continue
+        ratio = result['best_ns'] / stored['best_ns']
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 - threshold:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append((key, stored['best_ns'], result['best_ns'], ratio,
+                     status))
+    return rows
+
+
+def results_table(results: dict) -> str:
+    """Gets results as a text table."""
+    rows = [(key, result['best_ns'] / 1000, result['median_ns'] / 1000,
+             result['ops']) for key, result in results['results'].items()]
+    return tabulate(rows, headers=['benchmark', 'best us/op',
+                                   'median us/op', 'ops'],
+                    floatfmt='.3f')
+
+
+def comparison_table(rows: list[tuple]) -> str:
+    """Gets comparison with the baseline as a text table."""
+    return tabulate([(key, stored / 1000, current / 1000, ratio, status)
+                     for key, stored, current, ratio, status in rows],
+                    headers=['benchmark', 'baseline us/op', 'us/op',
+                             'ratio', 'status'],
+                    floatfmt='.3f')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmarks of the game engine hot paths.')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=list(DEFAULT_SIZES),
+                        help='numbers of fields of the boards')
+    parser.add_argument('--only', nargs='+', metavar='NAME',
+                        choices=[benchmark.name for benchmark in BENCHMARKS],
+                        help='run only given benchmarks')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                        help='minimal time of one repeat in seconds')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                        help='json file the results are written to')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='json file with results to compare with')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='relative slowdown treated as a regression')
+    args = parser.parse_args()
+    results = run_benchmarks(tuple(args.sizes), args.only, args.repeats,
+                             args.min_time)
+    save_results(results, args.output)
+    print(results_table(results))
+    if args.compare is not None:
+        rows = compare(results, load_results(args.compare), args.threshold)
+        print()
+        print(comparison_table(rows))
+        regressions = [row[0] for row in rows if row[4] == 'regression']
+        if regressions:
+            print(f"\nRegressions: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
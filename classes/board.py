@@ -1,7 +1,11 @@
 from __future__ import annotations
 from classes.field import Field, PropertyField, SpecialField
 from classes.chance_card import ChanceCard
-from itertools import cycle
+from classes.chance_deck import ChanceDeck
+from classes.rent_table import RentTable
+from copy import copy
+
+MAX_FORK_DEPTH = 8
 
 
 class ColourError(Exception):
@@ -18,12 +22,37 @@ class Board:
         List of ProprertyField obejcts on the board.
     _special_fields : list of SpecialField
         List of SpecialField objects on the board.
-    _chance_cards : itertools.cycle
-        Iterator providing chance cards selected on the chance field.
+    _chance_cards_by_id : dict of int to ChanceCard
+        Dictionary assigning card indices to chance cards.
+    _chance_deck : ChanceDeck
+        Deck the chance cards are drawn from.
     _all_fields : dict of int to Field
-        Dictionary of field indices, containing instances of Field objects values
+        Dictionary of field indices, containing instances of Field objects
+        values. In a forked board only the fields this board may change.
+    _bases : tuple of dict of int to Field
+        Frozen fields shared with other forks, the nearest first. Fields
+        are copied from them into _all_fields when first used.
+    _owner_map : dict of Player to Player
+        Dictionary assigning players of the boards the frozen fields come
+        from to the players of this board.
     _number_of_fields_colour : dict of str to int
         Dictioary assigning colour names to number of fields in that colour group.
+    _colour_groups : dict of str to tuple of PropertyField
+        Dictionary assigning colour names to fields in that colour group,
+        filled on demand in a forked board.
+    _colour_ids : dict of str to tuple of int
+        Dictionary assigning colour names to indices of fields in that
+        colour group.
+    _field_colour_group : dict of int to tuple of int
+        Dictionary assigning property field indices to the indices of all
+        fields in the same colour group.
+    _property_field_ids : tuple of int
+        Indices of property fields in the order of _property_fields.
+    _rent_table : RentTable
+        Rent schedules of property fields, shared by boards with the same
+        rents.
+    _max_field_id : int
+        Index of the last field on the board.
     current_chance_card : ChanceCard
         ChanceCard object representing currently selected chance card.
     """
@@ -52,9 +81,22 @@ class Board:
         self._special_fields = special_fields
         if chance_cards is None:
             chance_cards = []
-        self._chance_cards = cycle(chance_cards)
+        self._chance_deck = ChanceDeck(chance_cards)
+        self._chance_cards_by_id = {card.card_id(): card
+                                    for card in chance_cards}
         self._all_fields = self._generate_all_fields_dict()
+        self._bases = ()
+        self._owner_map = {}
         self._number_of_fields_colour = num_of_fields_col
+        self._colour_groups = self._generate_colour_groups()
+        self._colour_ids = {
+            colour: tuple(field.field_id() for field in fields)
+            for colour, fields in self._colour_groups.items()}
+        self._field_colour_group = self._generate_field_colour_group()
+        self._property_field_ids = tuple(
+            field.field_id() for field in property_fields)
+        self._rent_table = RentTable.for_fields(property_fields)
+        self._max_field_id = max(self._all_fields, default=0)
         self.current_chance_card = None
 
     def current_chance_card(self):
@@ -68,13 +110,118 @@ class Board:
             all_fields[field.field_id()] = field
         return all_fields
 
+    def _generate_colour_groups(self) -> dict[str, tuple[PropertyField]]:
+        """Generate dictionary assigning colours to fields of that colour."""
+        colour_groups = {}
+        for field in self._property_fields:
+            colour_groups.setdefault(field.colour(), []).append(field)
+        return {colour: tuple(fields)
+                for colour, fields in colour_groups.items()}
+
+    def colour_groups(self) -> dict[str, tuple[PropertyField]]:
+        """Get dictionary assigning colours to fields of that colour."""
+        if len(self._colour_groups) != len(self._colour_ids):
+            for colour in self._colour_ids:
+                self.get_all_fields_of_colour(colour)
+        return self._colour_groups
+
+    def _generate_field_colour_group(self) -> dict[int, tuple[int]]:
+        """Generate dictionary assigning fields to their colour groups."""
+        field_colour_group = {}
+        for fields in self._colour_groups.values():
+            group_ids = tuple(field.field_id() for field in fields)
+            for field_id in group_ids:
+                field_colour_group[field_id] = group_ids
+        return field_colour_group
+
     def get_field_by_id(self, field_id: int) -> Field:
         """Get field by given id."""
-        return self._all_fields[field_id]
+        field = self._all_fields.get(field_id)
+        if field is None:
+            return self._copy_field(field_id)
+        return field
+
+    def _copy_field(self, field_id: int) -> Field:
+        """Get own copy of the frozen field with given id.
+
+        Special fields never change, so they are shared.
+
+        Raises
+        ------
+        KeyError
+            If there is no field with given id.
+        """
+        for fields in self._bases:
+            field = fields.get(field_id)
+            if field is not None:
+                break
+        else:
+            raise KeyError(field_id)
+        if not isinstance(field, PropertyField):
+            return field
+        field = copy(field)
+        owner = field._owner
+        if owner is not None:
+            field._owner = self._owner_map.get(owner, owner)
+        self._all_fields[field_id] = field
+        return field
+
+    def fork(self, owners: dict) -> Board:
+        """Get board sharing fields with this board until they are changed.
+
+        Fields of this board are frozen and both boards copy a field the
+        first time they use it, so forking takes time independent of the
+        size of the board. Field objects taken from this board before
+        forking must not be changed afterwards, get them again instead.
+
+        Parameters
+        ----------
+        owners : dict of Player to Player
+            Dictionary assigning players of this board to the players of
+            the new board.
+
+        Returns
+        -------
+        Board
+        """
+        if self._all_fields:
+            self._bases = (self._all_fields,) + self._bases
+            self._all_fields = {}
+            self._colour_groups = {}
+        if len(self._bases) > MAX_FORK_DEPTH:
+            merged = {}
+            for fields in reversed(self._bases):
+                merged.update(fields)
+            self._bases = (merged,)
+        board = Board.__new__(Board)
+        board.__dict__.update(self.__dict__)
+        board._all_fields = {}
+        board._colour_groups = {}
+        board._owner_map = {player: owners.get(own_player, own_player)
+                            for player, own_player in self._owner_map.items()}
+        board._owner_map.update(owners)
+        board._chance_deck = self._chance_deck.copy()
+        return board
+
+    def max_field_id(self) -> int:
+        """Get index of the last field, pawns go to start after it."""
+        return self._max_field_id
+
+    def special_fields(self) -> list[SpecialField]:
+        """Get special fields on the board."""
+        return self._special_fields
+
+    def property_field_ids(self) -> tuple[int]:
+        """Get indices of all property fields on the board."""
+        return self._property_field_ids
+
+    def rent_table(self) -> RentTable:
+        """Get rent schedules of all property fields."""
+        return self._rent_table
 
     def get_fields_owner(self, field_id: int) -> int:
         """Get the player who owns filed with given index."""
-        return self._all_fields[field_id].owner()
+        return self.get_field_by_id(field_id).owner()
 
     def get_max_number_of_same_colour(self, colour: str) -> int:
         """Get the number of fields in given colour.
@@ -91,8 +238,8 @@ class Board:
         """
         return self._number_of_fields_colour[colour]
 
-    def get_all_fields_of_colour(self, colour: str) -> list[PropertyField]:
-        """Get the list of fields in the given colour.
+    def get_all_fields_of_colour(self, colour: str) -> tuple[PropertyField]:
+        """Get the fields in the given colour.
 
         Parameters
         ----------
@@ -101,23 +248,54 @@ class Board:
 
         Returns
         -------
-        list of PropertyField
-            The list of PropertyField instances in the colour group.
+        tuple of PropertyField
+            The PropertyField instances in the colour group.
 
         Raises
         ------
         ColourError
             If the colour does not exist on the board.
         """
-        same_colour = []
-        for f in self._property_fields:
-            if f.colour() == colour:
-                same_colour.append(f)
-        if len(same_colour) == 0:
-            raise ColourError("Colour doesn't exist")
-        return same_colour
+        group = self._colour_groups.get(colour)
+        if group is None:
+            try:
+                ids = self._colour_ids[colour]
+            except KeyError:
+                raise ColourError("Colour doesn't exist")
+            group = tuple(self.get_field_by_id(field_id) for field_id in ids)
+            self._colour_groups[colour] = group
+        return group
+
+    def get_colour_group_ids(self, field_id: int) -> tuple[int]:
+        """Get indices of all fields in the colour group of given field.
+
+        Raises
+        ------
+        ColourError
+            If the field is not a property field on the board.
+        """
+        try:
+            return self._field_colour_group[field_id]
+        except KeyError:
+            raise ColourError("Field doesn't have colour")
+
+    def get_chance_card_by_id(self, card_id: int) -> ChanceCard:
+        """Get chance card with given index."""
+        return self._chance_cards_by_id[card_id]
+
+    def chance_deck(self) -> ChanceDeck:
+        """Get deck of chance cards."""
+        return self._chance_deck
 
     def get_new_chance_card(self):
         """Get next chance card from deck."""
-        self.current_chance_card = next(self._chance_cards)
+        self.current_chance_card = self._chance_deck.draw()
         return self.current_chance_card
+
+    def chance_card_position(self) -> int:
+        """Get number of cards drawn from the deck."""
+        return self._chance_deck.position()
+
+    def set_chance_card_position(self, position: int) -> None:
+        """Set number of cards drawn from the deck."""
+        self._chance_deck.set_position(position)
@@ -0,0 +1,251 @@
+from __future__ import annotations
+import argparse
+import json
+import os
+from itertools import cycle
+from classes.board import Board
+from classes.chance_card import ChanceFieldAction, chance_action_values
+from classes.game_constants import GameConstants
+import classes.fields_from_json as ffjson
+
+DEFAULT_GROUP_SIZES = (3,)
+DEFAULT_SPECIAL_EVERY = 5
+DEFAULT_PROPERTY_GROUP_EVERY = 4
+DEFAULT_CHANCE_CARDS_NUM = 16
+DEFAULT_CARD_MONEY_STEP = 10
+DEFAULT_CARD_ACTIONS = (ChanceFieldAction.PAY.value,
+                        ChanceFieldAction.EARN.value)
+RENT_FACTORS = (5, 15, 45, 55, 65)
+MIN_FIELDS_NUM = 2
+
+
+def street_data(field_id: int, fields_num: int, colour: str,
+                with_houses: bool) -> dict:
+    """Generates database object of one property field.
+
+    Prices grow along the board from 60 to 440.
+    """
+    price = 60 + 20 * (field_id * 20 // fields_num)
+    rent = price // 10
+    field = {'type': 'street', 'colour': colour, 'field_id': field_id,
+             'name': f'Street {field_id}', 'rent': rent,
+             'prices': {'base_price': price}}
+    if not with_houses:
+        field['type'] = 'property'
+        field['other_rents'] = {'mortgage': price // 2}
+        return field
+    field['prices']['house_cost'] = 50 + 50 * (price // 100)
+    field['prices']['hotel_cost'] = field['prices']['house_cost']
+    field['other_rents'] = {
+        'w_one_house': rent * RENT_FACTORS[0],
+        'w_two_houses': rent * RENT_FACTORS[1],
+        'w_three_houses': rent * RENT_FACTORS[2],
+        'w_four_houses': rent * RENT_FACTORS[3],
+        'w_hotel': rent * RENT_FACTORS[4],
+        'mortgage': price // 2}
+    return field
+
+
+def chance_cards_data(cards_num: int = DEFAULT_CHANCE_CARDS_NUM,
+                      money_step: int = DEFAULT_CARD_MONEY_STEP,
+                      actions: tuple[str] = DEFAULT_CARD_ACTIONS,
+                      fields_num: int = MIN_FIELDS_NUM) -> list[dict]:
+    """Generates deck of chance cards cycling through given actions.
+
+    Card with index i moves (i + 1) * money_step, to or from every other
+    player in 'pay each' and 'collect each' actions. 'move' card with
+    index i moves the pawn to field i modulo fields_num, 'repairs' card
+    costs its money per house and four times more per hotel.
+
+    Raises
+    ------
+    ValueError
+        If an action is not known or the jail is out of the board.
+    """
+    for action in actions:
+        if action not in chance_action_values():
+            raise ValueError(f'Unknown chance card action {action}')
+    if ChanceFieldAction.GO_TO_JAIL.value in actions and \
+            fields_num <= GameConstants.JAIL_FIELD_ID:
+        raise ValueError('Board is too small for the jail')
+    cards = []
+    for card_id in range(cards_num):
+        money = money_step * (card_id + 1)
+        card = {'card_id': card_id,
+                'description': f'Card {card_id}',
+                'action': actions[card_id % len(actions)],
+                'money': money}
+        if card['action'] == ChanceFieldAction.MOVE.value:
+            card['field_id'] = card_id % fields_num
+        elif card['action'] == ChanceFieldAction.REPAIRS.value:
+            card['house_cost'] = money
+            card['hotel_cost'] = 4 * money
+        cards.append(card)
+    return cards
+
+
+def synthetic_board_data(
+        fields_num: int,
+        group_sizes: tuple[int] = DEFAULT_GROUP_SIZES,
+        special_every: int = DEFAULT_SPECIAL_EVERY,
+        property_group_every: int = DEFAULT_PROPERTY_GROUP_EVERY,
+        cards_num: int = DEFAULT_CHANCE_CARDS_NUM,
+        card_money_step: int = DEFAULT_CARD_MONEY_STEP,
+        card_actions: tuple[str] = DEFAULT_CARD_ACTIONS
+        ) -> tuple[list[dict], dict[str, int], list[dict], list[dict]]:
+    """Generates database objects of a board with given number of fields.
+
+    Field 0 is the start field, every special_every-th field is a chance
+    field and other fields are streets in colour groups with prices
+    growing along the board. The same arguments always give the same
+    board.
+
+    Parameters
+    ----------
+    fields_num : int
+        Number of fields, at least MIN_FIELDS_NUM.
+    group_sizes : tuple of int, default = DEFAULT_GROUP_SIZES
+        Sizes of consecutive colour groups, repeated along the board. The
+        last group is smaller if the fields run out.
+    special_every : int, default = DEFAULT_SPECIAL_EVERY
+        Distance between chance fields, 0 for no chance fields.
+    property_group_every : int, default = DEFAULT_PROPERTY_GROUP_EVERY
+        Every property_group_every-th colour group is made of properties
+        without houses, 0 for streets only.
+    cards_num : int, default = DEFAULT_CHANCE_CARDS_NUM
+        Number of chance cards, see chance_cards_data.
+    card_money_step : int, default = DEFAULT_CARD_MONEY_STEP
+        Difference of money of consecutive chance cards.
+    card_actions : tuple of str, default = DEFAULT_CARD_ACTIONS
+        Actions of consecutive chance cards, repeated through the deck.
+
+    Returns
+    -------
+    tuple of list of dict, dict of str to int, list of dict, list of dict
+        Property fields, number of colour, special fields and chance cards
+        in the format of the database files.
+
+    Raises
+    ------
+    ValueError
+        If the board is too small, a group size is not positive or a card
+        action is not valid.
+    """
+    if fields_num < MIN_FIELDS_NUM:
+        raise ValueError(f'Board must have at least {MIN_FIELDS_NUM} fields')
+    if not group_sizes or min(group_sizes) < 1:
+        raise ValueError('Colour groups must have at least one field')
+    property_fields = []
+    special_fields = [{'field_id': 0, 'name': 'start'}]
+    number_of_colour = {}
+    sizes = cycle(group_sizes)
+    group = -1
+    left_in_group = 0
+    for field_id in range(1, fields_num):
+        if special_every and field_id % special_every == 0:
+            special_fields.append({'field_id': field_id, 'name': 'chance'})
+            continue
+        if left_in_group == 0:
+            group += 1
+            left_in_group = next(sizes)
+        left_in_group -= 1
+        colour = f'colour{group}'
+        number_of_colour[colour] = number_of_colour.get(colour, 0) + 1
+        with_houses = not property_group_every or \
+            group % property_group_every != property_group_every - 1
+        property_fields.append(
+            street_data(field_id, fields_num, colour, with_houses))
+    chance_cards = chance_cards_data(cards_num, card_money_step,
+                                     card_actions, fields_num)
+    return property_fields, number_of_colour, special_fields, chance_cards
+
+
+def synthetic_board(fields_num: int, **options) -> Board:
+    """Creates new board with given number of fields.
+
+    Parameters
+    ----------
+    fields_num : int
+        Number of fields.
+    **options
+        Other keyword arguments of synthetic_board_data.
+    """
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        synthetic_board_data(fields_num, **options)
+    return Board(ffjson.property_fields_from_data(property_fields),
+                 number_of_colour,
+                 ffjson.special_fields_from_data(special_fields),
+                 ffjson.chance_cards_from_data(chance_cards))
+
+
+def write_board_files(directory: str, fields_num: int, **options
+                      ) -> tuple[str]:
+    """Writes database files of the synthetic board to the directory.
+
+    Parameters
+    ----------
+    directory : str
+        Existing directory the files are written to.
+    fields_num : int
+        Number of fields.
+    **options
+        Other keyword arguments of synthetic_board_data.
+
+    Returns
+    -------
+    tuple of str
+        Names of property fields, number of colour, special fields and
+        chance cards files, in the order of board_loader.DATABASE_FILES.
+    """
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        synthetic_board_data(fields_num, **options)
+    files = []
+    for name, data in (('property_fields', property_fields),
+                       ('number_of_colour', [number_of_colour]),
+                       ('special_fields', special_fields),
+                       ('chance_cards', chance_cards)):
+        filename = os.path.join(directory, f'{name}.json')
+        with open(filename, 'w') as fp:
+            json.dump(data, fp, indent=4)
+        files.append(filename)
+    return tuple(files)
+
+
+def main() -> None:
+    """Writes database files of a synthetic board given on command line."""
+    parser = argparse.ArgumentParser(
+        description='Generates database files of a large board.')
+    parser.add_argument('directory', help='directory for the json files')
+    parser.add_argument('fields_num', type=int, help='number of fields')
+    parser.add_argument('--group-sizes', type=int, nargs='+',
+                        default=list(DEFAULT_GROUP_SIZES),
+                        help='sizes of consecutive colour groups')
+    parser.add_argument('--special-every', type=int,
+                        default=DEFAULT_SPECIAL_EVERY,
+                        help='distance between chance fields, 0 for none')
+    parser.add_argument('--property-group-every', type=int,
+                        default=DEFAULT_PROPERTY_GROUP_EVERY,
+                        help='how often a group has no houses, 0 for never')
+    parser.add_argument('--cards', type=int,
+                        default=DEFAULT_CHANCE_CARDS_NUM,
+                        help='number of chance cards')
+    parser.add_argument('--card-money-step', type=int,
+                        default=DEFAULT_CARD_MONEY_STEP)
+    parser.add_argument('--card-actions', nargs='+',
+                        choices=chance_action_values(),
+                        default=list(DEFAULT_CARD_ACTIONS),
+                        help='actions of consecutive chance cards')
+    args = parser.parse_args()
+    os.makedirs(args.directory, exist_ok=True)
+    files = write_board_files(
+        args.directory, args.fields_num,
+        group_sizes=tuple(args.group_sizes),
+        special_every=args.special_every,
+        property_group_every=args.property_group_every,
+        cards_num=args.cards, card_money_step=args.card_money_step,
+        card_actions=tuple(args.card_actions))
+    print('\n'.join(files))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,319 @@
+from __future__ import annotations
+import mmap
+import os
+import struct
+import tempfile
+from classes.board import Board
+from classes.board_loader import BoardDefinition, DATABASE_FILES
+from classes.board_loader import load_board_definition
+from classes.chance_card import ChanceCard
+from classes.field import PropertyField, SpecialField, Street
+from classes.rent_table import STREET_RENT_KEYS
+
+IMAGE_MAGIC = b'MBIM'
+IMAGE_VERSION = 2
+IMAGE_HEADER = struct.Struct('<4sH32sIIIII')
+COLOUR_RECORD = struct.Struct('<III')
+PROPERTY_RECORD = struct.Struct('<iBHII4i6i')
+SPECIAL_RECORD = struct.Struct('<iII')
+CARD_RECORD = struct.Struct('<iiiiiIIII')
+NO_FIELD = -1
+
+_images = {}
+
+
+class BoardImageError(Exception):
+    """Raised when board image data is invalid."""
+    pass
+
+
+class _StringTable:
+    """Builder of the utf-8 strings section of an image.
+
+    Attributes
+    ----------
+    _data : bytearray
+        Encoded strings.
+    _offsets : dict of str to tuple of int
+        Offset and length of every added string.
+    """
+
+    def __init__(self):
+        """Initiates empty table."""
+        self._data = bytearray()
+        self._offsets = {}
+
+    def add(self, text: str) -> tuple[int, int]:
+        """Gets offset and length of the string, adding it if new."""
+        position = self._offsets.get(text)
+        if position is None:
+            encoded = text.encode()
+            position = (len(self._data), len(encoded))
+            self._data += encoded
+            self._offsets[text] = position
+        return position
+
+    def data(self) -> bytes:
+        """Gets the encoded strings."""
+        return bytes(self._data)
+
+
+def image_bytes(definition: BoardDefinition) -> bytes:
+    """Compiles the board definition into a binary image.
+
+    The image has a header, fixed-width records of colours, property
+    fields in the order of the property fields file, special fields and
+    chance cards, followed by the utf-8 strings they point to.
+
+    Parameters
+    ----------
+    definition : BoardDefinition
+        Validated board definition.
+
+    Returns
+    -------
+    bytes
+    """
+    strings = _StringTable()
+    colours = list(definition.number_of_colour().items())
+    colour_index = {colour: index for index, (colour, _) in enumerate(colours)}
+    records = bytearray()
+    for colour, count in colours:
+        records += COLOUR_RECORD.pack(*strings.add(colour), count)
+    for field in definition.property_fields():
+        street = field['type'] == 'street'
+        prices = field['prices']
+        rents = field['other_rents']
+        level_rents = [field['rent']] * 6
+        if street:
+            level_rents[1:] = [rents[key] for key in STREET_RENT_KEYS]
+        records += PROPERTY_RECORD.pack(
+            field['field_id'], street, colour_index[field['colour']],
+            *strings.add(field['name']), prices['base_price'],
+            prices.get('house_cost', 0), prices.get('hotel_cost', 0),
+            rents['mortgage'], *level_rents)
+    for field in definition.special_fields():
+        records += SPECIAL_RECORD.pack(field['field_id'],
+                                       *strings.add(field['name']))
+    for card in definition.chance_cards():
+        field_id = card.get('field_id')
+        records += CARD_RECORD.pack(
+            card['card_id'], card.get('money', 0),
+            NO_FIELD if field_id is None else field_id,
+            card.get('house_cost', 0), card.get('hotel_cost', 0),
+            *strings.add(card['description']), *strings.add(card['action']))
+    text = strings.data()
+    header = IMAGE_HEADER.pack(
+        IMAGE_MAGIC, IMAGE_VERSION, definition.definition_hash(),
+        len(colours), len(definition.property_fields()),
+        len(definition.special_fields()), len(definition.chance_cards()),
+        len(text))
+    return header + bytes(records) + text
+
+
+def write_board_image(definition: BoardDefinition, filename: str) -> None:
+    """Writes image of the definition, replacing the file atomically.
+
+    Processes that already mapped an older file keep their mapping.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(image_bytes(definition))
+        os.replace(temporary, filename)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+class BoardImage:
+    """Read-only memory mapped board image.
+
+    Pages of the file are shared by every process mapping it. Boards are
+    built from the mapped records without parsing json or validating the
+    definition again.
+
+    Attributes
+    ----------
+    _map : mmap.mmap
+        Mapped file.
+    _view : memoryview
+        View of the mapped file.
+    _definition_hash : bytes
+        sha256 digest of the database files the image was made from.
+    _sections : dict of str to memoryview
+        Records of colours, properties, specials, cards and the strings.
+    _strings : dict of int to str
+        Strings decoded so far, by offset.
+    """
+
+    def __init__(self, filename: str):
+        """Maps the file and checks its header.
+
+        Raises
+        ------
+        BoardImageError
+            If the file is not a complete board image.
+        """
+        with open(filename, 'rb') as fp:
+            try:
+                self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise BoardImageError('Board image is empty')
+        self._view = memoryview(self._map)
+        if len(self._view) < IMAGE_HEADER.size:
+            raise BoardImageError('Board image is too short')
+        magic, version, self._definition_hash, colours_num, properties_num, \
+            specials_num, cards_num, strings_size = \
+            IMAGE_HEADER.unpack_from(self._view)
+        if magic != IMAGE_MAGIC or version != IMAGE_VERSION:
+            raise BoardImageError('Unknown board image format')
+        self._sections = {}
+        position = IMAGE_HEADER.size
+        for name, record, number in (
+                ('colours', COLOUR_RECORD, colours_num),
+                ('properties', PROPERTY_RECORD, properties_num),
+                ('specials', SPECIAL_RECORD, specials_num),
+                ('cards', CARD_RECORD, cards_num),
+                ('strings', None, strings_size)):
+            size = number if record is None else number * record.size
+            self._sections[name] = self._view[position:position + size]
+            position += size
+        if position != len(self._view):
+            raise BoardImageError('Board image is truncated')
+        self._strings = {}
+
+    def definition_hash(self) -> bytes:
+        """Gets sha256 digest of the database files of the image."""
+        return self._definition_hash
+
+    def _string(self, offset: int, length: int) -> str:
+        """Gets string from the strings section."""
+        text = self._strings.get(offset)
+        if text is None:
+            text = str(self._sections['strings'][offset:offset + length],
+                       'utf-8')
+            self._strings[offset] = text
+        return text
+
+    def build_board(self) -> Board:
+        """Creates new board with fields in their initial state."""
+        sections = self._sections
+        colours = []
+        number_of_colour = {}
+        for offset, length, count in COLOUR_RECORD.iter_unpack(
+                sections['colours']):
+            colour = self._string(offset, length)
+            colours.append(colour)
+            number_of_colour[colour] = count
+        property_fields = []
+        for field_id, street, colour, offset, length, price, house_cost, \
+                hotel_cost, mortgage, *rents in PROPERTY_RECORD.iter_unpack(
+                    sections['properties']):
+            name = self._string(offset, length)
+            other_rents = {'mortgage': mortgage}
+            if street:
+                other_rents.update(zip(STREET_RENT_KEYS, rents[1:]))
+                prices = {'base_price': price, 'house_cost': house_cost,
+                          'hotel_cost': hotel_cost}
+                field = Street(field_id, name, colours[colour], rents[0],
+                               prices, other_rents)
+            else:
+                field = PropertyField(field_id, name, colours[colour],
+                                      rents[0], {'base_price': price},
+                                      other_rents)
+            property_fields.append(field)
+        special_fields = [
+            SpecialField(field_id, self._string(offset, length))
+            for field_id, offset, length in SPECIAL_RECORD.iter_unpack(
+                sections['specials'])]
+        chance_cards = [
+            ChanceCard(card_id, self._string(offset, length),
+                       self._string(action_offset, action_length), money,
+                       None if field_id == NO_FIELD else field_id,
+                       house_cost, hotel_cost)
+            for card_id, money, field_id, house_cost, hotel_cost, offset,
+            length, action_offset, action_length in CARD_RECORD.iter_unpack(
+                sections['cards'])]
+        return Board(property_fields, number_of_colour, special_fields,
+                     chance_cards)
+
+
+def open_board_image(filename: str) -> BoardImage:
+    """Gets the image mapped from the file, mapping it once per process."""
+    image = _images.get(filename)
+    if image is None:
+        image = BoardImage(filename)
+        _images[filename] = image
+    return image
+
+
+def image_directory() -> str:
+    """Gets per-user directory of cached board images, creating it.
+
+    The directory is monopoly-board-images in XDG_CACHE_HOME, or in
+    ~/.cache if it is not set, readable only by the user.
+    """
+    cache = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+    directory = os.path.join(cache, 'monopoly-board-images')
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    return directory
+
+
+def image_matches(filename: str, definition_hash: bytes) -> bool:
+    """Checks that the file is a complete image of the current format
+    made from the definition with given hash."""
+    try:
+        image = BoardImage(filename)
+    except (OSError, BoardImageError):
+        return False
+    return image.definition_hash() == definition_hash
+
+
+def board_image_file(files: tuple[str] = DATABASE_FILES,
+                     directory: str = None) -> str:
+    """Gets name of the image of the database files, writing it if needed.
+
+    Images are named by the format version and the hash of the files
+    contents, so changed files get a new image. An existing file is used
+    only if its header matches, otherwise it is written again.
+
+    Parameters
+    ----------
+    files : tuple of str, optional
+        Database files (default are the shipped database files).
+    directory : str, optional
+        Directory of the images (default is image_directory()).
+    """
+    definition = load_board_definition(files)
+    if directory is None:
+        directory = image_directory()
+    definition_hash = definition.definition_hash()
+    filename = os.path.join(
+        directory, f'board-v{IMAGE_VERSION}-{definition_hash.hex()}.img')
+    if not image_matches(filename, definition_hash):
+        write_board_image(definition, filename)
+    return filename
+
+
+class ImageBoardFactory:
+    """Picklable board factory building boards from a mapped image.
+
+    Pass it as board_factory to tournament.run_tournament or
+    matchup.run_matchup, every worker process maps the image once.
+
+    Attributes
+    ----------
+    _filename : str
+        Name of the image file.
+    """
+
+    def __init__(self, filename: str):
+        """Initiates factory of boards of the image file."""
+        self._filename = filename
+
+    def __call__(self) -> Board:
+        """Creates new board from the image."""
+        return open_board_image(self._filename).build_board()
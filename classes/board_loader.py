@@ -0,0 +1,223 @@
+from __future__ import annotations
+from hashlib import sha256
+import json
+import classes.fields_from_json as ffjson
+from classes.board import Board
+from classes.chance_card import ChanceFieldAction, chance_action_values
+from classes.game_constants import GameConstants
+
+CHANCE_CARDS = "database/chance_cards.json"
+PROPERTY_FIELDS = "database/property_fields.json"
+SPECIAL_FIELDS = "database/special_fields.json"
+NUMBER_OF_COLOUR = "database/number_of_colour.json"
+DATABASE_FILES = (PROPERTY_FIELDS, NUMBER_OF_COLOUR,
+                  SPECIAL_FIELDS, CHANCE_CARDS)
+PROPERTY_FIELD_KEYS = ('field_id', 'type', 'colour', 'name', 'rent',
+                       'prices', 'other_rents')
+SPECIAL_FIELD_KEYS = ('field_id', 'name')
+CHANCE_CARD_KEYS = ('card_id', 'description', 'action')
+
+_definitions = {}
+
+
+class BoardDefinitionError(Exception):
+    """Raised when board database files are not consistent."""
+    pass
+
+
+class BoardDefinition:
+    """Validated static data of a board loaded from the database files.
+
+    The parsed json objects are shared read-only by every board built
+    from the definition.
+
+    Attributes
+    ----------
+    _hash : bytes
+        sha256 digest of the contents of the database files.
+    _property_fields : list of dict
+        Parsed property fields file.
+    _number_of_colour : dict of str to int
+        Parsed number of colour file.
+    _special_fields : list of dict
+        Parsed special fields file.
+    _chance_cards : list of dict
+        Parsed chance cards file.
+    """
+
+    __slots__ = ('_hash', '_property_fields', '_number_of_colour',
+                 '_special_fields', '_chance_cards')
+
+    def __init__(self, definition_hash: bytes, property_fields: list[dict],
+                 number_of_colour: dict[str, int],
+                 special_fields: list[dict], chance_cards: list[dict]):
+        """Validates and initiates object attributes.
+
+        Raises
+        ------
+        BoardDefinitionError
+            If the data is not consistent.
+        """
+        self._hash = definition_hash
+        self._property_fields = property_fields
+        self._number_of_colour = number_of_colour
+        self._special_fields = special_fields
+        self._chance_cards = chance_cards
+        self.validate()
+
+    def definition_hash(self) -> bytes:
+        """Gets sha256 digest of the contents of the database files."""
+        return self._hash
+
+    def property_fields(self) -> list[dict]:
+        """Gets parsed property fields file."""
+        return self._property_fields
+
+    def number_of_colour(self) -> dict[str, int]:
+        """Gets parsed number of colour file."""
+        return self._number_of_colour
+
+    def special_fields(self) -> list[dict]:
+        """Gets parsed special fields file."""
+        return self._special_fields
+
+    def chance_cards(self) -> list[dict]:
+        """Gets parsed chance cards file."""
+        return self._chance_cards
+
+    def validate(self) -> None:
+        """Checks that the database files describe a consistent board.
+
+        Every record must have the keys read by fields_from_json.
+        Fields must be numbered from 0 without gaps, every index used by
+        exactly one property or special field, numbers of fields
+        of every colour must match number of colour file, card indices
+        must be unique, card actions known and fields cards move to on the
+        board. Runs in linear time.
+
+        Raises
+        ------
+        BoardDefinitionError
+            If any of the conditions is not met.
+        """
+        check_keys(self._property_fields, PROPERTY_FIELD_KEYS,
+                   'Property field')
+        check_keys(self._special_fields, SPECIAL_FIELD_KEYS, 'Special field')
+        check_keys(self._chance_cards, CHANCE_CARD_KEYS, 'Chance card')
+        field_ids = set()
+        colour_counts = {}
+        for field in self._property_fields + self._special_fields:
+            field_id = field['field_id']
+            if field_id in field_ids:
+                raise BoardDefinitionError(
+                    f'Field id {field_id} is repeated')
+            field_ids.add(field_id)
+            if 'colour' in field:
+                colour = field['colour']
+                colour_counts[colour] = colour_counts.get(colour, 0) + 1
+        expected_ids = set(range(len(field_ids)))
+        if field_ids != expected_ids:
+            missing = sorted(expected_ids - field_ids)
+            extra = sorted(field_ids - expected_ids)
+            raise BoardDefinitionError(
+                f'Field ids do not cover the board, missing: {missing}, '
+                f'out of board: {extra}')
+        if colour_counts != self._number_of_colour:
+            raise BoardDefinitionError(
+                f'Colour counts {colour_counts} do not match number of '
+                f'colour file {self._number_of_colour}')
+        card_ids = set()
+        for card in self._chance_cards:
+            if card['card_id'] in card_ids:
+                raise BoardDefinitionError(
+                    f"Card id {card['card_id']} is repeated")
+            card_ids.add(card['card_id'])
+            action = card['action']
+            if action not in chance_action_values():
+                raise BoardDefinitionError(
+                    f"Card {card['card_id']} has unknown action {action}")
+            if action == ChanceFieldAction.MOVE.value:
+                target = card.get('field_id')
+            elif action == ChanceFieldAction.GO_TO_JAIL.value:
+                target = int(GameConstants.JAIL_FIELD_ID)
+            else:
+                continue
+            if target not in field_ids:
+                raise BoardDefinitionError(
+                    f"Card {card['card_id']} moves to field {target} "
+                    f'out of board')
+
+    def build_board(self) -> Board:
+        """Creates new board with fields in their initial state."""
+        return Board(ffjson.property_fields_from_data(self._property_fields),
+                     dict(self._number_of_colour),
+                     ffjson.special_fields_from_data(self._special_fields),
+                     ffjson.chance_cards_from_data(self._chance_cards))
+
+
+def check_keys(records: list[dict], keys: tuple[str], kind: str) -> None:
+    """Checks that every record is a dictionary with all given keys.
+
+    Raises
+    ------
+    BoardDefinitionError
+        If a record is not a dictionary or misses any of the keys.
+    """
+    for index, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise BoardDefinitionError(f'{kind} {index} is not an object')
+        for key in keys:
+            if key not in record:
+                raise BoardDefinitionError(
+                    f'{kind} {index} has no {key}')
+
+
+def read_files(files: tuple[str]) -> list[bytes]:
+    """Reads contents of given files."""
+    contents = []
+    for filename in files:
+        with open(filename, 'rb') as fp:
+            contents.append(fp.read())
+    return contents
+
+
+def definition_hash(contents: list[bytes]) -> bytes:
+    """Gets sha256 digest of the contents of the database files."""
+    digest = sha256()
+    for content in contents:
+        digest.update(content)
+    return digest.digest()
+
+
+def load_board_definition(files: tuple[str] = DATABASE_FILES
+                          ) -> BoardDefinition:
+    """Loads and validates board definition from the database files.
+
+    Definitions are cached by the hash of the files contents, so loading
+    the same board again only reads and hashes the files.
+
+    Parameters
+    ----------
+    files : tuple of str, optional
+        Names of property fields, number of colour, special fields and
+        chance cards files (default are the shipped database files).
+
+    Raises
+    ------
+    BoardDefinitionError
+        If the files are not consistent.
+    """
+    contents = read_files(files)
+    key = definition_hash(contents)
+    if key not in _definitions:
+        property_fields, number_of_colour, special_fields, chance_cards = \
+            [json.loads(content) for content in contents]
+        _definitions[key] = BoardDefinition(
+            key, property_fields, number_of_colour[0],
+            special_fields, chance_cards)
+    return _definitions[key]
+
+
+def load_board(files: tuple[str] = DATABASE_FILES) -> Board:
+    """Creates new board from the database files."""
+    return load_board_definition(files).build_board()
@@ -1,11 +1,19 @@
+from __future__ import annotations
 from enum import Enum
+from classes.game_constants import GameConstants
 from classes.player import Player
+from classes.rent_table import HOTEL_LEVEL
 
 
 class ChanceFieldAction(Enum):
     """Actions available when using chance cards."""
     PAY = 'pay'
     EARN = 'earn'
+    MOVE = 'move'
+    GO_TO_JAIL = 'go to jail'
+    PAY_EACH = 'pay each'
+    COLLECT_EACH = 'collect each'
+    REPAIRS = 'repairs'
 
 
 def chance_action_values():
@@ -17,9 +25,108 @@ class ActionError(Exception):
     pass
 
 
+def _other_players(player: Player, game) -> list[Player]:
+    """Gets players of the game other than player who are not bancrupt.
+
+    Raises
+    ------
+    ActionError
+        If the game is not given.
+    """
+    if game is None:
+        raise ActionError('Action needs the game the card is used in')
+    return [other for other in game.players()
+            if other is not player and not other.is_bancrupt]
+
+
+def _max_field_id(game) -> int:
+    """Gets index of the last field of the game's board."""
+    if game is None:
+        return GameConstants.MAX_FIELD_ID
+    return game.board().max_field_id()
+
+
+def _pay(card: ChanceCard, player: Player, game) -> None:
+    player.spend_money(card._money)
+
+
+def _earn(card: ChanceCard, player: Player, game) -> None:
+    player.earn_money(card._money)
+
+
+def _move(card: ChanceCard, player: Player, game) -> None:
+    if card._field_id < player.current_pawn_position():
+        player.earn_money(int(GameConstants.START_FIELD_BONUS))
+    player.set_position(card._field_id, _max_field_id(game))
+
+
+def _go_to_jail(card: ChanceCard, player: Player, game) -> None:
+    # the game has no jail rules, the card only moves the pawn to the
+    # jail field without the start bonus
+    player.set_position(GameConstants.JAIL_FIELD_ID, _max_field_id(game))
+
+
+def _pay_each(card: ChanceCard, player: Player, game) -> None:
+    for other in _other_players(player, game):
+        player.spend_money(card._money)
+        other.earn_money(card._money)
+
+
+def _collect_each(card: ChanceCard, player: Player, game) -> None:
+    for other in _other_players(player, game):
+        amount = max(0, min(card._money, other.money()))
+        other.spend_money(amount)
+        player.earn_money(amount)
+
+
+def _repairs(card: ChanceCard, player: Player, game) -> None:
+    player.spend_money(_repairs_amount(card, player, game))
+
+
+def _no_amount(card: ChanceCard, player: Player, game) -> int:
+    return 0
+
+
+def _pay_amount(card: ChanceCard, player: Player, game) -> int:
+    return card._money
+
+
+def _pay_each_amount(card: ChanceCard, player: Player, game) -> int:
+    return card._money * len(_other_players(player, game))
+
+
+def _repairs_amount(card: ChanceCard, player: Player, game) -> int:
+    if game is None:
+        raise ActionError('Action needs the game the card is used in')
+    board = game.board()
+    amount = 0
+    for field_id in player.owned_property_fields():
+        level = board.get_field_by_id(field_id).rent_level()
+        if level == HOTEL_LEVEL:
+            amount += card._hotel_cost
+        else:
+            amount += level * card._house_cost
+    return amount
+
+
+_action_functions = {
+    ChanceFieldAction.PAY.value: (_pay, _pay_amount),
+    ChanceFieldAction.EARN.value: (_earn, _no_amount),
+    ChanceFieldAction.MOVE.value: (_move, _no_amount),
+    ChanceFieldAction.GO_TO_JAIL.value: (_go_to_jail, _no_amount),
+    ChanceFieldAction.PAY_EACH.value: (_pay_each, _pay_each_amount),
+    ChanceFieldAction.COLLECT_EACH.value: (_collect_each, _no_amount),
+    ChanceFieldAction.REPAIRS.value: (_repairs, _repairs_amount),
+}
+
+
 class ChanceCard:
     """Chance card that can be randomly selected from chance card in the board.
 
+    Functions performing the action and computing the amount to pay are
+    looked up once when the card is created, so using a card is a single
+    call whatever the number of actions.
+
     Attributes
     ----------
 
@@ -31,14 +138,31 @@ class ChanceCard:
         Type of action that is performed when card is used.
         Available actions are the values od ChanceFieldAction enum.
     _money : int
-        The amount of money that is taken from or given to the player.
+        The amount of money that is taken from or given to the player,
+        or to and from every other player.
+    _field_id : int
+        Index of the field the 'move' action moves the pawn to.
+    _house_cost : int
+        Amount paid for every house in the 'repairs' action.
+    _hotel_cost : int
+        Amount paid for every hotel in the 'repairs' action.
+    _use : callable
+        Function performing the action.
+    _amount : callable
+        Function computing the amount the player pays in the action.
     """
 
+    __slots__ = ('_card_id', '_description', '_action', '_money',
+                 '_field_id', '_house_cost', '_hotel_cost', '_use', '_amount')
+
     def __init__(self,
                  card_id: int,
                  description: str,
                  action: str,
-                 money: int = None):
+                 money: int = None,
+                 field_id: int = None,
+                 house_cost: int = 0,
+                 hotel_cost: int = 0):
         """Initates field attributes
 
         Parameters
@@ -52,18 +176,31 @@ class ChanceCard:
             Available actions are the values od ChanceFieldAction enum.
         money : int, optional
             The amount of money that is taken from or given to the player.
+        field_id : int, optional
+            Index of the field the 'move' action moves the pawn to.
+        house_cost : int, default = 0
+            Amount paid for every house in the 'repairs' action.
+        hotel_cost : int, default = 0
+            Amount paid for every hotel in the 'repairs' action.
 
         Raises
         ------
         ActionError
-            If the action is not in ChanceFieldAction enum values.
+            If the action is not in ChanceFieldAction enum values or the
+            'move' action has no field index.
         """
         self._card_id = card_id
         self._description = description
-        if action not in chance_action_values():
+        if action not in _action_functions:
             raise ActionError("Provided action is ot available")
+        if action == ChanceFieldAction.MOVE.value and field_id is None:
+            raise ActionError("Move action needs field index")
         self._action = action
         self._money = money
+        self._field_id = field_id
+        self._house_cost = house_cost
+        self._hotel_cost = hotel_cost
+        self._use, self._amount = _action_functions[action]
 
     def card_id(self) -> int:
         """Gets card id."""
@@ -81,19 +218,51 @@ class ChanceCard:
         """Gets the amound of money included in card action."""
         return self._money
 
+    def field_id(self) -> int:
+        """Gets index of the field the card moves the pawn to."""
+        return self._field_id
+
     def __str__(self):
         """Gets the card description."""
         return self._description
 
-    def use_card(self, player: Player):
+    def amount_due(self, player: Player, game=None) -> int:
+        """Gets the amount of money the player pays when using the card.
+
+        Parameters
+        ----------
+        player : Player
+            The player who chose the card.
+        game : Game, optional
+            The game the card is used in, needed by actions involving
+            other players or the board.
+
+        Raises
+        ------
+        ActionError
+            If the action needs the game and it is not given.
+        """
+        return self._amount(self, player, game)
+
+    def use_card(self, player: Player, game=None):
         """Performs the cards' action.
 
+        The 'move' action gives the start field bonus if the pawn passes
+        the start field, the field it is moved to is not entered.
+        'collect each' takes from every other player at most the money he
+        has.
+
         Parameters
         ----------
         player : pLayer
             The player who chose teh card.
+        game : Game, optional
+            The game the card is used in, needed by actions involving
+            other players or the board.
+
+        Raises
+        ------
+        ActionError
+            If the action needs the game and it is not given.
         """
-        if self._action == ChanceFieldAction.PAY.value:
-            player.spend_money(self.money())
-        elif self._action == ChanceFieldAction.EARN.value:
-            player.earn_money(self.money())
+        self._use(self, player, game)
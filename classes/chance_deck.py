@@ -0,0 +1,114 @@
+from __future__ import annotations
+from array import array
+from random import Random
+from classes.chance_card import ChanceCard
+
+
+def pass_seed(seed: int, deck_pass: int) -> int:
+    """Gets seed of the order of cards in given pass through the deck."""
+    return (seed << 32) + deck_pass
+
+
+class ChanceDeck:
+    """Deck of chance cards drawn in a seeded, reshuffled order.
+
+    The state of the deck is a single integer, the number of cards drawn
+    so far. Order of cards in every pass through the deck depends only on
+    the seed and the number of the pass, so the deck is reshuffled when it
+    runs out and any position can be restored without replaying draws.
+    Without a seed cards are drawn in the order they were given.
+
+    Attributes
+    ----------
+    _cards : tuple of ChanceCard
+        Cards in the order they were given, shared by copies.
+    _seed : int
+        Seed of the shuffling, None for no shuffling.
+    _position : int
+        Number of cards drawn.
+    _order : array.array
+        Indices of cards in the order of pass _order_pass, shared by
+        copies and never changed in place.
+    _order_pass : int
+        Number of the pass _order belongs to.
+    """
+
+    __slots__ = ('_cards', '_seed', '_position', '_order', '_order_pass')
+
+    def __init__(self, cards: list[ChanceCard], seed: int = None):
+        """Initiates deck of given cards.
+
+        Parameters
+        ----------
+        cards : list of ChanceCard
+            Cards of the deck.
+        seed : int, optional
+            Seed of the shuffling (default is no shuffling).
+        """
+        self._cards = tuple(cards)
+        self._seed = seed
+        self._position = 0
+        self._order = array('I', range(len(self._cards)))
+        self._order_pass = 0 if seed is None else -1
+
+    def __len__(self) -> int:
+        """Gets number of cards in the deck."""
+        return len(self._cards)
+
+    def cards(self) -> tuple[ChanceCard]:
+        """Gets cards in the order they were given."""
+        return self._cards
+
+    def seed(self) -> int:
+        """Gets seed of the shuffling, None if cards are not shuffled."""
+        return self._seed
+
+    def position(self) -> int:
+        """Gets number of cards drawn."""
+        return self._position
+
+    def set_position(self, position: int) -> None:
+        """Sets number of cards drawn, the next card is drawn from there."""
+        self._position = position
+
+    def shuffle(self, seed: int) -> None:
+        """Starts the deck again shuffled with given seed, None for no
+        shuffling."""
+        self._seed = seed
+        self._position = 0
+        self._order = array('I', range(len(self._cards)))
+        self._order_pass = 0 if seed is None else -1
+
+    def _pass_order(self, deck_pass: int) -> array:
+        """Gets indices of cards in the order of given pass."""
+        order = list(range(len(self._cards)))
+        Random(pass_seed(self._seed, deck_pass)).shuffle(order)
+        return array('I', order)
+
+    def draw(self) -> ChanceCard:
+        """Gets the next card.
+
+        Raises
+        ------
+        IndexError
+            If the deck is empty.
+        """
+        cards = self._cards
+        if not cards:
+            raise IndexError('Chance deck is empty')
+        deck_pass, index = divmod(self._position, len(cards))
+        if deck_pass != self._order_pass and self._seed is not None:
+            self._order = self._pass_order(deck_pass)
+            self._order_pass = deck_pass
+        self._position += 1
+        return cards[self._order[index]]
+
+    def copy(self) -> ChanceDeck:
+        """Gets independent deck at the same position sharing the cards."""
+        deck = ChanceDeck.__new__(ChanceDeck)
+        deck._cards = self._cards
+        deck._seed = self._seed
+        deck._position = self._position
+        deck._order = self._order
+        deck._order_pass = self._order_pass
+        return deck
@@ -0,0 +1,137 @@
+from __future__ import annotations
+import numpy as np
+from classes.game_constants import GameConstants
+
+
+def move_pawns(positions: np.ndarray, dice_sums: np.ndarray,
+               max_field_id: int = GameConstants.MAX_FIELD_ID
+               ) -> tuple[np.ndarray, np.ndarray]:
+    """Moves many pawns at once the same way Player.move_pawn does.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        Current positions of the pawns.
+    dice_sums : numpy.ndarray
+        Dice sum of every pawn, same shape as positions.
+    max_field_id : int, optional
+        Index of the last field on the board.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        New positions and flags telling if the pawn passed start field.
+    """
+    new_positions = (positions + dice_sums) % (max_field_id + 1)
+    passed = dice_sums > max_field_id - positions
+    return new_positions, passed
+
+
+class DiceBlock:
+    """Dice rolls for many games drawn in blocks.
+
+    Attributes
+    ----------
+    _rng : numpy.random.Generator
+        Generator the dice are drawn from.
+    _games_num : int
+        Number of games that roll dice at once.
+    _block_size : int
+        Number of rolls per game drawn at once.
+    _block : numpy.ndarray
+        Current block of rolls of shape (block_size, games_num, 2).
+    _next : int
+        Index of next unused roll in the block.
+    """
+
+    def __init__(self, games_num: int, seed: int = None,
+                 block_size: int = 64):
+        """Initiates object attributes.
+
+        Parameters
+        ----------
+        games_num : int
+            Number of games that roll dice at once.
+        seed : int, optional
+            Seed of the generator (default is random seed).
+        block_size : int, default = 64
+            Number of rolls per game drawn at once.
+        """
+        self._rng = np.random.default_rng(seed)
+        self._games_num = games_num
+        self._block_size = block_size
+        self._block = None
+        self._next = block_size
+
+    def roll(self) -> np.ndarray:
+        """Gets next roll of two dice for every game, shape (games_num, 2)."""
+        if self._next == self._block_size:
+            self._block = self._rng.integers(
+                1, 7, size=(self._block_size, self._games_num, 2),
+                dtype=np.int64)
+            self._next = 0
+        dice = self._block[self._next]
+        self._next += 1
+        return dice
+
+
+class BatchMovement:
+    """Pawn positions of many games of the same board advanced together.
+
+    Every step moves pawn of the current player in every game and passes
+    the move to the next player who isn't bancrupt, like
+    Game.move_pawn_number_of_dots followed by Game.change_player.
+
+    Attributes
+    ----------
+    positions : numpy.ndarray
+        Pawn positions of shape (games_num, players_num).
+    passed_start_field : numpy.ndarray
+        Flags of shape (games_num, players_num) set by the last move.
+    bancrupt : numpy.ndarray
+        Flags of shape (games_num, players_num) of bancrupt players.
+    current_player : numpy.ndarray
+        Index of current player in every game.
+    total_moves : numpy.ndarray
+        Total number of moves in every game.
+    _max_field_id : int
+        Index of the last field on the board.
+    """
+
+    def __init__(self, games_num: int, players_num: int,
+                 max_field_id: int = GameConstants.MAX_FIELD_ID):
+        """Puts all pawns on the start field."""
+        shape = (games_num, players_num)
+        self.positions = np.zeros(shape, dtype=np.int64)
+        self.passed_start_field = np.zeros(shape, dtype=bool)
+        self.bancrupt = np.zeros(shape, dtype=bool)
+        self.current_player = np.zeros(games_num, dtype=np.int64)
+        self.total_moves = np.zeros(games_num, dtype=np.int64)
+        self._max_field_id = max_field_id
+        self._games = np.arange(games_num)
+
+    def step(self, dice: np.ndarray) -> None:
+        """Moves current pawns by the dice and changes players.
+
+        Parameters
+        ----------
+        dice : numpy.ndarray
+            Roll of two dice of every game, shape (games_num, 2).
+        """
+        games = self._games
+        current = self.current_player
+        new_positions, passed = move_pawns(
+            self.positions[games, current], dice.sum(axis=1),
+            self._max_field_id)
+        self.positions[games, current] = new_positions
+        self.passed_start_field[games, current] = passed
+        players_num = self.positions.shape[1]
+        current = (current + 1) % players_num
+        skip = self.bancrupt[games, current]
+        for _ in range(players_num - 1):
+            if not skip.any():
+                break
+            current = np.where(skip, (current + 1) % players_num, current)
+            skip = self.bancrupt[games, current]
+        self.current_player = current
+        self.total_moves += 1
@@ -0,0 +1,303 @@
+from __future__ import annotations
+from bisect import bisect_right
+from typing import BinaryIO, Iterator
+import struct
+from classes.game import Game
+from classes.game_events import EventType
+from classes.game_state import GameState
+
+EVENT_FORMAT = struct.Struct('<BBhi')
+LOG_MAGIC = b'MEVL'
+LOG_VERSION = 1
+LOG_HEADER = struct.Struct('<4sHI')
+
+
+class EventLogError(Exception):
+    """Raised when event log data is invalid."""
+    pass
+
+
+class EventLog:
+    """Log of every state transition of a game in fixed-width records.
+
+    Every event takes 8 bytes: event type, index of the player who made
+    it, a field index or value (dice, card index) and an amount of money.
+    Every snapshot_interval events the log keeps a GameState snapshot, so
+    replaying to any event starts from the nearest earlier snapshot.
+
+    Attributes
+    ----------
+    _events : bytearray
+        Encoded events.
+    _snapshot_interval : int
+        Number of events between snapshots.
+    _snapshot_indices : list of int
+        Indices of events the snapshots were taken before.
+    _snapshots : list of GameState
+        Snapshots of the game state.
+    _turn_starts : list of int
+        Index of the first event of every turn.
+    _game : Game
+        Recorded game, None when nothing is being recorded.
+    """
+
+    def __init__(self, snapshot_interval: int = 1024):
+        """Initiates empty log.
+
+        Parameters
+        ----------
+        snapshot_interval : int, default = 1024
+            Number of events between snapshots of the game state.
+        """
+        self._events = bytearray()
+        self._snapshot_interval = snapshot_interval
+        self._snapshot_indices = []
+        self._snapshots = []
+        self._turn_starts = [0]
+        self._game = None
+
+    def attach(self, game: Game) -> None:
+        """Starts recording given game from its current state."""
+        self._game = game
+        self._snapshot_indices.append(len(self))
+        self._snapshots.append(GameState.capture(game))
+        game.set_recorder(self)
+
+    def detach(self) -> None:
+        """Stops recording the game."""
+        if self._game is not None:
+            self._game.set_recorder(None)
+        self._game = None
+
+    def record(self, event_type: EventType, player_index: int,
+               value: int = 0, amount: int = 0) -> None:
+        """Appends event to the log.
+
+        Parameters
+        ----------
+        event_type : EventType
+            Type of the transition.
+        player_index : int
+            Index of the player who made the transition.
+        value : int, default = 0
+            Field index, dice or card index, depending on event type.
+        amount : int, default = 0
+            Amount of money transferred or second dice.
+        """
+        self._events += EVENT_FORMAT.pack(event_type, player_index,
+                                          value, amount)
+        index = len(self)
+        if event_type == EventType.CHANGE_PLAYER:
+            self._turn_starts.append(index)
+        if self._game is not None and index % self._snapshot_interval == 0:
+            self._snapshot_indices.append(index)
+            self._snapshots.append(GameState.capture(self._game))
+
+    def __len__(self) -> int:
+        """Gets number of events in the log."""
+        return len(self._events) // EVENT_FORMAT.size
+
+    def events(self, start: int = 0, stop: int = None
+               ) -> Iterator[tuple[int, int, int, int]]:
+        """Iterates over decoded events from start to stop index."""
+        size = EVENT_FORMAT.size
+        stop = len(self) if stop is None else stop
+        data = memoryview(self._events)[start * size:stop * size]
+        return EVENT_FORMAT.iter_unpack(data)
+
+    def turns_num(self) -> int:
+        """Gets number of turns started in the log."""
+        return len(self._turn_starts)
+
+    def turn_start(self, turn: int) -> int:
+        """Gets index of the first event of given turn."""
+        return self._turn_starts[turn]
+
+    def replay(self, game: Game, stop: int = None) -> None:
+        """Sets the game to the state after the first stop events.
+
+        The game must use the same board definition and players as the
+        recorded game. It is restored from the nearest snapshot taken at
+        or before stop and the following events are applied to it.
+
+        Parameters
+        ----------
+        game : Game
+            Game the state is rebuilt in.
+        stop : int, optional
+            Number of events to replay (default is all events).
+
+        Raises
+        ------
+        EventLogError
+            If there is no snapshot to start from.
+        """
+        stop = len(self) if stop is None else stop
+        position = bisect_right(self._snapshot_indices, stop) - 1
+        if position < 0:
+            raise EventLogError('No snapshot before requested event')
+        start = self._snapshot_indices[position]
+        self._snapshots[position].restore(game)
+        apply_events(game, self.events(start, stop))
+
+    def replay_turn(self, game: Game, turn: int) -> None:
+        """Sets the game to the state at the beginning of given turn."""
+        self.replay(game, self.turn_start(turn))
+
+    def to_bytes(self) -> bytes:
+        """Encodes the events with a versioned header.
+
+        Snapshots are not encoded, a decoded log is replayed from the
+        first snapshot given to from_bytes.
+        """
+        return LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION, len(self)) + \
+            bytes(self._events)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, initial_state: GameState,
+                   snapshot_interval: int = 1024) -> EventLog:
+        """Decodes events encoded with to_bytes.
+
+        Parameters
+        ----------
+        data : bytes
+            Encoded log.
+        initial_state : GameState
+            State of the game before the first event.
+        snapshot_interval : int, default = 1024
+            Number of events between snapshots of the decoded log.
+
+        Raises
+        ------
+        EventLogError
+            If the data is not a valid event log.
+        """
+        if len(data) < LOG_HEADER.size:
+            raise EventLogError('Event log is too short')
+        magic, version, events_num = LOG_HEADER.unpack_from(data)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            raise EventLogError('Unknown event log format')
+        events = data[LOG_HEADER.size:]
+        if len(events) != events_num * EVENT_FORMAT.size:
+            raise EventLogError('Event log is truncated')
+        log = cls(snapshot_interval)
+        log._snapshot_indices.append(0)
+        log._snapshots.append(initial_state)
+        log._events = bytearray(events)
+        for index, event in enumerate(log.events(), start=1):
+            if event[0] == EventType.CHANGE_PLAYER:
+                log._turn_starts.append(index)
+        return log
+
+    def write(self, fp: BinaryIO) -> None:
+        """Writes encoded events to binary file."""
+        fp.write(self.to_bytes())
+
+    def build_snapshots(self, game: Game) -> None:
+        """Replays whole log in given game, taking snapshots on the way.
+
+        Used after from_bytes, so later replays don't start from the
+        first event.
+        """
+        self._snapshots[0].restore(game)
+        snapshot_indices = [0]
+        snapshots = [self._snapshots[0]]
+        for start in range(0, len(self), self._snapshot_interval):
+            stop = min(start + self._snapshot_interval, len(self))
+            apply_events(game, self.events(start, stop))
+            if stop % self._snapshot_interval == 0:
+                snapshot_indices.append(stop)
+                snapshots.append(GameState.capture(game))
+        self._snapshot_indices = snapshot_indices
+        self._snapshots = snapshots
+
+
+def _prepare(game, value, amount):
+    game.prepare_game()
+
+
+def _dice_roll(game, value, amount):
+    game._current_dice_roll = (value, amount)
+
+
+def _move(game, value, amount):
+    game.move_pawn_number_of_dots()
+
+
+def _start_bonus(game, value, amount):
+    game.start_field_bonus()
+
+
+def _buy(game, value, amount):
+    game.buy_current_property()
+
+
+def _pay_rent(game, value, amount):
+    game.pay_rent()
+
+
+def _build_house(game, value, amount):
+    game.build_house(game.get_field_by_id(value))
+
+
+def _build_hotel(game, value, amount):
+    game.build_hotel(game.get_field_by_id(value))
+
+
+def _sell_house(game, value, amount):
+    game.sell_house(game.get_field_by_id(value))
+
+
+def _sell_hotel(game, value, amount):
+    game.sell_hotel(game.get_field_by_id(value))
+
+
+def _mortgage(game, value, amount):
+    game.mortgage(game.get_field_by_id(value))
+
+
+def _lift_mortgage(game, value, amount):
+    game.lift_mortgage(game.get_field_by_id(value))
+
+
+def _draw_chance_card(game, value, amount):
+    game.get_new_chance_card()
+
+
+def _use_chance_card(game, value, amount):
+    card = game.board().get_chance_card_by_id(value)
+    card.use_card(game.current_player(), game)
+
+
+def _change_player(game, value, amount):
+    game.change_player()
+
+
+def _bancrupt(game, value, amount):
+    game.make_bancrupt()
+
+
+def _end_game(game, value, amount):
+    game.end_game()
+
+
+EVENT_HANDLERS = (
+    _prepare, _dice_roll, _move, _start_bonus, _buy, _pay_rent,
+    _build_house, _build_hotel, _sell_house, _sell_hotel, _mortgage,
+    _lift_mortgage, _draw_chance_card, _use_chance_card, _change_player,
+    _bancrupt, _end_game)
+
+
+def apply_events(game: Game, events) -> None:
+    """Applies decoded events to the game with the game's own methods.
+
+    Recording of the game is paused while events are applied.
+    """
+    recorder = game._recorder
+    game.set_recorder(None)
+    handlers = EVENT_HANDLERS
+    try:
+        for event_type, player_index, value, amount in events:
+            handlers[event_type](game, value, amount)
+    finally:
+        game.set_recorder(recorder)
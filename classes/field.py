@@ -1,5 +1,13 @@
 from __future__ import annotations
 from classes.player import Player
+from classes.rent_table import compile_rent_row, rent_index, HOTEL_LEVEL
+from classes.versions import new_version
+from tabulate import tabulate
+
+DESCRIPTION = 'description'
+FULL_DESCRIPTION = 'full_description'
+STEP_ON_DESCRIPTION = 'step_on_description'
+TABLE_FORMAT = 'rounded_grid'
 
 
 class HousesNumError(Exception):
@@ -21,8 +29,15 @@ class Field:
         Field index
     _name : str
         Feild name
+    _version : int
+        State version, changed whenever the description of the field
+        changes.
+    _rendered : dict of str to tuple of int and str
+        Rendered tables of every kind with the version they show.
     """
 
+    __slots__ = ('_field_id', '_name', '_version', '_rendered')
+
     def __init__(self, field_id: int, name: str) -> None:
         """Initates field attributes
 
@@ -35,6 +50,8 @@ class Field:
         """
         self._field_id = field_id
         self._name = name
+        self._version = new_version()
+        self._rendered = {}
 
     def field_id(self) -> int:
         """Gets index of the field."""
@@ -56,6 +73,37 @@ class Field:
         """Gets the descripition in form of table."""
         return [['name', self._name], ['field id', self._field_id]]
 
+    def version(self) -> int:
+        """Gets the state version of the field."""
+        return self._version
+
+    def changed(self) -> None:
+        """Marks that the field has changed, rendered tables are outdated."""
+        self._version = new_version()
+
+    def render(self, kind: str) -> str:
+        """Gets the description table of given kind rendered by tabulate.
+
+        Rendered tables are reused until the field changes, also by
+        forked boards sharing the field.
+
+        Parameters
+        ----------
+        kind : str
+            DESCRIPTION, FULL_DESCRIPTION or STEP_ON_DESCRIPTION.
+
+        Returns
+        -------
+        str
+        """
+        rendered = self._rendered.get(kind)
+        if rendered is not None and rendered[0] == self._version:
+            return rendered[1]
+        text = tabulate(getattr(self, f'{kind}_table')(),
+                        tablefmt=TABLE_FORMAT)
+        self._rendered[kind] = (self._version, text)
+        return text
+
 
 class PropertyField(Field):
     """Class representing property field.
@@ -80,8 +128,13 @@ class PropertyField(Field):
         The amount of money required to buy a property.
     _mortgage : bool
         Is the field mortgaged.
+    _rents : tuple of int
+        Compiled rent schedule, shared by fields with the same rents.
     """
 
+    __slots__ = ('_other_rents', '_colour', '_base_rent', '_owner',
+                 '_current_rent', '_price', '_mortgage', '_rents')
+
     def __init__(self,
                  field_id: int,
                  name: str,
@@ -116,6 +169,7 @@ class PropertyField(Field):
         self._current_rent = base_rent
         self._price = prices["base_price"]
         self._mortgage = False
+        self._rents = compile_rent_row(base_rent)
 
     def is_mortgaged(self):
         """Checks if the field is mortgaged."""
@@ -138,8 +192,19 @@ class PropertyField(Field):
         return self._current_rent
 
     def set_owner(self, new_owner: Player) -> None:
-        """Sets the new owner."""
+        """Sets the new owner and moves the field value to his assets."""
+        value = self.total_value()
+        if self._owner is not None:
+            self._owner.change_assets_value(-value)
         self._owner = new_owner
+        if new_owner is not None:
+            new_owner.change_assets_value(value)
+        self.changed()
+
+    def _value_changed(self, old_value: float) -> None:
+        """Updates assets value of the owner after the field has changed."""
+        if self._owner is not None:
+            self._owner.change_assets_value(self.total_value() - old_value)
 
     def set_current_rent(self, new_rent: int) -> None:
         """Sets the current rent.
@@ -151,10 +216,20 @@ class PropertyField(Field):
         if new_rent < 0 or type(new_rent) is not int:
             raise ValueError('Rent must be positive integer')
         self._current_rent = new_rent
+        self.changed()
 
     def double_rent(self) -> None:
         """Doubles the currnt rent."""
-        self._current_rent = 2 * self._base_rent
+        self._current_rent = self._rents[rent_index(0, False, True)]
+        self.changed()
+
+    def rent_level(self) -> int:
+        """Gets development level of the field used in the rent table."""
+        return 0
+
+    def rent_row(self) -> tuple[int]:
+        """Gets compiled rent schedule of the field."""
+        return self._rents
 
     def price(self) -> int:
         """Gets the price of the property."""
@@ -169,8 +244,14 @@ class PropertyField(Field):
         return 0 if self._mortgage else 0.5 * self._price
 
     def update_rent(self) -> None:
-        """Changes the rent according to the upgrades and mortgages."""
-        self._current_rent = 0 if self._mortgage else self._base_rent
+        """Changes the rent according to the upgrades and mortgages.
+
+        Called after every change of houses, hotel or mortgage, so it also
+        changes the state version.
+        """
+        self._current_rent = self._rents[
+            rent_index(self.rent_level(), self._mortgage, False)]
+        self.changed()
 
     def __str__(self) -> str:
         """Gets the basic description of field attributes."""
@@ -226,8 +307,10 @@ class PropertyField(Field):
             If the field is already mortgaged."""
         if self._mortgage:
             raise MortgageError('Field already mortgaged')
+        old_value = self.total_value()
         self._mortgage = True
         self.update_rent()
+        self._value_changed(old_value)
 
     def lift_mortgage(self) -> None:
         """Set _mortgage flag to False and update the rent.
@@ -238,12 +321,14 @@ class PropertyField(Field):
             If the field is not mortgaged."""
         if not self._mortgage:
             raise MortgageError('Field not mortgaged')
+        old_value = self.total_value()
         self._mortgage = False
         self.update_rent()
+        self._value_changed(old_value)
 
     def return_to_bank(self) -> None:
         """Removes mortgage and owner."""
-        self._owner = None
+        self.set_owner(None)
         if self._mortgage:
             self.lift_mortgage()
         self.update_rent()
@@ -280,6 +365,8 @@ class Street(PropertyField):
         Does the field have hotel on.
     """
 
+    __slots__ = ('_prices', '_houses_num', '_hotel')
+
     def __init__(self,
                  field_id: int,
                  name: str,
@@ -312,6 +399,7 @@ class Street(PropertyField):
         self._current_rent = self._base_rent
         self._houses_num = 0
         self._hotel = False
+        self._rents = compile_rent_row(rent, other_rents, street=True)
 
     def houses_num(self) -> int:
         """Gets the number of houses on the field."""
@@ -330,8 +418,10 @@ class Street(PropertyField):
             If on the field is hotel or the houses number not less than 4."""
         if self._hotel or self._houses_num >= 4:
             raise HousesNumError('There is already 4 houses or hotel on field')
+        old_value = self.total_value()
         self._houses_num += 1
         self.update_rent()
+        self._value_changed(old_value)
 
     def add_hotel(self) -> None:
         """Adds hotel to the field and updates rent.
@@ -343,24 +433,15 @@ class Street(PropertyField):
         if self._hotel or self._houses_num < 4:
             raise HousesNumError(
                 'House is already on field or not enough houses')
+        old_value = self.total_value()
         self._hotel = True
         self._houses_num = 0
         self.update_rent()
+        self._value_changed(old_value)
 
-    def update_rent(self) -> None:
-        """Updates rent accordingly to the current houses and hotels number."""
-        new_rent = self._base_rent
-        if self._houses_num == 1:
-            new_rent = self._other_rents['w_one_house']
-        elif self._houses_num == 2:
-            new_rent = self._other_rents['w_two_houses']
-        elif self._houses_num == 3:
-            new_rent = self._other_rents['w_three_houses']
-        elif self._houses_num == 4:
-            new_rent = self._other_rents['w_four_houses']
-        elif self._hotel:
-            new_rent = self._other_rents['w_hotel']
-        self._current_rent = new_rent
+    def rent_level(self) -> int:
+        """Gets number of houses on the field, or 5 if there is a hotel."""
+        return HOTEL_LEVEL if self._hotel else self._houses_num
 
     def house_cost(self) -> int:
         """Gets the cost of one house."""
@@ -379,8 +460,10 @@ class Street(PropertyField):
             If the houses num is equal to zero or there is a hotel on field."""
         if self._houses_num == 0 or self._hotel:
             raise HousesNumError
+        old_value = self.total_value()
         self._houses_num -= 1
         self.update_rent()
+        self._value_changed(old_value)
 
     def remove_hotel(self) -> None:
         """Removes the hotel from fiel dand updates rent.
@@ -392,9 +475,11 @@ class Street(PropertyField):
         """
         if not self._hotel:
             raise HousesNumError
+        old_value = self.total_value()
         self._hotel = False
         self._houses_num = 4
         self.update_rent()
+        self._value_changed(old_value)
 
     def total_value(self) -> int:
         """Gets the amount of money the field can be sold for.
@@ -457,6 +542,8 @@ class SpecialField(Field):
         Feild name
     """
 
+    __slots__ = ()
+
     def __init__(self, field_id, name):
         """Initates field attributes
 
@@ -3,7 +3,7 @@ from classes.field import PropertyField, Street, SpecialField
 from classes.chance_card import ChanceCard
 
 
-class DoubleFieldIdError:
+class DoubleFieldIdError(Exception):
     """Raised when two fields with the same field id are loaded"""
     pass
 
@@ -37,12 +37,34 @@ def property_fields_from_json(filename: str) -> list[PropertyField]:
     -------
     list of PropertyField type obejcts
     """
-    fields_collection = load_from_file(filename)
+    return property_fields_from_data(load_from_file(filename))
+
+
+def property_fields_from_data(fields_collection: list[dict]
+                              ) -> list[PropertyField]:
+    """Parse property fields from loaded json object.
+
+    Parameters
+    ---------
+    fields_collection : list of dict
+        list of dictionaries containing fields data
+
+    Returns
+    -------
+    list of PropertyField type obejcts
+
+    Raises
+    ------
+    DoubleFieldIdError
+        If two fields have the same field id.
+    """
     fields = []
+    field_ids = set()
     for field_elem in fields_collection:
         field_id = field_elem["field_id"]
-        if field_id in [field.field_id() for field in fields]:
-            raise DoubleFieldIdError
+        if field_id in field_ids:
+            raise DoubleFieldIdError(f'Field id {field_id} is repeated')
+        field_ids.add(field_id)
 
         field_type = field_elem['type']
         colour = field_elem['colour']
@@ -90,12 +112,34 @@ def special_fields_from_json(filename: str) -> list[SpecialField]:
     -------
     list of SpecialField type obejcts
     """
-    fields_collection = load_from_file(filename)
+    return special_fields_from_data(load_from_file(filename))
+
+
+def special_fields_from_data(fields_collection: list[dict]
+                             ) -> list[SpecialField]:
+    """Parse special fields from loaded json object.
+
+    Parameters
+    ---------
+    fields_collection : list of dict
+        list of dictionaries containing fields data
+
+    Returns
+    -------
+    list of SpecialField type obejcts
+
+    Raises
+    ------
+    DoubleFieldIdError
+        If two fields have the same field id.
+    """
     fields = []
+    field_ids = set()
     for field_elem in fields_collection:
         field_id = field_elem['field_id']
-        if field_id in [field.field_id() for field in fields]:
-            raise DoubleFieldIdError
+        if field_id in field_ids:
+            raise DoubleFieldIdError(f'Field id {field_id} is repeated')
+        field_ids.add(field_id)
         field_name = field_elem['name']
         field = SpecialField(field_id, field_name)
         fields.append(field)
@@ -114,15 +158,38 @@ def chance_cards_from_json(filename: str) -> list[ChanceCard]:
     -------
     list of ChanceCard type obejcts
     """
-    cards_collection = load_from_file(filename)
+    return chance_cards_from_data(load_from_file(filename))
+
+
+def chance_cards_from_data(cards_collection: list[dict]) -> list[ChanceCard]:
+    """Parse chance cards from loaded json object.
+
+    Parameters
+    ---------
+    cards_collection : list of dict
+        list of dictionaries containing cards data
+
+    Returns
+    -------
+    list of ChanceCard type obejcts
+
+    Raises
+    ------
+    DoubleFieldIdError
+        If two cards have the same card id.
+    """
     cards = []
+    card_ids = set()
     for card in cards_collection:
         card_id = card['card_id']
-        if card_id in [card.card_id() for card in cards]:
-            raise DoubleFieldIdError
+        if card_id in card_ids:
+            raise DoubleFieldIdError(f'Card id {card_id} is repeated')
+        card_ids.add(card_id)
         description = card['description']
         action = card['action']
-        money = card['money']
-        field = ChanceCard(card_id, description, action, money)
+        money = card.get('money', 0)
+        field = ChanceCard(card_id, description, action, money,
+                           card.get('field_id'), card.get('house_cost', 0),
+                           card.get('hotel_cost', 0))
         cards.append(field)
     return cards
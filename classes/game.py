@@ -1,9 +1,13 @@
-from classes.field import Field, Street
+from __future__ import annotations
+from classes.chance_card import ChanceCard
+from classes.field import Field, PropertyField, Street
+from classes.field import DESCRIPTION, FULL_DESCRIPTION
 from classes.field import HousesNumError, MortgageError
-from random import randint
+from random import Random
+from classes.game_actions import ActionKind, encode_action, decode_action
 from classes.game_constants import GameConstants
+from classes.game_events import EventType
 from classes.player import Player
-from tabulate import tabulate
 
 
 class StartFieldError(Exception):
@@ -11,6 +15,11 @@ class StartFieldError(Exception):
     pass
 
 
+class FortuneError(Exception):
+    """Raised when tracked fortune differs from the recomputed one."""
+    pass
+
+
 class Game:
     """Represents game state.
 
@@ -28,9 +37,17 @@ class Game:
         Total number of all moves in game.
     _win : bool
         Is the game over.
+    _random : random.Random
+        Random number generator used for dice rolls.
+    _recorder : EventLog
+        Event log recording every state transition, None if the game is
+        not recorded.
+    _check_fortunes : bool
+        Should every total fortune be compared with the full
+        recomputation.
     """
 
-    def __init__(self, board, players=None):
+    def __init__(self, board, players=None, seed: int = None):
         """Initiates object atributes.
 
         Parameters
@@ -39,6 +56,11 @@ class Game:
             Board object used in game.
         players : list of Player, optional
             List of players.
+        seed : int, optional
+            Seed of the dice rolls generator and of shuffling the chance
+            deck. Games with the same seed get the same sequence of dice
+            rolls and cards (default is random dice and unshuffled
+            cards).
         """
         self._players = players
         if players is None:
@@ -49,11 +71,67 @@ class Game:
         self._current_dice_roll = None
         self._total_moves = 0
         self._win = False
+        self._random = Random(seed)
+        if seed is not None:
+            board.chance_deck().shuffle(seed)
+        self._recorder = None
+        self._check_fortunes = False
+
+    def fork(self, seed: int = None) -> Game:
+        """Gets independent game continuing from the current state.
+
+        Players are copied and the board is forked, so the fields are
+        shared until one of the games changes them. The new game is not
+        recorded. Field objects taken from this game before forking must
+        be taken again before changing them.
+
+        Parameters
+        ----------
+        seed : int, optional
+            Seed of dice rolls of the new game (default is rolling the
+            same dice as this game would).
+
+        Returns
+        -------
+        Game
+        """
+        game = Game.__new__(Game)
+        game.__dict__.update(self.__dict__)
+        players = [player.copy() for player in self._players]
+        owners = dict(zip(self._players, players))
+        game._players = players
+        game._current_player = owners.get(self._current_player)
+        game._board = self._board.fork(owners)
+        if seed is None:
+            # skips seeding from the system, the state is replaced anyway
+            game._random = Random.__new__(Random)
+            game._random.setstate(self._random.getstate())
+        else:
+            game._random = Random(seed)
+        game._recorder = None
+        return game
 
     def win(self):
         """Get _win."""
         return self._win
 
+    def set_recorder(self, recorder) -> None:
+        """Sets event log recording game transitions, None to stop."""
+        self._recorder = recorder
+
+    def set_fortune_check(self, enabled: bool) -> None:
+        """Turns on or off comparing fortunes with the recomputation.
+
+        Debug mode, every total_fortune call walks the owned fields.
+        """
+        self._check_fortunes = enabled
+
+    def _record(self, event_type: EventType, value: int = 0,
+                amount: int = 0) -> None:
+        """Records the transition made by current player."""
+        self._recorder.record(event_type, self._current_player_index,
+                              value, amount)
+
     def player_is_owner(self, field_id: int = None) -> bool:
         """Checks if current player is owner of field with given field id.
 
@@ -83,6 +161,8 @@ class Game:
         for player in self._players:
             player.set_position(0)
             player.earn_money(int(GameConstants.INITIAL_MONEY_PP))
+        if self._recorder is not None:
+            self._record(EventType.PREPARE)
 
     def add_player(self, player_name: str) -> None:
         """Adds new player to game.
@@ -102,11 +182,29 @@ class Game:
         """Gets name of current player."""
         return self._current_player.name()
 
+    def current_player(self) -> Player:
+        """Gets current player."""
+        return self._current_player
+
+    def current_player_index(self) -> int:
+        """Gets index of current player in players list."""
+        return self._current_player_index
+
+    def players(self) -> list[Player]:
+        """Gets list of all players in the game."""
+        return self._players
+
+    def board(self):
+        """Gets board used in the game."""
+        return self._board
+
     def dice_roll(self) -> None:
         """Generates result of of two dice roll and sets current dice roll."""
-        dice1 = randint(1, 6)
-        dice2 = randint(1, 6)
+        dice1 = self._random.randint(1, 6)
+        dice2 = self._random.randint(1, 6)
         self._current_dice_roll = (dice1, dice2)
+        if self._recorder is not None:
+            self._record(EventType.DICE_ROLL, dice1, dice2)
 
     def current_dice_roll(self) -> tuple[int, int]:
         """Gets current dice roll"""
@@ -119,7 +217,10 @@ class Game:
     def move_pawn_number_of_dots(self) -> None:
         """Moves current player pawn by number of fields indicated by dice."""
         self._current_player.set_dice_roll_sum(self.current_dice_sum())
-        self._current_player.move_pawn()
+        self._current_player.move_pawn(self._board.max_field_id())
+        if self._recorder is not None:
+            self._record(EventType.MOVE,
+                         self._current_player.current_pawn_position())
 
     def current_field(self) -> Field:
         """Gets field that current player is currently on."""
@@ -147,6 +248,8 @@ class Game:
         self._current_player.spend_money(field.price())
         self._current_player.add_property(field.field_id())
         field.set_owner(self._current_player)
+        if self._recorder is not None:
+            self._record(EventType.BUY, field.field_id(), field.price())
 
     def change_player(self) -> None:
         """Set current player to the next plkayer in players array.
@@ -160,6 +263,8 @@ class Game:
             self.change_player()
         else:
             self._total_moves += 1
+            if self._recorder is not None:
+                self._record(EventType.CHANGE_PLAYER)
 
     def get_field_by_id(self, field_id: int) -> Field:
         """Get field object with given field index.
@@ -178,6 +283,9 @@ class Game:
     def owns_all_of_colour(self, field: Field) -> bool:
         """Checks if player owns all fields in the colour of given field.
 
+        The player's owned fields set is the source of truth for
+        ownership.
+
         Parameters
         ----------
         field : Field
@@ -187,14 +295,15 @@ class Game:
         -------
         bool
         """
-        colour = field.colour()
-        owned_in_colour_num = 0
-        for f in self._current_player.owned_property_fields():
-            if self._board.get_field_by_id(f).colour() == colour:
-                owned_in_colour_num += 1
-        return owned_in_colour_num == \
-            self._board.get_max_number_of_same_colour(
-                colour)
+        group_ids = self._board.get_colour_group_ids(field.field_id())
+        if len(group_ids) != self._board.get_max_number_of_same_colour(
+                field.colour()):
+            return False
+        owned = self._current_player.owned_property_fields()
+        for field_id in group_ids:
+            if field_id not in owned:
+                return False
+        return True
 
     def houses_build_evenly(self, field: Field) -> bool:
         """Checks if houses are build evenly if you put house on given field.
@@ -212,10 +321,8 @@ class Game:
         -------
         bool
         """
-        for f in self._board.get_all_fields_of_colour(field.colour()):
-            if field.houses_num() > f.houses_num() and not f.hotel():
-                return False
-        return True
+        min_houses, _, _, _ = self._colour_group_stats(field.colour())
+        return field.houses_num() <= min_houses
 
     def hotels_build_evenly(self, field: Field) -> bool:
         """Checks if hotels are build evenly if you put hotel on given field.
@@ -233,10 +340,226 @@ class Game:
         -------
         bool
         """
-        for f in self._board.get_all_fields_of_colour(field.colour()):
-            if f.houses_num() < 4 and not f.hotel():
-                return False
-        return True
+        _, _, _, ready_for_hotels = self._colour_group_stats(field.colour())
+        return ready_for_hotels
+
+    def _colour_group_stats(self, colour: str
+                            ) -> tuple[int, int, bool, bool]:
+        """Gets development of the streets in the colour group in one pass.
+
+        Returns
+        -------
+        tuple of int, int, bool and bool
+            Minimal number of houses on fields without hotel (4 if every
+            field has a hotel), maximal number of houses, is there a hotel
+            on any field, does every field have 4 houses or a hotel.
+        """
+        min_houses = 4
+        max_houses = 0
+        any_hotel = False
+        ready_for_hotels = True
+        for f in self._board.get_all_fields_of_colour(colour):
+            if f.hotel():
+                any_hotel = True
+                continue
+            houses_num = f.houses_num()
+            if houses_num < min_houses:
+                min_houses = houses_num
+            if houses_num > max_houses:
+                max_houses = houses_num
+            if houses_num < 4:
+                ready_for_hotels = False
+        return min_houses, max_houses, any_hotel, ready_for_hotels
+
+    def _house_rules(self, field: Street, owns_all: bool,
+                     stats: tuple[int, int, bool, bool]
+                     ) -> tuple[bool, bool, bool, bool]:
+        """Checks house and hotel actions on a street of current player.
+
+        Rule code shared by the can_* checks and legal_actions.
+
+        Parameters
+        ----------
+        field : Street
+            Street owned by current player.
+        owns_all : bool
+            Does current player own every field of the colour.
+        stats : tuple
+            Result of _colour_group_stats for the colour of the field.
+
+        Returns
+        -------
+        tuple of bool
+            Can build house, can build hotel, can sell house, can sell
+            hotel.
+        """
+        min_houses, max_houses, any_hotel, ready_for_hotels = stats
+        if field.is_mortgaged():
+            return False, False, False, False
+        if field.hotel():
+            return False, False, False, True
+        houses_num = field.houses_num()
+        money = self._current_player.money()
+        return (owns_all and houses_num < 4 and houses_num <= min_houses
+                and money > field.house_cost(),
+                owns_all and houses_num == 4 and ready_for_hotels
+                and money > field.hotel_cost(),
+                houses_num > 0 and not any_hotel and houses_num >= max_houses,
+                False)
+
+    def can_build_house(self, field: Field) -> bool:
+        """Checks if current player can build a house on given field."""
+        if type(field) is not Street or \
+                not self.player_is_owner(field.field_id()):
+            return False
+        return self._house_rules(
+            field, self.owns_all_of_colour(field),
+            self._colour_group_stats(field.colour()))[0]
+
+    def can_build_hotel(self, field: Field) -> bool:
+        """Checks if current player can build a hotel on given field."""
+        if type(field) is not Street or \
+                not self.player_is_owner(field.field_id()):
+            return False
+        return self._house_rules(
+            field, self.owns_all_of_colour(field),
+            self._colour_group_stats(field.colour()))[1]
+
+    def can_sell_house(self, field: Field) -> bool:
+        """Checks if current player can sell a house from given field."""
+        if type(field) is not Street or \
+                not self.player_is_owner(field.field_id()):
+            return False
+        return self._house_rules(
+            field, False, self._colour_group_stats(field.colour()))[2]
+
+    def can_sell_hotel(self, field: Field) -> bool:
+        """Checks if current player can sell a hotel from given field."""
+        return type(field) is Street and \
+            self.player_is_owner(field.field_id()) and \
+            field.hotel() and not field.is_mortgaged()
+
+    def can_mortgage(self, field: Field) -> bool:
+        """Checks if current player can mortgage given field.
+
+        Fields with houses or a hotel cannot be mortgaged.
+        """
+        return self.player_is_owner(field.field_id()) and \
+            not field.is_mortgaged() and not self.is_house_to_sell(field) \
+            and not (type(field) is Street and field.hotel())
+
+    def lift_mortgage_cost(self, field: PropertyField) -> int:
+        """Gets price of lifting mortgage, mortgage price and 10%."""
+        return int(round(field.mortgage_price() * 1.1))
+
+    def can_lift_mortgage(self, field: Field) -> bool:
+        """Checks if current player can lift mortgage from given field."""
+        return self.player_is_owner(field.field_id()) and \
+            field.is_mortgaged() and \
+            self.can_afford(self.lift_mortgage_cost(field))
+
+    def can_buy_current_property(self) -> bool:
+        """Checks if current player can buy the field he is on."""
+        field = self.current_field()
+        return isinstance(field, PropertyField) and field.owner() is None \
+            and self.can_afford(field.price())
+
+    def legal_actions(self, moved: bool = False) -> list[int]:
+        """Gets codes of every action current player can make now.
+
+        Before the move the player can roll dice or manage his properties,
+        after the move onto a free property he can buy it or pass. Rules
+        are checked once per colour group of the player's fields, so the
+        cost doesn't depend on the size of the board.
+
+        Parameters
+        ----------
+        moved : bool, default = False
+            Has the player already moved in this turn.
+
+        Returns
+        -------
+        list of int
+            Action codes, see game_actions.encode_action.
+        """
+        if moved:
+            if self.can_buy_current_property():
+                return [ActionKind.BUY, ActionKind.PASS]
+            return [ActionKind.PASS]
+        actions = [ActionKind.ROLL]
+        player = self._current_player
+        owned = player.owned_property_fields()
+        if not owned:
+            return actions
+        money = player.money()
+        board = self._board
+        checked_groups = set()
+        for owned_id in owned:
+            group_ids = board.get_colour_group_ids(owned_id)
+            if group_ids[0] in checked_groups:
+                continue
+            checked_groups.add(group_ids[0])
+            group = [board.get_field_by_id(field_id)
+                     for field_id in group_ids if field_id in owned]
+            stats = None
+            if type(group[0]) is Street:
+                colour = group[0].colour()
+                stats = self._colour_group_stats(colour)
+                owns_all = len(group) == len(group_ids) and \
+                    len(group) == board.get_max_number_of_same_colour(colour)
+            for field in group:
+                field_id = field.field_id()
+                if field.is_mortgaged():
+                    if money > self.lift_mortgage_cost(field):
+                        actions.append(encode_action(
+                            ActionKind.LIFT_MORTGAGE, field_id))
+                    continue
+                if stats is None or type(field) is not Street:
+                    actions.append(encode_action(ActionKind.MORTGAGE,
+                                                 field_id))
+                    continue
+                house, hotel, sell_house, sell_hotel = self._house_rules(
+                    field, owns_all, stats)
+                if house:
+                    actions.append(encode_action(ActionKind.BUILD_HOUSE,
+                                                 field_id))
+                if hotel:
+                    actions.append(encode_action(ActionKind.BUILD_HOTEL,
+                                                 field_id))
+                if sell_house:
+                    actions.append(encode_action(ActionKind.SELL_HOUSE,
+                                                 field_id))
+                if sell_hotel:
+                    actions.append(encode_action(ActionKind.SELL_HOTEL,
+                                                 field_id))
+                if self.can_mortgage(field):
+                    actions.append(encode_action(ActionKind.MORTGAGE,
+                                                 field_id))
+        return actions
+
+    def apply_action(self, code: int) -> None:
+        """Makes current player perform the action with given code.
+
+        Rolling dice starts the move, which is played by the caller, e.g.
+        simulation.make_move.
+
+        Raises
+        ------
+        ValueError
+            If the action is ROLL or BUY when the field can't be bought.
+        HousesNumError, MortgageError
+            If the property action is not allowed.
+        """
+        kind, field_id = decode_action(code)
+        if kind == ActionKind.ROLL:
+            raise ValueError('Dice are rolled by the move')
+        if kind == ActionKind.BUY:
+            if not self.can_buy_current_property():
+                raise ValueError('Current field cannot be bought')
+            self.buy_current_property()
+        elif kind != ActionKind.PASS:
+            field = self._board.get_field_by_id(field_id)
+            self._action_methods[kind](self, field)
 
     def is_enough_houses(self, field: Field) -> bool:
         """Checks if given field has 4 houses.
@@ -271,14 +594,12 @@ class Game:
         HousesNumError
             If one of the conditions to build a house is not met.
         """
-        if self.owns_all_of_colour(field) \
-                and self.player_is_owner(field.field_id()) \
-                and self.houses_build_evenly(field) \
-                and not field.hotel() \
-                and self.can_afford(field.house_cost())\
-                and not field.is_mortgaged():
+        if self.can_build_house(field):
             self._current_player.spend_money(field.house_cost())
             field.add_house()
+            if self._recorder is not None:
+                self._record(EventType.BUILD_HOUSE, field.field_id(),
+                             field.house_cost())
         else:
             raise HousesNumError(
                 'Not all conditions to build a house were met')
@@ -302,15 +623,12 @@ class Game:
         HousesNumError
             If one of the conditions to build a house is not met.
         """
-        if self.owns_all_of_colour(field) \
-                and self.player_is_owner(field.field_id()) \
-                and self.hotels_build_evenly(field) \
-                and not field.hotel() \
-                and self.can_afford(field.hotel_cost())\
-                and not field.is_mortgaged()\
-                and self.is_enough_houses(field):
+        if self.can_build_hotel(field):
             self._current_player.spend_money(field.hotel_cost())
             field.add_hotel()
+            if self._recorder is not None:
+                self._record(EventType.BUILD_HOTEL, field.field_id(),
+                             field.hotel_cost())
         else:
             raise HousesNumError(
                 'Not all conditions to build a hotel were met')
@@ -330,10 +648,8 @@ class Game:
         """
         if field.hotel():
             return True
-        for f in self._board.get_all_fields_of_colour(field.colour()):
-            if f.houses_num() > field.houses_num() or f.hotel():
-                return False
-        return True
+        _, max_houses, any_hotel, _ = self._colour_group_stats(field.colour())
+        return not any_hotel and field.houses_num() >= max_houses
 
     def is_house_to_sell(self, field: Field) -> bool:
         """Checks if there is a house you can sell on given field."""
@@ -355,11 +671,12 @@ class Game:
         HousesNumError
             if the conditions to sell the hotel had not been met
         """
-        if field.hotel() and not field.is_mortgaged() \
-                and self.player_is_owner(field.field_id())\
-                and type(field) is Street:
+        if self.can_sell_hotel(field):
             self._current_player.earn_money(field.hotel_cost())
             field.remove_hotel()
+            if self._recorder is not None:
+                self._record(EventType.SELL_HOTEL, field.field_id(),
+                             field.hotel_cost())
         else:
             raise HousesNumError(
                 "No hotel on this field or field is mortgaged")
@@ -380,19 +697,20 @@ class Game:
         HousesNumError
             if the conditions to sell the house had not been met
         """
-        if not field.hotel() and self.houses_removed_evenly(field)\
-                and not field.is_mortgaged() \
-                and self.player_is_owner(field.field_id()):
+        if self.can_sell_house(field):
             self._current_player.earn_money(field.house_cost())
             field.remove_house()
+            if self._recorder is not None:
+                self._record(EventType.SELL_HOUSE, field.field_id(),
+                             field.house_cost())
         else:
             raise HousesNumError("You cannot remove house from this field")
 
     def mortgage(self, field: Field) -> None:
         """Make current player mortgaged current field.
 
-        Check if the field hasn't got any houses on and make current
-        player mortgage given field.
+        Check if the field hasn't got any houses or hotel on and make
+        current player mortgage given field.
 
         Parameters
         ----------
@@ -404,10 +722,12 @@ class Game:
         MortgageError
             if the conditions to mortgage field had not been met
         """
-        if self.player_is_owner(field.field_id()) \
-                and not self.is_house_to_sell(field):
+        if self.can_mortgage(field):
             field.do_mortgage()
             self._current_player.earn_money(field.mortgage_price())
+            if self._recorder is not None:
+                self._record(EventType.MORTGAGE, field.field_id(),
+                             field.mortgage_price())
         else:
             raise MortgageError('You cannot mortgage this field')
 
@@ -428,10 +748,12 @@ class Game:
             If the conditions to lift mortgage from field had not been met.
 
         """
-        amount = int(round(field.mortgage_price() * 1.1))
-        if self.player_is_owner(field.field_id()) and self.can_afford(amount):
+        amount = self.lift_mortgage_cost(field)
+        if self.can_lift_mortgage(field):
             field.lift_mortgage()
             self._current_player.spend_money(amount)
+            if self._recorder is not None:
+                self._record(EventType.LIFT_MORTGAGE, field.field_id(), amount)
         else:
             raise MortgageError('You cannot lift mortgage from this field')
 
@@ -449,6 +771,9 @@ class Game:
         self._current_player.spend_money(rent)
         owner = self.current_field().owner()
         owner.earn_money(rent)
+        if self._recorder is not None:
+            self._record(EventType.PAY_RENT,
+                         self.current_field().field_id(), rent)
 
     def is_win(self) -> bool:
         """Check if the game is over.
@@ -478,9 +803,10 @@ class Game:
         winner = None
         max_fortune = 0
         for player in self._players:
-            if self.total_fortune(player) > max_fortune:
+            fortune = self.total_fortune(player)
+            if fortune > max_fortune:
                 winner = player
-                max_fortune = self.total_fortune(player)
+                max_fortune = fortune
         return winner
 
     def players_description(self) -> str:
@@ -515,18 +841,15 @@ class Game:
         """
         if not player:
             player = self._current_player
-        out_str = str(player)
+        kind = FULL_DESCRIPTION if player is self._current_player \
+            else DESCRIPTION
+        tables = [str(player)]
         for field_id in player.owned_property_fields():
             field = self._board.get_field_by_id(field_id)
             if streets_only and type(field) != Street:
                 continue
-            if player != self._current_player:
-                out_str += '\n' + tabulate(field.description_table(),
-                                           tablefmt='rounded_grid')
-            else:
-                out_str += '\n' + tabulate(field.full_description_table(),
-                                           tablefmt='rounded_grid')
-        return out_str
+            tables.append(field.render(kind))
+        return '\n'.join(tables)
 
     def get_current_field_owner_name(self) -> str:
         """Gets the name of the owner of current field"""
@@ -543,9 +866,34 @@ class Game:
         if self._current_player.passed_start_field is False:
             raise StartFieldError("Player didn't pass start field")
         self._current_player.earn_money(int(GameConstants.START_FIELD_BONUS))
+        if self._recorder is not None:
+            self._record(EventType.START_BONUS, 0,
+                         int(GameConstants.START_FIELD_BONUS))
 
     def total_fortune(self, player: Player = None) -> int:
-        """Gets the sum of money and properties values of given player."""
+        """Gets the sum of money and properties values of given player.
+
+        Value of the properties is kept up to date by the fields, so the
+        fortune is not recomputed.
+
+        Raises
+        ------
+        FortuneError
+            If fortune check is on and the tracked value is wrong.
+        """
+        if player is None:
+            player = self._current_player
+        fortune = player._money + player._assets_value
+        if self._check_fortunes:
+            expected = self.recomputed_fortune(player)
+            if fortune != expected:
+                raise FortuneError(
+                    f'Tracked fortune {fortune} of {player.name()} '
+                    f'differs from recomputed {expected}')
+        return fortune
+
+    def recomputed_fortune(self, player: Player = None) -> int:
+        """Gets total fortune by summing values of all owned fields."""
         if player is None:
             player = self._current_player
         fortune = player._money
@@ -554,24 +902,52 @@ class Game:
             fortune += fld.total_value()
         return fortune
 
+    def update_assets_values(self) -> None:
+        """Recomputes tracked properties values of every player.
+
+        Needed after fields were changed without their methods, e.g.
+        when a saved state is restored.
+        """
+        for player in self._players:
+            player._assets_value = \
+                self.recomputed_fortune(player) - player._money
+
     def end_game(self):
         """Ends game"""
         self._win = True
+        if self._recorder is not None:
+            self._record(EventType.END_GAME)
+
+    def chance_field_action(self, card: ChanceCard = None) -> str:
+        """Use chance card on the current player.
 
-    def chance_field_action(self) -> str:
-        """Get new chance card and use it on the current player.
+        Parameters
+        ----------
+        card : ChanceCard, optional
+            Card drawn with get_new_chance_card (default is a new card
+            drawn from deck).
 
         Returns
         -------
         str
-            Description of the chance card picked from deck."""
-        card = self._board.get_new_chance_card()
-        card.use_card(self._current_player)
-        return str(self._board.current_chance_card)
-
-    def get_new_chance_card(self) -> None:
+            Description of the used chance card."""
+        if card is None:
+            card = self.get_new_chance_card()
+        card.use_card(self._current_player, self)
+        if self._recorder is not None:
+            self._record(EventType.USE_CHANCE_CARD, card.card_id())
+        return str(card)
+
+    def chance_card_amount(self, card: ChanceCard) -> int:
+        """Get amount of money current player pays when using the card."""
+        return card.amount_due(self._current_player, self)
+
+    def get_new_chance_card(self) -> ChanceCard:
         """Get new chance card from the board."""
-        return self._board.get_new_chance_card()
+        card = self._board.get_new_chance_card()
+        if self._recorder is not None:
+            self._record(EventType.DRAW_CHANCE_CARD, card.card_id())
+        return card
 
     def make_bancrupt(self) -> None:
         """Make current player get rid of all of his money and properties."""
@@ -580,4 +956,16 @@ class Game:
             fld.return_to_bank()
         self._current_player._owned_property_fields = set()
         self._current_player._money = 0
+        self._current_player.changed()
         self._current_player.is_bancrupt = True
+        if self._recorder is not None:
+            self._record(EventType.BANCRUPT)
+
+    _action_methods = {
+        ActionKind.BUILD_HOUSE: build_house,
+        ActionKind.BUILD_HOTEL: build_hotel,
+        ActionKind.SELL_HOUSE: sell_house,
+        ActionKind.SELL_HOTEL: sell_hotel,
+        ActionKind.MORTGAGE: mortgage,
+        ActionKind.LIFT_MORTGAGE: lift_mortgage,
+    }
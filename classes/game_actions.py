@@ -0,0 +1,27 @@
+from enum import IntEnum
+
+KIND_BITS = 4
+KIND_MASK = (1 << KIND_BITS) - 1
+
+
+class ActionKind(IntEnum):
+    """Kinds of decisions a player can make, low bits of an action code."""
+    ROLL = 0
+    BUY = 1
+    PASS = 2
+    BUILD_HOUSE = 3
+    BUILD_HOTEL = 4
+    SELL_HOUSE = 5
+    SELL_HOTEL = 6
+    MORTGAGE = 7
+    LIFT_MORTGAGE = 8
+
+
+def encode_action(kind: ActionKind, field_id: int = 0) -> int:
+    """Gets action code of the kind of action on the field."""
+    return (field_id << KIND_BITS) | kind
+
+
+def decode_action(code: int) -> tuple[ActionKind, int]:
+    """Gets kind of action and field index from the action code."""
+    return ActionKind(code & KIND_MASK), code >> KIND_BITS
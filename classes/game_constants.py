@@ -8,3 +8,4 @@ class GameConstants(IntEnum):
     MAX_NUM_OF_ROUNDS = 20
     MAX_PLAYERS_NUM = 4
     START_FIELD_BONUS = 200
+    MAX_NAME_LENGTH = 32
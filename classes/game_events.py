@@ -0,0 +1,22 @@
+from enum import IntEnum
+
+
+class EventType(IntEnum):
+    """Types of game state transitions recorded in the event log."""
+    PREPARE = 0
+    DICE_ROLL = 1
+    MOVE = 2
+    START_BONUS = 3
+    BUY = 4
+    PAY_RENT = 5
+    BUILD_HOUSE = 6
+    BUILD_HOTEL = 7
+    SELL_HOUSE = 8
+    SELL_HOTEL = 9
+    MORTGAGE = 10
+    LIFT_MORTGAGE = 11
+    DRAW_CHANCE_CARD = 12
+    USE_CHANCE_CARD = 13
+    CHANGE_PLAYER = 14
+    BANCRUPT = 15
+    END_GAME = 16
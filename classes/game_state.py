@@ -0,0 +1,157 @@
+from __future__ import annotations
+from array import array
+from classes.field import Street
+from classes.game import Game
+from classes.rent_table import HOTEL_LEVEL
+
+HEADER_SIZE = 6
+FIELD_SIZE = 3
+PLAYER_SIZE = 4
+
+BANCRUPT_FLAG = 1
+PASSED_START_FLAG = 2
+JAIL_FLAG = 4
+
+
+class GameState:
+    """Mutable state of a game stored in one flat array of integers.
+
+    Static data of the board (names, rents, prices, colours) is not
+    stored, only the values that change during the game, so a state
+    takes a few hundred bytes and is copied in microseconds. Random
+    number generator of the game and seed of the chance deck are not part
+    of the state.
+
+    Layout of the array:
+        header: current player index, total moves, win flag, dice 1, dice 2,
+            position of the chance cards deck
+        every property field: owner index (-1 if none), development level
+            (number of houses, 5 for hotel), mortgage flag
+        every player: money, pawn position (-1 if none), dice roll sum
+            (-1 if none), flags (bancrupt, passed start field, in jail)
+
+    Attributes
+    ----------
+    _field_ids : tuple of int
+        Indices of property fields in the order they are stored in.
+    _values : array.array
+        The state values.
+    """
+
+    __slots__ = ('_field_ids', '_values')
+
+    def __init__(self, field_ids: tuple[int], values: array):
+        """Initiates object attributes.
+
+        Parameters
+        ----------
+        field_ids : tuple of int
+            Indices of property fields in the order they are stored in.
+        values : array.array
+            The state values in the layout described in the class.
+        """
+        self._field_ids = field_ids
+        self._values = values
+
+    @classmethod
+    def capture(cls, game: Game) -> GameState:
+        """Gets the current state of given game."""
+        board = game.board()
+        players = game.players()
+        seat = {id(player): index for index, player in enumerate(players)}
+        dice = game.current_dice_roll() or (0, 0)
+        values = [game.current_player_index(), game._total_moves,
+                  int(game.win()), dice[0], dice[1],
+                  board.chance_card_position()]
+        field_ids = board.property_field_ids()
+        for field_id in field_ids:
+            field = board.get_field_by_id(field_id)
+            owner = field.owner()
+            level = 0
+            if type(field) is Street:
+                level = field.rent_level()
+            values += [-1 if owner is None else seat[id(owner)], level,
+                       int(field.is_mortgaged())]
+        for player in players:
+            position = player.current_pawn_position()
+            dice_sum = player.current_dice_roll_sum()
+            flags = BANCRUPT_FLAG * player.is_bancrupt + \
+                PASSED_START_FLAG * player.passed_start_field + \
+                JAIL_FLAG * player.is_in_jail()
+            values += [player.money(),
+                       -1 if position is None else position,
+                       -1 if dice_sum is None else dice_sum,
+                       flags]
+        return cls(field_ids, array('i', values))
+
+    def copy(self) -> GameState:
+        """Gets independent copy of the state."""
+        return GameState(self._field_ids, self._values[:])
+
+    def restore(self, game: Game) -> None:
+        """Sets given game to this state.
+
+        The game must use the same board definition and have the same
+        number of players as the game the state was captured from.
+        """
+        values = self._values
+        board = game.board()
+        players = game.players()
+        game._current_player_index = values[0]
+        game._current_player = players[values[0]]
+        game._total_moves = values[1]
+        game._win = bool(values[2])
+        game._current_dice_roll = None if values[3] == 0 \
+            else (values[3], values[4])
+        if values[5] != board.chance_card_position():
+            board.set_chance_card_position(values[5])
+        owned = [set() for _ in players]
+        index = HEADER_SIZE
+        for field_id in self._field_ids:
+            field = board.get_field_by_id(field_id)
+            owner_index = values[index]
+            field._owner = None if owner_index < 0 else players[owner_index]
+            if owner_index >= 0:
+                owned[owner_index].add(field_id)
+            field._mortgage = bool(values[index + 2])
+            if type(field) is Street:
+                level = values[index + 1]
+                field._hotel = level == HOTEL_LEVEL
+                field._houses_num = 0 if field._hotel else level
+            field.update_rent()
+            index += FIELD_SIZE
+        for player, owned_fields in zip(players, owned):
+            position = values[index + 1]
+            dice_sum = values[index + 2]
+            flags = values[index + 3]
+            player._money = values[index]
+            player._current_pawn_position = None if position < 0 \
+                else position
+            player._current_dice_roll_sum = None if dice_sum < 0 \
+                else dice_sum
+            player.is_bancrupt = bool(flags & BANCRUPT_FLAG)
+            player.passed_start_field = bool(flags & PASSED_START_FLAG)
+            player._is_in_jail = bool(flags & JAIL_FLAG)
+            player._owned_property_fields = owned_fields
+            player.changed()
+            index += PLAYER_SIZE
+        game.update_assets_values()
+
+    def field_ids(self) -> tuple[int]:
+        """Gets indices of property fields in the order they are stored."""
+        return self._field_ids
+
+    def values(self) -> array:
+        """Gets the array of state values."""
+        return self._values
+
+    def nbytes(self) -> int:
+        """Gets size of the state values in bytes."""
+        return len(self._values) * self._values.itemsize
+
+    def __eq__(self, other: object) -> bool:
+        """Checks if both states are equal."""
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return self._field_ids == other._field_ids and \
+            self._values == other._values
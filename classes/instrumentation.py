@@ -0,0 +1,291 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from functools import wraps
+from importlib import import_module
+from time import perf_counter_ns
+from tabulate import tabulate
+
+TURN = 'turn'
+TURN_END = 'classes.game:Game.change_player'
+
+DEFAULT_TARGETS = (
+    'classes.interface:menu_action',
+    'classes.interface:make_move',
+    'classes.interface:make_property_transaction',
+    'classes.interface:pay_rent',
+    'classes.interface:chance_field_action',
+    'classes.interface:make_money_from_properties',
+    'classes.interface:buy_house_hotel',
+    'classes.interface:sell_house_hotel',
+    'classes.interface:show_all_players_status',
+    'classes.interface:show_current_player_status',
+    'classes.interface:computer_turn',
+    'classes.interface:bool_input',
+    'classes.interface:int_input',
+    'classes.field:tabulate',
+    'classes.player:tabulate',
+    'classes.simulation:play_turn',
+    'classes.simulation:make_move',
+    'classes.simulation:make_money_from_properties',
+    'classes.game:Game.dice_roll',
+    'classes.game:Game.move_pawn_number_of_dots',
+    'classes.game:Game.buy_current_property',
+    'classes.game:Game.pay_rent',
+    'classes.game:Game.chance_field_action',
+    'classes.game:Game.build_house',
+    'classes.game:Game.build_hotel',
+    'classes.game:Game.sell_house',
+    'classes.game:Game.sell_hotel',
+    'classes.game:Game.mortgage',
+    'classes.game:Game.lift_mortgage',
+    'classes.game:Game.owns_all_of_colour',
+    'classes.game:Game.can_build_house',
+    'classes.game:Game.can_build_hotel',
+    'classes.game:Game.legal_actions',
+    'classes.game:Game.total_fortune',
+    'classes.game:Game.is_win',
+    'classes.game:Game.show_player_status',
+    'classes.game:Game.players_description',
+    TURN_END,
+)
+
+
+def percentile(values: list[int], fraction: float) -> int:
+    """Gets value below which given fraction of values lie."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def resolve_target(target: str) -> tuple[object, str]:
+    """Gets object owning the target function and the attribute name.
+
+    Parameters
+    ----------
+    target : str
+        Module name and attribute path separated with a colon, for example
+        'classes.game:Game.pay_rent'.
+    """
+    module_name, path = target.split(':')
+    owner = import_module(module_name)
+    *owners, attribute = path.split('.')
+    for name in owners:
+        owner = getattr(owner, name)
+    return owner, attribute
+
+
+class Profiler:
+    """Opt-in timing of game phases split into turns.
+
+    While enabled, the target functions are replaced with wrappers
+    measuring wall time and calls. Disabling puts the original functions
+    back, so a disabled profiler costs nothing. A turn ends when the
+    outermost measured call returns after Game.change_player.
+
+    Attributes
+    ----------
+    _targets : tuple of str
+        Functions measured, see resolve_target.
+    _patched : list of tuple
+        Owner, attribute name and original value of every replaced
+        function, empty when disabled.
+    _stack : list of str
+        Names of measured calls in progress.
+    _children : list of int
+        Time spent in measured calls made by every call in progress.
+    _turn : dict of str to list of int
+        Time and number of calls of every phase in the current turn.
+    _turn_over : bool
+        Has the current player changed in the current turn.
+    _turn_times : dict of str to list of int
+        Time of every phase in every finished turn it was called in.
+    _calls : dict of str to int
+        Number of calls of every phase in finished turns.
+    _folded : dict of tuple of str to int
+        Self time of every stack of measured calls.
+    """
+
+    def __init__(self, targets: tuple[str] = DEFAULT_TARGETS):
+        """Initiates disabled profiler.
+
+        Parameters
+        ----------
+        targets : tuple of str, default = DEFAULT_TARGETS
+            Functions measured, see resolve_target.
+        """
+        self._targets = targets
+        self._patched = []
+        self._stack = []
+        self._children = []
+        self._turn = {}
+        self._turn_over = False
+        self._turn_times = {}
+        self._calls = {}
+        self._folded = {}
+
+    def enabled(self) -> bool:
+        """Checks if the target functions are measured."""
+        return bool(self._patched)
+
+    def enable(self) -> None:
+        """Replaces target functions with measuring wrappers."""
+        if self._patched:
+            return
+        for target in self._targets:
+            owner, attribute = resolve_target(target)
+            original = getattr(owner, attribute)
+            name = target.split(':')[1]
+            self._patched.append(
+                (owner, attribute, vars(owner).get(attribute, original)))
+            setattr(owner, attribute,
+                    self._wrap(name, original, target == TURN_END))
+
+    def disable(self) -> None:
+        """Puts the original functions back."""
+        for owner, attribute, original in reversed(self._patched):
+            setattr(owner, attribute, original)
+        self._patched = []
+
+    def __enter__(self) -> Profiler:
+        """Enables the profiler for the with block."""
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Disables the profiler and closes unfinished turn."""
+        self.disable()
+        self.end_turn()
+
+    def _wrap(self, name: str, function, ends_turn: bool):
+        """Gets wrapper measuring calls of the function."""
+        stack = self._stack
+        children = self._children
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            recursive = name in stack
+            stack.append(name)
+            children.append(0)
+            start = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                self._record(name, elapsed, recursive)
+                if ends_turn:
+                    self._turn_over = True
+                if not stack and self._turn_over:
+                    self.end_turn()
+        return wrapper
+
+    def _record(self, name: str, elapsed: int, recursive: bool) -> None:
+        """Adds time of a finished call of the phase."""
+        stack = self._stack
+        key = tuple(stack)
+        stack.pop()
+        self_time = elapsed - self._children.pop()
+        self._folded[key] = self._folded.get(key, 0) + self_time
+        if self._children:
+            self._children[-1] += elapsed
+        times = self._turn.setdefault(name, [0, 0])
+        if not recursive:
+            times[0] += elapsed
+        times[1] += 1
+        if not stack:
+            times = self._turn.setdefault(TURN, [0, 0])
+            times[0] += elapsed
+            times[1] += 1
+
+    def end_turn(self) -> None:
+        """Adds times of the current turn to the statistics."""
+        for name, (elapsed, calls) in self._turn.items():
+            self._turn_times.setdefault(name, []).append(elapsed)
+            self._calls[name] = self._calls.get(name, 0) + calls
+        self._turn = {}
+        self._turn_over = False
+
+    def turns(self) -> int:
+        """Gets number of finished turns."""
+        return len(self._turn_times.get(TURN, ()))
+
+    def phase_stats(self) -> dict[str, dict]:
+        """Gets statistics of time per turn of every phase.
+
+        Returns
+        -------
+        dict
+            For every phase: number of turns it was called in, number of
+            calls, total, median, 99th percentile and maximal time per
+            turn in microseconds and histogram of times per turn, number
+            of turns in every power of two microseconds bucket.
+        """
+        stats = {}
+        for name, times in self._turn_times.items():
+            histogram = {}
+            for elapsed in times:
+                bucket = 1 << max(0, elapsed // 1000).bit_length()
+                histogram[bucket] = histogram.get(bucket, 0) + 1
+            stats[name] = {
+                'turns': len(times),
+                'calls': self._calls[name],
+                'total_us': sum(times) / 1000,
+                'p50_us': percentile(times, 0.5) / 1000,
+                'p99_us': percentile(times, 0.99) / 1000,
+                'max_us': max(times) / 1000,
+                'histogram_us': dict(sorted(histogram.items()))}
+        return stats
+
+    def report(self) -> str:
+        """Gets table of phase statistics sorted by total time."""
+        stats = self.phase_stats()
+        rows = [(name, phase['turns'], phase['calls'], phase['total_us'],
+                 phase['p50_us'], phase['p99_us'], phase['max_us'])
+                for name, phase in sorted(
+                    stats.items(), key=lambda item: -item[1]['total_us'])]
+        return tabulate(rows, headers=['phase', 'turns', 'calls',
+                                       'total us', 'p50 us/turn',
+                                       'p99 us/turn', 'max us/turn'],
+                        floatfmt='.1f')
+
+    def folded_stacks(self) -> str:
+        """Gets self times of call stacks in folded format.
+
+        Every line is a stack of phases separated with semicolons and
+        self time in microseconds, the input format of flamegraph.pl and
+        speedscope.
+        """
+        return ''.join(f"{';'.join(stack)} {self_time // 1000}\n"
+                       for stack, self_time in sorted(self._folded.items())
+                       if self_time >= 1000)
+
+    def write_folded_stacks(self, filename: str) -> None:
+        """Writes folded_stacks to the file."""
+        with open(filename, 'w') as fp:
+            fp.write(self.folded_stacks())
+
+
+@contextmanager
+def profiled(filename: str = None):
+    """Measures game phases in the with block if filename is given.
+
+    At the end of the block prints the report and writes folded stacks
+    to the file, also when the block exits with an exception.
+
+    Parameters
+    ----------
+    filename : str, optional
+        File for the folded stacks (default is no measuring).
+    """
+    if filename is None:
+        yield None
+        return
+    profiler = Profiler()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.end_turn()
+        print(profiler.report())
+        profiler.write_folded_stacks(filename)
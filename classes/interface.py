@@ -1,12 +1,26 @@
 from classes.game import Game
 from classes.field import PropertyField, SpecialField, Street
+from classes.field import STEP_ON_DESCRIPTION
 from classes.game_constants import GameConstants
-from classes.chance_card import ChanceFieldAction
+from classes.game_actions import ActionKind, decode_action
+from classes.mcts import MCTSPolicy, DEFAULT_MAX_ACTIONS
+from classes.simulation import Policy
+from classes import save_format
+from classes import simulation
 from enum import IntEnum
 import os
 import sys
-import pickle
-from tabulate import tabulate
+
+_computer_policies = {}
+
+ACTION_DESCRIPTIONS = {
+    ActionKind.BUILD_HOUSE: 'builds a house on',
+    ActionKind.BUILD_HOTEL: 'builds a hotel on',
+    ActionKind.SELL_HOUSE: 'sells a house from',
+    ActionKind.SELL_HOTEL: 'sells a hotel from',
+    ActionKind.MORTGAGE: 'mortgages',
+    ActionKind.LIFT_MORTGAGE: 'lifts mortgage from',
+}
 
 
 class MenuOption(IntEnum):
@@ -92,11 +106,18 @@ def play(game: Game, resumed: bool = False) -> None:
     while not game.win():
         game.is_win()
         current_player_info(game)
-        show_menu()
-        menu_option = players_input_menu()
-        menu_action(menu_option, game)
+        policy = computer_policy(game)
+        if policy is not None:
+            computer_turn(game, policy)
+        else:
+            show_menu()
+            menu_option = players_input_menu()
+            menu_action(menu_option, game)
         pause()
     game_over(game)
+    for policy in _computer_policies.values():
+        if isinstance(policy, MCTSPolicy):
+            policy.close()
 
 
 def game_over(game: Game) -> None:
@@ -114,13 +135,66 @@ def pause() -> None:
 
 
 def add_one_player(game: Game, names: list[str]) -> None:
-    """Asks player for the name of the new player and adds him to the game."""
+    """Asks player for the name of the new player and adds him to the game.
+
+    Asks also if the player is a human, other players are controlled by
+    MCTSPolicy using every cpu core.
+    """
     name = word_input()
-    while name in names:
-        print('Players must have unique names. Please enter again.')
+    while name in names or len(name) > GameConstants.MAX_NAME_LENGTH:
+        if name in names:
+            print('Players must have unique names. Please enter again.')
+        else:
+            print('Name can have at most '
+                  f'{GameConstants.MAX_NAME_LENGTH} characters.')
         name = word_input()
     names.append(name)
     game.add_player(name)
+    print('Is it a human player? ([Y]/n)')
+    if not bool_input():
+        set_computer_player(name, MCTSPolicy(workers=None))
+
+
+def set_computer_player(name: str, policy: Policy) -> None:
+    """Makes the policy take decisions of the player with given name.
+
+    Parameters
+    ----------
+    name : str
+        Name of the player.
+    policy : Policy
+        Policy of the player, None makes him a human player again.
+    """
+    if policy is None:
+        _computer_policies.pop(name, None)
+    else:
+        _computer_policies[name] = policy
+
+
+def computer_policy(game: Game) -> Policy:
+    """Gets policy of current player, None if he is a human."""
+    return _computer_policies.get(game.current_player_name())
+
+
+def computer_turn(game: Game, policy: Policy) -> None:
+    """Makes the decisions of computer player before the move and the move.
+
+    Policies choosing actions one by one, like MCTSPolicy, show every
+    action they take.
+    """
+    print('Computer player is thinking...')
+    if not hasattr(policy, 'choose_action'):
+        policy.manage_properties(game)
+    else:
+        for _ in range(DEFAULT_MAX_ACTIONS):
+            action = policy.choose_action(game)
+            if action == ActionKind.ROLL:
+                break
+            kind, field_id = decode_action(action)
+            print(f'{game.current_player_name()} {ACTION_DESCRIPTIONS[kind]} '
+                  f'{game.get_field_by_id(field_id).name()}')
+            game.apply_action(action)
+    make_move(game)
 
 
 def add_players(game: Game) -> None:
@@ -192,8 +266,14 @@ def make_property_transaction(game: Game) -> None:
     if not game.can_afford(game.current_field().price()):
         print('\nUnfortunately you cannot afford this property')
         return
-    print('\nDo you want to buy this property? ([Y]/n)')
-    answer = bool_input()
+    policy = computer_policy(game)
+    if policy is not None:
+        answer = policy.buy_property(game, game.current_field())
+        if not answer:
+            print('\nComputer player does not buy this property')
+    else:
+        print('\nDo you want to buy this property? ([Y]/n)')
+        answer = bool_input()
     if answer:
         game.buy_current_property()
         print(f'You paid {game.current_field().price()} ' +
@@ -215,12 +295,12 @@ def chance_field_action(game: Game) -> None:
     """
     card = game.get_new_chance_card()
     print(card)
-    if card.action() == ChanceFieldAction.PAY.value:
-        if not game.can_afford(card.money()):
-            print('You cannot afford to pay.')
-            if not make_money_from_properties(game, card.money()):
-                return
-    game.chance_field_action()
+    amount = game.chance_card_amount(card)
+    if amount and not game.can_afford(amount):
+        print('You cannot afford to pay.')
+        if not make_money_from_properties(game, amount):
+            return
+    game.chance_field_action(card)
 
 
 def make_move(game: Game) -> None:
@@ -234,9 +314,7 @@ def make_move(game: Game) -> None:
     print(f'\nYour dice roll result: {game.current_dice_roll()}')
     game.move_pawn_number_of_dots()
     field = game.current_field()
-    print('You moved to field :\n' +
-          tabulate(field.step_on_description_table(),
-                   tablefmt='rounded_grid'))
+    print('You moved to field :\n' + field.render(STEP_ON_DESCRIPTION))
     if game._current_player.passed_start_field:
         passing_start_field(game)
     if isinstance(field, PropertyField) and \
@@ -291,6 +369,10 @@ def make_money_from_properties(game: Game, amount: int) -> bool:
     bool
         Indicates if the player got the required amount.
     """
+    policy = computer_policy(game)
+    if policy is not None and game.total_fortune() > amount:
+        print('Computer player sells houses or mortgages properties.')
+        return simulation.make_money_from_properties(game, amount, policy)
     if game.total_fortune() > amount:
         while not game.can_afford(amount):
             print("You must sell some houses or mortgage properties.")
@@ -340,7 +422,7 @@ def street_input(game: Game) -> int:
     f_id = int_input()
     if f_id == 0:
         return 0
-    elif f_id not in range(1, GameConstants.MAX_FIELD_ID + 1):
+    elif f_id not in range(1, game.board().max_field_id() + 1):
         print("Field doesn't exist")
         return 0
     elif not game.player_is_owner(f_id) \
@@ -358,7 +440,7 @@ def property_input(game: Game) -> int:
     f_id = int_input()
     if f_id == 0:
         return 0
-    elif f_id not in range(1, GameConstants.MAX_FIELD_ID + 1):
+    elif f_id not in range(1, game.board().max_field_id() + 1):
         print("Field doesn't exist")
         return 0
     elif not game.player_is_owner(f_id):
@@ -384,7 +466,7 @@ def hotel_building_conditions(game: Game, field: Street) -> bool:
     bool
         indicator if the hotel can be build
     """
-    if not game.can_build_hotel(field):
+    if not game.is_enough_houses(field):
         print('There must be 4 houses on field to build hotel.')
         return False
     if not game.hotels_build_evenly(field):
@@ -607,11 +689,10 @@ def lift_mortgage(game):
 
 
 def save_and_exit(game: Game) -> None:
-    """Asks for the file name and saves the game object to pickle format."""
+    """Asks for the file name and saves the game state to the file."""
     print('Enter the name of file:')
     filename = word_input()
-    with open(filename, 'wb') as pkl:
-        pickle.dump(game, pkl)
+    save_format.save_game(game, filename)
     sys.exit(f'GAME SAVED TO {filename}')
 
 
@@ -665,22 +746,16 @@ def show_menu():
 
 
 def load_game(filename: str) -> None:
-    """Load game object from pickle file,
+    """Load game state from file saved with save_and_exit and play it.
 
     Parameters
     ----------
     filename : str
-        name of the pickle file with teh game object
-
-    Raises:
-    TypeError
-        when loaded object is not Game instance.
+        name of the file with the saved game
     """
     try:
-        with open(filename, 'rb') as pkl:
-            game = pickle.load(pkl)
-        if type(game) is not Game:
-            raise TypeError('Type of loaded object is not Game')
-        play(game, resumed=True)
-    except FileNotFoundError as e:
+        game = save_format.load_game(filename)
+    except (FileNotFoundError, save_format.SaveFormatError) as e:
         print(e)
+        return
+    play(game, resumed=True)
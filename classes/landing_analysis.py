@@ -0,0 +1,130 @@
+from __future__ import annotations
+import numpy as np
+from classes.board import Board
+from classes.game_constants import GameConstants
+from classes.rent_table import LEVELS_NUM
+
+GO_TO_JAIL = 'go to jail'
+
+
+def dice_sum_probabilities() -> dict[int, float]:
+    """Gets probability of every sum of two dice."""
+    return {dice_sum: (6 - abs(dice_sum - 7)) / 36
+            for dice_sum in range(2, 13)}
+
+
+def transition_matrix(board: Board, max_field_id: int = None,
+                      jail_field_id: int = GameConstants.JAIL_FIELD_ID
+                      ) -> np.ndarray:
+    """Gets probabilities of moving between fields in one roll.
+
+    Pawn moves by the sum of two dice and wraps around after the last
+    field. Landing on a 'go to jail' field sends the pawn to the jail.
+
+    Parameters
+    ----------
+    board : Board
+        The analysed board.
+    max_field_id : int, optional
+        Index of the last field on the board (default is
+        Board.max_field_id).
+    jail_field_id : int, optional
+        Index of the field pawns are sent to from 'go to jail' field.
+
+    Returns
+    -------
+    numpy.ndarray
+        Matrix where element [i, j] is probability of moving from field i
+        to field j.
+    """
+    if max_field_id is None:
+        max_field_id = board.max_field_id()
+    fields_num = max_field_id + 1
+    destination = np.arange(fields_num)
+    for field in board.special_fields():
+        if field.name() == GO_TO_JAIL:
+            destination[field.field_id()] = jail_field_id
+    matrix = np.zeros((fields_num, fields_num))
+    origins = np.arange(fields_num)
+    for dice_sum, probability in dice_sum_probabilities().items():
+        targets = destination[(origins + dice_sum) % fields_num]
+        np.add.at(matrix, (origins, targets), probability)
+    return matrix
+
+
+def stationary_distribution(matrix: np.ndarray) -> np.ndarray:
+    """Gets long run probability of a pawn ending a roll on every field.
+
+    Solves pi P = pi with probabilities summing up to one. It is also the
+    probability of landing on every field in a single roll.
+    """
+    fields_num = matrix.shape[0]
+    equations = matrix.T - np.eye(fields_num)
+    equations[-1, :] = 1
+    right_side = np.zeros(fields_num)
+    right_side[-1] = 1
+    return np.linalg.solve(equations, right_side)
+
+
+class LandingAnalysis:
+    """Landing probabilities and expected rents of a board.
+
+    Attributes
+    ----------
+    _board : Board
+        The analysed board.
+    _landing : numpy.ndarray
+        Probability of landing on every field in one roll.
+    _expected_rents : numpy.ndarray
+        Expected rent per roll of shape (fields number, levels number).
+    """
+
+    def __init__(self, board: Board, max_field_id: int = None,
+                 jail_field_id: int = GameConstants.JAIL_FIELD_ID):
+        """Analyses given board.
+
+        Parameters
+        ----------
+        board : Board
+            The analysed board.
+        max_field_id : int, optional
+            Index of the last field on the board (default is
+            Board.max_field_id).
+        jail_field_id : int, optional
+            Index of the field pawns are sent to from 'go to jail' field.
+        """
+        self._board = board
+        if max_field_id is None:
+            max_field_id = board.max_field_id()
+        matrix = transition_matrix(board, max_field_id, jail_field_id)
+        self._landing = stationary_distribution(matrix)
+        rents = np.zeros((max_field_id + 1, LEVELS_NUM))
+        table = board.rent_table()
+        for field_id in board.property_field_ids():
+            rents[field_id] = [table.rent(field_id, level)
+                               for level in range(LEVELS_NUM)]
+        self._expected_rents = rents * self._landing[:, np.newaxis]
+
+    def landing_probability(self, field_id: int) -> float:
+        """Gets probability of landing on the field in one roll."""
+        return float(self._landing[field_id])
+
+    def landing_probabilities(self) -> np.ndarray:
+        """Gets probability of landing on every field in one roll."""
+        return self._landing
+
+    def expected_rent(self, field_id: int, level: int = 0) -> float:
+        """Gets expected rent of the field per roll of one player.
+
+        Parameters
+        ----------
+        field_id : int
+            Index of the property field.
+        level : int, default = 0
+            Development level, number of houses or 5 for a hotel.
+        """
+        return float(self._expected_rents[field_id, level])
+
+    def expected_rents(self) -> np.ndarray:
+        """Gets expected rents of shape (fields number, levels number)."""
+        return self._expected_rents
@@ -0,0 +1,312 @@
+from __future__ import annotations
+from collections import deque
+from typing import NamedTuple
+from classes.board import ColourError
+from classes.field import PropertyField, Street
+from classes.field import HousesNumError, MortgageError
+from classes.game import Game
+from classes.game_events import EventType
+from classes.game_state import GameState
+from classes.rent_table import HOTEL_LEVEL, rent_index
+
+_group_options = {}
+
+
+class LiquidationPlan(NamedTuple):
+    """Sequence of actions raising money for a debt.
+
+    Plans are compared by net_loss, then rent_loss, then the number of
+    actions.
+
+    Attributes
+    ----------
+    actions : tuple of tuple of EventType and int
+        SELL_HOTEL, SELL_HOUSE or MORTGAGE with field index, in an order
+        allowed by the game rules.
+    cash : int
+        Money the actions raise.
+    net_loss : float
+        Decrease of total fortune of the player.
+    rent_loss : int
+        Decrease of the sum of current rents of the player's fields.
+    """
+    actions: tuple
+    cash: int
+    net_loss: float
+    rent_loss: int
+
+    def cost(self) -> tuple[float, int, int]:
+        """Gets the value minimised by the planner."""
+        return (self.net_loss, self.rent_loss, len(self.actions))
+
+
+def field_value(field: PropertyField, level: int, mortgaged: bool) -> float:
+    """Gets total_value the field would have in given state."""
+    if mortgaged:
+        return 0
+    value = 0.5 * field.price()
+    if type(field) is not Street:
+        return value
+    if level == HOTEL_LEVEL:
+        value += field.hotel_cost()
+    elif level > 0:
+        value += level * field.house_cost()
+    return value
+
+
+def field_state(field: PropertyField) -> tuple[int, bool]:
+    """Gets development level and mortgage flag of the field."""
+    return field.rent_level(), field.is_mortgaged()
+
+
+def group_moves(fields: tuple[PropertyField], owned: tuple[bool],
+                state: tuple[tuple[int, bool]]):
+    """Generates actions allowed in given state of a colour group.
+
+    Mirrors the conditions of Game.sell_hotel, Game.sell_house and
+    Game.mortgage, houses must be removed evenly and only fields without
+    houses or hotel can be mortgaged.
+
+    Yields
+    ------
+    tuple of EventType, int, int and tuple
+        Action, index of the field in the group, money raised and the
+        state after the action.
+    """
+    any_hotel = any(level == HOTEL_LEVEL for level, _ in state)
+    for index, field in enumerate(fields):
+        if not owned[index]:
+            continue
+        level, mortgaged = state[index]
+        if mortgaged:
+            continue
+        street = type(field) is Street
+        if street and level == HOTEL_LEVEL:
+            yield (EventType.SELL_HOTEL, index, field.hotel_cost(),
+                   state[:index] + ((4, False),) + state[index + 1:])
+        elif street and level > 0 and not any_hotel and \
+                all(other <= level for other, _ in state):
+            yield (EventType.SELL_HOUSE, index, field.house_cost(),
+                   state[:index] + ((level - 1, False),) +
+                   state[index + 1:])
+        if level == 0:
+            yield (EventType.MORTGAGE, index, field.mortgage_price(),
+                   state[:index] + ((level, True),) + state[index + 1:])
+
+
+def pareto_options(options: list[tuple]) -> list[tuple]:
+    """Keeps only options not dominated by one raising more for less.
+
+    Options are tuples of cash, cost and further data.
+    """
+    options = sorted(options, key=lambda option: (-option[0], option[1]))
+    kept = []
+    for option in options:
+        if not kept or option[1] < kept[-1][1]:
+            kept.append(option)
+    return kept
+
+
+def group_options(fields: tuple[PropertyField], owned: tuple[bool]
+                  ) -> list[tuple]:
+    """Gets every useful way of raising money from one colour group.
+
+    Explores all states reachable with legal actions breadth first, so
+    every state is reached with the fewest actions. Results are cached
+    by the static data and the state of the fields.
+
+    Returns
+    -------
+    list of tuple
+        Pareto optimal options as tuples of cash, cost (net loss, rent
+        loss, number of actions) and actions with indices of fields in
+        the group.
+    """
+    start = tuple(field_state(field) for field in fields)
+    # rent rows are interned, so equal schedules have the same id
+    key = (tuple((id(field.rent_row()), field.price(),
+                  field.mortgage_price(), type(field) is Street and
+                  (field.house_cost(), field.hotel_cost()))
+                 for field in fields), owned, start)
+    options = _group_options.get(key)
+    if options is not None:
+        return options
+    values = [[[field_value(field, level, mortgaged)
+                for mortgaged in (False, True)]
+               for level in range(HOTEL_LEVEL + 1)] for field in fields]
+    rents = [field.rent_row() for field in fields]
+    start_value = sum(values[i][level][mortgaged]
+                      for i, (level, mortgaged) in enumerate(start))
+    start_rent = sum(rents[i][rent_index(level, mortgaged, False)]
+                     for i, (level, mortgaged) in enumerate(start))
+    reached = {start: (0, ())}
+    queue = deque([start])
+    while queue:
+        state = queue.popleft()
+        cash, actions = reached[state]
+        for action, index, amount, new_state in group_moves(
+                fields, owned, state):
+            if new_state not in reached:
+                reached[new_state] = (cash + amount,
+                                      actions + ((action, index),))
+                queue.append(new_state)
+    options = []
+    for state, (cash, actions) in reached.items():
+        value = sum(values[i][level][mortgaged]
+                    for i, (level, mortgaged) in enumerate(state))
+        rent = sum(rents[i][rent_index(level, mortgaged, False)]
+                   for i, (level, mortgaged) in enumerate(state))
+        cost = (start_value - value - cash, start_rent - rent, len(actions))
+        options.append((cash, cost, actions))
+    options = pareto_options(options)
+    _group_options[key] = options
+    return options
+
+
+def liquidation_units(game: Game) -> list[tuple[tuple[PropertyField],
+                                                tuple[bool]]]:
+    """Splits fields of current player into independent groups.
+
+    Colour groups with buildings are planned together, because houses
+    must be sold evenly. Other fields can only be mortgaged, each of them
+    is a separate group.
+    """
+    player = game.current_player()
+    board = game.board()
+    units = []
+    planned_colours = set()
+    for field_id in sorted(player.owned_property_fields()):
+        field = board.get_field_by_id(field_id)
+        if type(field) is Street:
+            colour = field.colour()
+            if colour in planned_colours:
+                continue
+            group = board.get_all_fields_of_colour(colour)
+            if any(f.rent_level() > 0 for f in group):
+                planned_colours.add(colour)
+                units.append((group, tuple(f.owner() is player
+                                           for f in group)))
+                continue
+        if not field.is_mortgaged():
+            units.append(((field,), (True,)))
+    return units
+
+
+def plan_liquidation(game: Game, amount: int) -> LiquidationPlan:
+    """Finds the least costly way for current player to afford amount.
+
+    Every group of fields is solved exactly on its own, then options of
+    all groups are combined keeping for each amount of raised money only
+    the cheapest combination.
+
+    Parameters
+    ----------
+    game : Game
+        game object representing game state.
+    amount : int
+        Debt the player must be able to pay, Game.can_afford(amount) is
+        True after executing the plan.
+
+    Returns
+    -------
+    LiquidationPlan
+        The plan, None if selling everything is not enough.
+    """
+    needed = amount + 1 - game.current_player().money()
+    if needed <= 0:
+        return LiquidationPlan((), 0, 0, 0)
+    frontier = [(0, (0, 0, 0), 0, None)]
+    for fields, owned in liquidation_units(game):
+        options = group_options(fields, owned)
+        new_frontier = list(frontier)
+        for capped, cost, cash, chosen in frontier:
+            for option_cash, option_cost, actions in options:
+                if actions:
+                    new_frontier.append((
+                        min(needed, capped + option_cash),
+                        (cost[0] + option_cost[0],
+                         cost[1] + option_cost[1],
+                         cost[2] + option_cost[2]),
+                        cash + option_cash,
+                        (fields, actions, chosen)))
+        frontier = pareto_options(new_frontier)
+    if frontier[0][0] < needed:
+        return None
+    _, (net_loss, rent_loss, _), cash, chosen = frontier[0]
+    groups = []
+    while chosen is not None:
+        fields, actions, chosen = chosen
+        groups.append(tuple((action, fields[index].field_id())
+                            for action, index in actions))
+    actions = tuple(action for ids in reversed(groups) for action in ids)
+    return LiquidationPlan(actions, cash, net_loss, rent_loss)
+
+
+def execute_plan(game: Game, plan: LiquidationPlan) -> None:
+    """Makes current player perform the actions of the plan."""
+    for action, field_id in plan.actions:
+        field = game.get_field_by_id(field_id)
+        if action == EventType.SELL_HOTEL:
+            game.sell_hotel(field)
+        elif action == EventType.SELL_HOUSE:
+            game.sell_house(field)
+        else:
+            game.mortgage(field)
+
+
+def rents_sum(game: Game) -> int:
+    """Gets sum of current rents of current player's fields."""
+    return sum(game.get_field_by_id(field_id).current_rent()
+               for field_id in game.current_player().owned_property_fields())
+
+
+def brute_force_plan(game: Game, amount: int) -> LiquidationPlan:
+    """Reference planner trying every sequence of actions on the game.
+
+    Runs the actions with Game methods, so it checks the rules itself,
+    and restores the game at the end. Exponential, meant for tests.
+
+    Returns
+    -------
+    LiquidationPlan
+        The least costly plan, None if no plan raises enough.
+    """
+    initial = GameState.capture(game)
+    start_money = game.current_player().money()
+    start_fortune = game.recomputed_fortune()
+    start_rent = rents_sum(game)
+    actions_on = (
+        (EventType.SELL_HOTEL, game.sell_hotel),
+        (EventType.SELL_HOUSE, game.sell_house),
+        (EventType.MORTGAGE, game.mortgage))
+    seen = {tuple(initial.values()): ()}
+    queue = deque([(initial, ())])
+    best = None
+    while queue:
+        state, actions = queue.popleft()
+        state.restore(game)
+        if game.can_afford(amount):
+            plan = LiquidationPlan(
+                actions, game.current_player().money() - start_money,
+                start_fortune - game.recomputed_fortune(),
+                start_rent - rents_sum(game))
+            if best is None or plan.cost() < best.cost():
+                best = plan
+        for field_id in sorted(game.current_player().owned_property_fields()):
+            field = game.get_field_by_id(field_id)
+            for action, method in actions_on:
+                if action != EventType.MORTGAGE and type(field) is not Street:
+                    continue
+                state.restore(game)
+                try:
+                    method(field)
+                except (HousesNumError, MortgageError, ColourError):
+                    continue
+                new_state = GameState.capture(game)
+                key = tuple(new_state.values())
+                if key not in seen:
+                    seen[key] = actions
+                    queue.append((new_state,
+                                  actions + ((action, field_id),)))
+    initial.restore(game)
+    return best
@@ -0,0 +1,127 @@
+from __future__ import annotations
+from array import array
+from time import perf_counter
+import argparse
+import asyncio
+from classes.server import GameServer, DEFAULT_HOST, DEFAULT_PORT
+
+ANSWERS = {b'MENU': b'ROLL\n', b'BUY': b'yes\n', b'RAISE': b'AUTO\n'}
+
+
+def percentile(values: array, fraction: float) -> float:
+    """Gets value below which given fraction of values lie."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index]
+
+
+async def simulated_player(host: str, port: int, table: str, name: str,
+                           players_num: int, round_trips: array) -> str:
+    """Joins the table and answers every question like the base Policy.
+
+    Round trip is the time from sending an answer to receiving the next
+    line, the server always replies to an answer immediately.
+
+    Returns
+    -------
+    str
+        Name of the winner, None if the game didn't end.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f'JOIN {table} {name} {players_num}\n'.encode('utf-8'))
+    sent_at = None
+    winner = None
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        if sent_at is not None:
+            round_trips.append(perf_counter() - sent_at)
+            sent_at = None
+        if line.startswith(b'ASK '):
+            writer.write(ANSWERS[line.split()[1]])
+            sent_at = perf_counter()
+        elif line.startswith(b'END '):
+            winner = line[4:].decode('utf-8').strip()
+    writer.close()
+    return winner
+
+
+async def run_load_test(tables_num: int, players_num: int = 2,
+                        host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+                        ) -> tuple[list[str], array]:
+    """Plays tables_num games at once with simulated players.
+
+    Every player opens its own connection, so the number of open files
+    allowed by the system limits the number of tables.
+
+    Returns
+    -------
+    tuple of list of str and array.array
+        Winner of every table and round trip times of all answers.
+    """
+    round_trips = array('d')
+    players = [simulated_player(host, port, f'table{table}',
+                                f'player{seat}', players_num, round_trips)
+               for table in range(tables_num)
+               for seat in range(players_num)]
+    names = await asyncio.gather(*players)
+    return names[::players_num], round_trips
+
+
+async def local_load_test(tables_num: int, players_num: int
+                          ) -> tuple[list[str], array, array]:
+    """Starts server in this process and runs the load test against it.
+
+    Returns
+    -------
+    tuple of list of str, array.array and array.array
+        Winners, round trip times and server latencies.
+    """
+    server = GameServer(players_num)
+    await server.start(DEFAULT_HOST, 0)
+    try:
+        winners, round_trips = await run_load_test(
+            tables_num, players_num, DEFAULT_HOST, server.port())
+    finally:
+        server.close()
+    return winners, round_trips, server.latencies()
+
+
+def print_latencies(title: str, values: array) -> None:
+    """Prints median, 99th percentile and maximum in milliseconds."""
+    print(f'{title}: p50 {percentile(values, 0.5) * 1000:.3f} ms, '
+          f'p99 {percentile(values, 0.99) * 1000:.3f} ms, '
+          f'max {max(values, default=0) * 1000:.3f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--tables', type=int, default=100)
+    parser.add_argument('--players', type=int, default=2)
+    parser.add_argument('--local', action='store_true',
+                        help="start the server in this process")
+    args = parser.parse_args()
+    start = perf_counter()
+    if args.local:
+        winners, round_trips, latencies = asyncio.run(
+            local_load_test(args.tables, args.players))
+    else:
+        winners, round_trips = asyncio.run(run_load_test(
+            args.tables, args.players, args.host, args.port))
+        latencies = None
+    duration = perf_counter() - start
+    finished = sum(winner is not None for winner in winners)
+    print(f'{finished}/{args.tables} games finished in {duration:.2f} s, '
+          f'{len(round_trips) / duration:.0f} answers/s')
+    print_latencies('Round trip', round_trips)
+    if latencies is not None:
+        print_latencies('Server latency', latencies)
+
+
+if __name__ == "__main__":
+    main()
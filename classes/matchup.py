@@ -0,0 +1,452 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from math import sqrt
+from statistics import NormalDist
+from typing import Callable
+import argparse
+import os
+from tabulate import tabulate
+from classes.board import Board
+from classes.board_image import ImageBoardFactory, board_image_file
+from classes.simulation import Policy, PassivePolicy, BuilderPolicy
+from classes.simulation import PlannerPolicy
+from classes.tournament import GameResult, default_board, game_seed
+from classes.tournament import play_seeded_game
+
+DEFAULT_Z = 2.576
+DEFAULT_ALPHA = 0.01
+DEFAULT_MAX_GAMES = 10000
+DEFAULT_MIN_GAMES = 200
+DEFAULT_BATCH_SIZE = 64
+
+POLICIES = {
+    'base': Policy,
+    'passive': PassivePolicy,
+    'builder': BuilderPolicy,
+    'planner': PlannerPolicy,
+}
+
+
+def wilson_interval(successes: int, trials: int, z: float = DEFAULT_Z
+                    ) -> tuple[float, float]:
+    """Gets Wilson score confidence interval of a proportion.
+
+    Unlike the normal approximation it stays inside [0, 1] and works for
+    proportions close to 0 or 1 and small numbers of trials.
+
+    Parameters
+    ----------
+    successes : int
+        Number of successes.
+    trials : int
+        Number of trials, the interval is (0, 1) if it is 0.
+    z : float, default = DEFAULT_Z
+        Quantile of the normal distribution, 1.96 for 95% confidence.
+
+    Returns
+    -------
+    tuple of float
+        Lower and upper bound of the interval.
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    share = successes / trials
+    z2 = z * z
+    centre = share + z2 / (2 * trials)
+    spread = z * sqrt(share * (1 - share) / trials + z2 / (4 * trials ** 2))
+    denominator = 1 + z2 / trials
+    return (max(0.0, (centre - spread) / denominator),
+            min(1.0, (centre + spread) / denominator))
+
+
+def looks_num(games_num: int, batch_games: int, min_games: int) -> int:
+    """Gets number of batches after which stopping is considered.
+
+    Parameters
+    ----------
+    games_num : int
+        Planned number of games.
+    batch_games : int
+        Number of games in a batch, the last batch may be smaller.
+    min_games : int
+        Number of games played before stopping is considered.
+    """
+    ends = list(range(batch_games, games_num, batch_games)) + [games_num]
+    return max(1, sum(1 for end in ends if end >= min_games))
+
+
+def stopping_z(alpha: float, looks: int, strategies_num: int) -> float:
+    """Gets normal quantile of the sequential stopping rule.
+
+    The error is spent evenly over the planned looks and over the ordered
+    pairs of strategies, because the leader and the runner-up are picked
+    after seeing the data. By the union bound the probability that
+    strategies of equal strength are ever called different is at most
+    alpha, however the looks are correlated. The bound is conservative,
+    the real error rate is lower.
+
+    Parameters
+    ----------
+    alpha : float
+        Probability of a false significant result of the whole matchup.
+    looks : int
+        Number of times the statistics are checked.
+    strategies_num : int
+        Number of compared strategies.
+    """
+    pairs = strategies_num * (strategies_num - 1)
+    return NormalDist().inv_cdf(1 - alpha / (pairs * looks))
+
+
+def rotated_policies(policies: list[Policy], rotation: int) -> list[Policy]:
+    """Gets policies in seat order of given rotation.
+
+    In rotation r strategy i sits at seat (i - r) mod n, so over all
+    rotations every strategy plays from every seat.
+    """
+    players_num = len(policies)
+    return [policies[(seat + rotation) % players_num]
+            for seat in range(players_num)]
+
+
+def play_rotated_batch(seeds: list[int], policies: list[Policy],
+                       board_factory: Callable[[], Board] = default_board
+                       ) -> list[GameResult]:
+    """Plays every seed once in every seat rotation.
+
+    Games with the same seed get the same dice, so the rotations differ
+    only by the seats of the strategies, which cancels most of the luck.
+
+    Returns
+    -------
+    list of GameResult
+        Results with winner and fortunes indexed by strategy instead of
+        seat.
+    """
+    players_num = len(policies)
+    results = []
+    for seed in seeds:
+        for rotation in range(players_num):
+            result = play_seeded_game(
+                seed, rotated_policies(policies, rotation), board_factory)
+            winner = None if result.winner is None \
+                else (result.winner + rotation) % players_num
+            fortunes = [0] * players_num
+            for seat, fortune in enumerate(result.fortunes):
+                fortunes[(seat + rotation) % players_num] = fortune
+            results.append(GameResult(seed, winner, result.rounds,
+                                      tuple(fortunes)))
+    return results
+
+
+class MatchupStats:
+    """Statistics of strategies playing against each other.
+
+    Attributes
+    ----------
+    _names : tuple of str
+        Name of every strategy.
+    _games : int
+        Number of games played.
+    _wins : list of int
+        Number of wins of every strategy.
+    _no_winner : int
+        Number of games without a winner.
+    _rounds_sum : int
+        Sum of rounds of all games.
+    _fortunes_sum : list of float
+        Sum of final fortunes of every strategy.
+    _stopped_early : bool
+        Did the matchup end before the game limit.
+    _stopping_z : float
+        Normal quantile of the stopping rule, see stopping_z.
+    """
+
+    def __init__(self, names: tuple[str], stopping_z: float = DEFAULT_Z):
+        """Initiates empty statistics of strategies with given names.
+
+        Parameters
+        ----------
+        names : tuple of str
+            Name of every strategy.
+        stopping_z : float, default = DEFAULT_Z
+            Normal quantile used by is_significant.
+        """
+        self._names = tuple(names)
+        self._stopping_z = stopping_z
+        self._games = 0
+        self._wins = [0] * len(names)
+        self._no_winner = 0
+        self._rounds_sum = 0
+        self._fortunes_sum = [0] * len(names)
+        self._stopped_early = False
+
+    def add(self, result: GameResult) -> None:
+        """Adds result of one game with winner indexed by strategy."""
+        self._games += 1
+        if result.winner is None:
+            self._no_winner += 1
+        else:
+            self._wins[result.winner] += 1
+        self._rounds_sum += result.rounds
+        for strategy, fortune in enumerate(result.fortunes):
+            self._fortunes_sum[strategy] += fortune
+
+    def names(self) -> tuple[str]:
+        """Gets names of the strategies."""
+        return self._names
+
+    def games(self) -> int:
+        """Gets number of games."""
+        return self._games
+
+    def wins(self) -> list[int]:
+        """Gets number of wins of every strategy."""
+        return self._wins
+
+    def no_winner(self) -> int:
+        """Gets number of games without a winner."""
+        return self._no_winner
+
+    def stopped_early(self) -> bool:
+        """Checks if the matchup ended because the result was significant.
+        """
+        return self._stopped_early
+
+    def stopping_z(self) -> float:
+        """Gets normal quantile of the stopping rule."""
+        return self._stopping_z
+
+    def mark_stopped_early(self) -> None:
+        """Records that the matchup ended before the game limit."""
+        self._stopped_early = True
+
+    def win_rates(self) -> list[float]:
+        """Gets fraction of games won by every strategy."""
+        return [wins / self._games for wins in self._wins]
+
+    def win_rate_intervals(self, z: float = DEFAULT_Z
+                           ) -> list[tuple[float, float]]:
+        """Gets Wilson confidence interval of win rate of every strategy."""
+        return [wilson_interval(wins, self._games, z) for wins in self._wins]
+
+    def mean_rounds(self) -> float:
+        """Gets mean number of rounds in a game."""
+        return self._rounds_sum / self._games
+
+    def mean_fortunes(self) -> list[float]:
+        """Gets mean final fortune of every strategy."""
+        return [fortune / self._games for fortune in self._fortunes_sum]
+
+    def leaders(self) -> tuple[int, int]:
+        """Gets indices of the strategies with the most and second most wins.
+        """
+        order = sorted(range(len(self._wins)),
+                       key=lambda strategy: -self._wins[strategy])
+        return order[0], order[1]
+
+    def leader_share_interval(self, z: float = DEFAULT_Z
+                              ) -> tuple[float, float]:
+        """Gets confidence interval of the leader's share of games won by
+        the leader or the runner-up.
+
+        Sign test of the two best strategies, games won by others and games
+        without a winner are left out.
+        """
+        best, second = self.leaders()
+        return wilson_interval(self._wins[best],
+                               self._wins[best] + self._wins[second], z)
+
+    def is_significant(self, z: float = None) -> bool:
+        """Checks if the leader wins more often than the runner-up.
+
+        True when the confidence interval of the leader's share of their
+        decisive games lies above one half.
+
+        Parameters
+        ----------
+        z : float, optional
+            Normal quantile of the interval (default is the quantile of
+            the stopping rule).
+        """
+        if z is None:
+            z = self._stopping_z
+        return self.leader_share_interval(z)[0] > 0.5
+
+    def table(self, z: float = DEFAULT_Z) -> str:
+        """Gets table of wins, win rates with intervals and mean fortunes."""
+        rows = []
+        rates = self.win_rates()
+        intervals = self.win_rate_intervals(z)
+        fortunes = self.mean_fortunes()
+        for strategy, name in enumerate(self._names):
+            low, high = intervals[strategy]
+            rows.append((name, self._wins[strategy], self._games,
+                         rates[strategy], low, high, fortunes[strategy]))
+        return tabulate(rows, headers=['strategy', 'wins', 'games',
+                                       'win rate', 'low', 'high',
+                                       'mean fortune'],
+                        floatfmt='.3f')
+
+
+def run_matchup(policies: list[Policy], names: list[str] = None,
+                max_games: int = DEFAULT_MAX_GAMES,
+                min_games: int = DEFAULT_MIN_GAMES,
+                alpha: float = DEFAULT_ALPHA, base_seed: int = 0,
+                workers: int = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                board_factory: Callable[[], Board] = default_board
+                ) -> MatchupStats:
+    """Plays seat rotated games of the strategies until the result is clear.
+
+    Every seed is played once in every seat rotation. Batches of
+    batch_size seeds are played by worker processes, a few batches ahead,
+    and added to the statistics in seed order. After every batch the
+    matchup stops if at least min_games were played and the leader is
+    significantly better than the runner-up, so the outcome does not
+    depend on number of workers. The statistics are checked after every
+    batch, so a fixed 99% quantile would call equal strategies different
+    in about 10% of matchups. The quantile is raised instead to spend
+    alpha over all planned looks, see stopping_z.
+
+    Parameters
+    ----------
+    policies : list of Policy
+        Compared strategies, one player each. Policies and board_factory
+        must be picklable.
+    names : list of str, optional
+        Names of the strategies (default is class names).
+    max_games : int, default = DEFAULT_MAX_GAMES
+        Maximal number of games counting every rotation, rounded up to
+        a multiple of number of strategies.
+    min_games : int, default = DEFAULT_MIN_GAMES
+        Number of games played before stopping is considered.
+    alpha : float, default = DEFAULT_ALPHA
+        Bound of the probability that the matchup calls strategies of
+        equal strength different.
+    base_seed : int, default = 0
+        Seed of the whole matchup, see tournament.game_seed.
+    workers : int, optional
+        Number of worker processes (default is number of cpu cores).
+        With one worker games are played in the current process.
+    batch_size : int, default = DEFAULT_BATCH_SIZE
+        Number of seeds sent to a worker at once.
+    board_factory : callable, optional
+        Function creating new board (default is the shipped board).
+
+    Returns
+    -------
+    MatchupStats
+
+    Raises
+    ------
+    ValueError
+        If there are less than two strategies.
+    """
+    if len(policies) < 2:
+        raise ValueError('Matchup needs at least two strategies')
+    if names is None:
+        names = [type(policy).__name__ for policy in policies]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    rotations = len(policies)
+    seeds_num = -(-max_games // rotations)
+    batches = [[game_seed(base_seed, index)
+                for index in range(start, min(start + batch_size,
+                                              seeds_num))]
+               for start in range(0, seeds_num, batch_size)]
+    batch_games = batch_size * rotations
+    stats = MatchupStats(names, stopping_z(
+        alpha, looks_num(seeds_num * rotations, batch_games, min_games),
+        rotations))
+
+    def add_batch(results: list[GameResult]) -> bool:
+        for result in results:
+            stats.add(result)
+        if stats.games() >= min_games and stats.is_significant():
+            if stats.games() < seeds_num * rotations:
+                stats.mark_stopped_early()
+            return True
+        return False
+
+    if workers == 1:
+        for batch in batches:
+            if add_batch(play_rotated_batch(batch, policies, board_factory)):
+                break
+        return stats
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        next_batch = 0
+        for index in range(len(batches)):
+            while next_batch < len(batches) and \
+                    next_batch < index + 2 * workers:
+                futures.append(executor.submit(
+                    play_rotated_batch, batches[next_batch], policies,
+                    board_factory))
+                next_batch += 1
+            if add_batch(futures[index].result()):
+                for future in futures[index + 1:]:
+                    future.cancel()
+                break
+    return stats
+
+
+def round_robin(policies: dict[str, Policy], **options
+                ) -> dict[tuple[str, str], MatchupStats]:
+    """Plays a matchup of every pair of strategies.
+
+    Parameters
+    ----------
+    policies : dict of str to Policy
+        Strategies by name.
+    **options
+        Other keyword arguments of run_matchup.
+
+    Returns
+    -------
+    dict of tuple of str to MatchupStats
+        Statistics of every pair of names.
+    """
+    return {(first, second): run_matchup(
+                [policies[first], policies[second]], [first, second],
+                **options)
+            for first, second in combinations(policies, 2)}
+
+
+def main() -> None:
+    """Compares strategies given on command line and prints the results."""
+    parser = argparse.ArgumentParser(
+        description='Compares strategies in seat rotated headless games.')
+    parser.add_argument('strategies', nargs='+', choices=list(POLICIES),
+                        help='strategies of the players')
+    parser.add_argument('--max-games', type=int, default=DEFAULT_MAX_GAMES)
+    parser.add_argument('--min-games', type=int, default=DEFAULT_MIN_GAMES)
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA,
+                        help='probability of a false significant result')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--round-robin', action='store_true',
+                        help='play every pair of strategies separately')
+    args = parser.parse_args()
+    options = {'max_games': args.max_games, 'min_games': args.min_games,
+               'alpha': args.alpha, 'base_seed': args.seed,
+               'workers': args.workers,
+               'board_factory': ImageBoardFactory(board_image_file())}
+    if args.round_robin:
+        matchups = round_robin({name: POLICIES[name]()
+                                for name in args.strategies}, **options)
+        all_stats = list(matchups.values())
+    else:
+        all_stats = [run_matchup([POLICIES[name]()
+                                  for name in args.strategies],
+                                 args.strategies, **options)]
+    for stats in all_stats:
+        verdict = 'significant' if stats.is_significant() \
+            else 'not significant'
+        print(f'\n{" vs ".join(stats.names())}: {verdict} after '
+              f'{stats.games()} games')
+        print(stats.table())
+
+
+if __name__ == '__main__':
+    main()
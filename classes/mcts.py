@@ -0,0 +1,357 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from math import log, sqrt
+from random import Random
+from time import perf_counter
+import os
+import pickle
+from classes.field import PropertyField
+from classes.game import Game
+from classes.game_actions import ActionKind
+from classes.game_state import GameState
+from classes.simulation import Policy, PlannerPolicy, BuilderPolicy
+from classes import simulation
+
+DEFAULT_TIME_BUDGET = 1.0
+DEFAULT_EXPLORATION = sqrt(2)
+DEFAULT_ROLLOUT_ROUNDS = 10
+DEFAULT_MAX_ACTIONS = 6
+
+FINAL_ACTIONS = (ActionKind.ROLL, ActionKind.BUY, ActionKind.PASS)
+
+
+class SearchNode:
+    """Node of the search tree, a decision point of the searching player.
+
+    Children are reached with actions of the player before he rolls dice
+    or decides about buying a field. Node reached with ROLL, BUY or PASS
+    is a leaf, what happens next depends on dice and is sampled by
+    rollouts.
+
+    Attributes
+    ----------
+    _untried : list of int
+        Legal actions without a child node yet, None for a leaf.
+    _children : dict
+        Child node reached with every tried action code.
+    _visits : int
+        Number of rollouts that passed through the node.
+    _value : float
+        Sum of rewards of those rollouts.
+    """
+
+    __slots__ = ('_untried', '_children', '_visits', '_value')
+
+    def __init__(self, actions: list[int] = None):
+        """Initiates node with given legal actions, leaf if None."""
+        self._untried = actions
+        self._children = {}
+        self._visits = 0
+        self._value = 0.0
+
+    def is_leaf(self) -> bool:
+        """Checks if the node ends the decisions of the player."""
+        return self._untried is None
+
+    def visits(self) -> int:
+        """Gets number of rollouts that passed through the node."""
+        return self._visits
+
+    def value(self) -> float:
+        """Gets sum of rewards of the rollouts."""
+        return self._value
+
+    def children(self) -> dict[int, SearchNode]:
+        """Gets dictionary assigning child nodes to action codes."""
+        return self._children
+
+    def update(self, reward: float) -> None:
+        """Adds reward of one rollout."""
+        self._visits += 1
+        self._value += reward
+
+    def select_child(self, exploration: float) -> tuple[int, SearchNode]:
+        """Gets action and child with the highest upper confidence bound."""
+        log_visits = log(self._visits)
+        best = None
+        best_bound = -1.0
+        for action, child in self._children.items():
+            bound = child._value / child._visits + \
+                exploration * sqrt(log_visits / child._visits)
+            if bound > best_bound:
+                best = action, child
+                best_bound = bound
+        return best
+
+
+def fortune_share(game: Game, player) -> float:
+    """Gets reward of the player, his part of fortunes of all players.
+
+    Bancrupt player gets 0 and the last player left gets 1.
+    """
+    if player.is_bancrupt:
+        return 0.0
+    total = 0
+    for other in game.players():
+        if not other.is_bancrupt:
+            total += game.total_fortune(other)
+    if total <= 0:
+        return 0.0
+    return game.total_fortune(player) / total
+
+
+def rollout(game: Game, policies: list[Policy], rounds: int) -> None:
+    """Plays the game further for given number of rounds at most."""
+    for _ in range(rounds * len(game.players())):
+        if game.is_win():
+            return
+        simulation.play_turn(game, policies)
+
+
+def finish_decision(game: Game, action: int, policy: Policy) -> None:
+    """Plays the rest of the turn after one of FINAL_ACTIONS."""
+    if action == ActionKind.ROLL:
+        simulation.make_move(game, policy)
+        return
+    if action == ActionKind.BUY:
+        game.buy_current_property()
+    game.change_player()
+
+
+def search(game: Game, moved: bool, iterations: int = None,
+           time_budget: float = DEFAULT_TIME_BUDGET, seed: int = None,
+           exploration: float = DEFAULT_EXPLORATION,
+           rollout_rounds: int = DEFAULT_ROLLOUT_ROUNDS,
+           max_actions: int = DEFAULT_MAX_ACTIONS,
+           rollout_policy: Policy = None) -> dict[int, tuple[int, float]]:
+    """Runs Monte Carlo Tree Search from the decision of current player.
+
+    Every iteration restores the game from a GameState snapshot, walks
+    down the tree choosing actions with the highest upper confidence
+    bound, adds one new node and plays a rollout from it. The game, its
+    random number generator and recorder are restored at the end.
+
+    Parameters
+    ----------
+    game : Game
+        game object representing game state.
+    moved : bool
+        True when the player decides about buying the field he is on,
+        False when he manages properties before rolling dice.
+    iterations : int, optional
+        Maximal number of rollouts (default is no limit).
+    time_budget : float, default = DEFAULT_TIME_BUDGET
+        Maximal time of the search in seconds, None for no limit.
+    seed : int, optional
+        Seed of dice rolled in rollouts.
+    exploration : float, default = DEFAULT_EXPLORATION
+        Weight of exploration in the upper confidence bound.
+    rollout_rounds : int, default = DEFAULT_ROLLOUT_ROUNDS
+        Number of rounds played in every rollout.
+    max_actions : int, default = DEFAULT_MAX_ACTIONS
+        Maximal number of management actions in one turn.
+    rollout_policy : Policy, optional
+        Policy of every player in rollouts (default is BuilderPolicy).
+
+    Returns
+    -------
+    dict
+        Number of visits and sum of rewards of every action of the root.
+
+    Raises
+    ------
+    ValueError
+        If neither iterations nor time_budget limits the search.
+    """
+    if iterations is None and time_budget is None:
+        raise ValueError('Search must be limited by iterations or time')
+    if rollout_policy is None:
+        rollout_policy = BuilderPolicy()
+    policies = [rollout_policy] * len(game.players())
+    player = game.current_player()
+    start = GameState.capture(game)
+    game_random = game._random
+    recorder = game._recorder
+    game._random = Random(seed)
+    game._recorder = None
+    root = SearchNode(game.legal_actions(moved))
+    deadline = None if time_budget is None else perf_counter() + time_budget
+    done = 0
+    try:
+        while (iterations is None or done < iterations) and \
+                (deadline is None or perf_counter() < deadline):
+            start.restore(game)
+            node = root
+            path = [root]
+            depth = 0
+            while not node.is_leaf():
+                if node._untried:
+                    untried = node._untried
+                    action = untried.pop(game._random.randrange(
+                        len(untried)))
+                    child = None
+                else:
+                    action, child = node.select_child(exploration)
+                if action in FINAL_ACTIONS:
+                    finish_decision(game, action, rollout_policy)
+                    if child is None:
+                        child = SearchNode()
+                else:
+                    game.apply_action(action)
+                    depth += 1
+                    if child is None:
+                        child = SearchNode(
+                            game.legal_actions() if depth < max_actions
+                            else [ActionKind.ROLL])
+                node._children.setdefault(action, child)
+                node = child
+                path.append(node)
+                if child._visits == 0:
+                    break
+            rollout(game, policies, rollout_rounds)
+            reward = fortune_share(game, player)
+            for visited in path:
+                visited.update(reward)
+            done += 1
+    finally:
+        start.restore(game)
+        game._random = game_random
+        game._recorder = recorder
+    return {action: (child.visits(), child.value())
+            for action, child in root.children().items()}
+
+
+def search_copy(data: bytes, moved: bool, iterations: int,
+                time_budget: float, seed: int, options: dict
+                ) -> dict[int, tuple[int, float]]:
+    """Runs search on a pickled copy of the game, used by worker processes.
+    """
+    return search(pickle.loads(data), moved, iterations, time_budget, seed,
+                  **options)
+
+
+def best_action(statistics: list[dict[int, tuple[int, float]]]) -> int:
+    """Gets the most visited action of all searches of the same decision.
+
+    Ties are broken by the higher mean reward.
+    """
+    visits = {}
+    values = {}
+    for stats in statistics:
+        for action, (action_visits, value) in stats.items():
+            visits[action] = visits.get(action, 0) + action_visits
+            values[action] = values.get(action, 0) + value
+    return max(sorted(visits), key=lambda action: (
+        visits[action], values[action] / max(visits[action], 1)))
+
+
+class MCTSPolicy(PlannerPolicy):
+    """Policy deciding about buying, building and mortgaging by search.
+
+    Decisions are made with Monte Carlo Tree Search. With more than one
+    worker every worker process searches its own tree for the whole time
+    budget (root parallelisation) and visits of root actions are summed.
+    Debts are paid with the liquidation planner.
+
+    Attributes
+    ----------
+    _time_budget : float
+        Time of one decision in seconds, None for no limit.
+    _iterations : int
+        Number of rollouts of one decision in one worker, None for no
+        limit.
+    _workers : int
+        Number of searching processes.
+    _options : dict
+        Other keyword arguments of search.
+    _random : random.Random
+        Generator of seeds of searches.
+    _executor : ProcessPoolExecutor
+        Worker processes, created on first parallel search.
+    """
+
+    def __init__(self, time_budget: float = DEFAULT_TIME_BUDGET,
+                 iterations: int = None, workers: int = 1,
+                 seed: int = None, **options):
+        """Initiates object attributes.
+
+        Parameters
+        ----------
+        time_budget : float, default = DEFAULT_TIME_BUDGET
+            Time of one decision in seconds, None for no limit.
+        iterations : int, optional
+            Number of rollouts of one decision in one worker (default is
+            no limit).
+        workers : int, default = 1
+            Number of searching processes, None for number of cpu cores.
+        seed : int, optional
+            Seed of the searches, fixed seed with iterations limit and one
+            worker gives repeatable decisions.
+        **options
+            exploration, rollout_rounds, max_actions or rollout_policy
+            passed to search.
+        """
+        if time_budget is None and iterations is None:
+            raise ValueError('Search must be limited by iterations or time')
+        self._time_budget = time_budget
+        self._iterations = iterations
+        self._workers = workers or os.cpu_count() or 1
+        self._options = options
+        self._random = Random(seed)
+        self._executor = None
+
+    def __getstate__(self) -> dict:
+        """Gets state for pickling, without the worker processes."""
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+
+    def choose_action(self, game: Game, moved: bool = False) -> int:
+        """Gets the best action code of current player.
+
+        Parameters
+        ----------
+        game : Game
+            game object representing game state.
+        moved : bool, default = False
+            True for the decision about buying the current field.
+        """
+        actions = game.legal_actions(moved)
+        if len(actions) == 1:
+            return actions[0]
+        seeds = [self._random.getrandbits(32) for _ in range(self._workers)]
+        if self._workers == 1:
+            return best_action([search(
+                game, moved, self._iterations, self._time_budget, seeds[0],
+                **self._options)])
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        recorder = game._recorder
+        game._recorder = None
+        try:
+            data = pickle.dumps(game)
+        finally:
+            game._recorder = recorder
+        futures = [self._executor.submit(
+            search_copy, data, moved, self._iterations, self._time_budget,
+            seed, self._options) for seed in seeds]
+        return best_action([future.result() for future in futures])
+
+    def buy_property(self, game: Game, field: PropertyField) -> bool:
+        """Buys the field if buying is the best action found."""
+        return self.choose_action(game, moved=True) == ActionKind.BUY
+
+    def manage_properties(self, game: Game) -> None:
+        """Performs the best actions found until rolling dice is best."""
+        max_actions = self._options.get('max_actions', DEFAULT_MAX_ACTIONS)
+        for _ in range(max_actions):
+            action = self.choose_action(game)
+            if action == ActionKind.ROLL:
+                return
+            game.apply_action(action)
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -1,4 +1,6 @@
+from __future__ import annotations
 from classes.game_constants import GameConstants
+from classes.versions import new_version
 from tabulate import tabulate
 from typing import Set
 
@@ -35,12 +37,24 @@ class Player:
         amount of money owned by player
     _current_pawnPosition : int
         index of field the player is currently on
+    _assets_value : float
+        amount of money the fields owned by player can be sold for, kept
+        up to date by the fields
     pased_start_field
         has theplayer passed start field in last move
     is_bancrupt
         is player bancrupt
+    _version : int
+        state version, changed whenever money or position changes
+    _rendered : tuple of int and str
+        player's table rendered by __str__ and the version it shows
     """
 
+    __slots__ = ('_name', '_owned_property_fields', '_current_dice_roll_sum',
+                 '_is_in_jail', '_money', '_current_pawn_position',
+                 '_assets_value', 'passed_start_field', 'is_bancrupt',
+                 '_version', '_rendered')
+
     def __init__(self, name: str = None) -> None:
         """Initiates object atributes.
 
@@ -57,8 +71,11 @@ class Player:
         self._is_in_jail = False
         self._money = 0
         self._current_pawn_position = None
+        self._assets_value = 0
         self.passed_start_field = False
         self.is_bancrupt = False
+        self._version = new_version()
+        self._rendered = None
 
     def name(self) -> str:
         """Get player's name."""
@@ -90,32 +107,57 @@ class Player:
         """
         self._current_dice_roll_sum = dice_sum
 
-    def move_pawn(self) -> None:
-        """Change player's position by the current dice sum."""
+    def move_pawn(self,
+                  max_field_id: int = GameConstants.MAX_FIELD_ID) -> None:
+        """Change player's position by the current dice sum.
+
+        Parameters
+        ----------
+        max_field_id : int, optional
+            Index of the last field on the board.
+        """
         old_pos = self._current_pawn_position
         self._current_pawn_position = (
             self._current_pawn_position + self._current_dice_roll_sum) \
-            % (GameConstants.MAX_FIELD_ID + 1)
-        if self._current_dice_roll_sum > GameConstants.MAX_FIELD_ID - old_pos:
+            % (max_field_id + 1)
+        if self._current_dice_roll_sum > max_field_id - old_pos:
             self.passed_start_field = True
         else:
             self.passed_start_field = False
+        self._version = new_version()
+
+    def set_position(self, field_id: int,
+                     max_field_id: int = GameConstants.MAX_FIELD_ID) -> None:
+        """Set current player's position to given field index.
+
+        Parameters
+        ----------
+        field_id : int
+            New position.
+        max_field_id : int, optional
+            Index of the last field on the board.
 
-    def set_position(self, field_id: int) -> None:
-        """Set current player's position to given field index."""
-        if field_id > GameConstants.MAX_FIELD_ID:
+        Raises
+        ------
+        ValueError
+            If the field index is above max_field_id.
+        """
+        if field_id > max_field_id:
             raise ValueError
         self._current_pawn_position = field_id
+        self._version = new_version()
 
     def spend_money(self, amount: int) -> None:
         """Decrease player's money by give amount."""
         check_amount_of_money(amount)
         self._money -= amount
+        self._version = new_version()
 
     def earn_money(self, amount: int) -> None:
         """Increase player's money by given amount."""
         check_amount_of_money(amount)
         self._money += amount
+        self._version = new_version()
 
     def add_property(self, field_id: int) -> None:
         """Add given field index to the set of fields owned by player.
@@ -168,6 +210,7 @@ class Player:
             raise JailError("Player is already in jail")
         self._is_in_jail = True
         self._current_pawn_position = GameConstants.JAIL_FIELD_ID
+        self._version = new_version()
 
     def get_out_of_jail(self) -> None:
         """Sets _is_in_jail flag to False.
@@ -181,13 +224,56 @@ class Player:
             raise JailError("Player is not in jail")
         self._is_in_jail = False
 
+    def assets_value(self) -> float:
+        """Gets amount of money owned fields can be sold for."""
+        return self._assets_value
+
+    def change_assets_value(self, amount: float) -> None:
+        """Adds amount to the value of owned fields.
+
+        Called by fields whenever their owner or value changes.
+        """
+        self._assets_value += amount
+
+    def copy(self) -> Player:
+        """Gets copy of the player with own set of owned fields."""
+        player = Player.__new__(Player)
+        player._name = self._name
+        player._owned_property_fields = set(self._owned_property_fields)
+        player._current_dice_roll_sum = self._current_dice_roll_sum
+        player._is_in_jail = self._is_in_jail
+        player._money = self._money
+        player._current_pawn_position = self._current_pawn_position
+        player._assets_value = self._assets_value
+        player.passed_start_field = self.passed_start_field
+        player.is_bancrupt = self.is_bancrupt
+        player._version = self._version
+        player._rendered = self._rendered
+        return player
+
+    def version(self) -> int:
+        """Gets the state version of the player."""
+        return self._version
+
+    def changed(self) -> None:
+        """Marks that money or position was set directly."""
+        self._version = new_version()
+
     def owned_property_fields(self) -> Set[int]:
         """Gets set of indices of fields owned by the player."""
         return self._owned_property_fields
 
     def __str__(self) -> str:
-        """Gets name, money and current position of player in table format"""
+        """Gets name, money and current position of player in table format
+
+        The table is rendered again only when the player has changed.
+        """
+        rendered = self._rendered
+        if rendered is not None and rendered[0] == self._version:
+            return rendered[1]
         output = [['name', self._name],
                   ['money', self._money],
                   ['current position', self._current_pawn_position]]
-        return tabulate(output, tablefmt='grid')
+        text = tabulate(output, tablefmt='grid')
+        self._rendered = (self._version, text)
+        return text
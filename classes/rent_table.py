@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+HOTEL_LEVEL = 5
+LEVELS_NUM = 6
+STREET_RENT_KEYS = ('w_one_house', 'w_two_houses', 'w_three_houses',
+                    'w_four_houses', 'w_hotel')
+
+_rent_rows = {}
+_rent_tables = {}
+
+
+def rent_index(level: int, mortgaged: bool, monopoly: bool) -> int:
+    """Gets position of the rent in a compiled rent row.
+
+    Parameters
+    ----------
+    level : int
+        Development level, number of houses or 5 for a hotel.
+    mortgaged : bool
+        Is the field mortgaged.
+    monopoly : bool
+        Does the owner own all fields in the colour.
+    """
+    return 4 * level + 2 * mortgaged + monopoly
+
+
+def compile_rent_row(base_rent: int, other_rents: dict[str, int] = None,
+                     street: bool = False) -> tuple[int]:
+    """Compiles rent schedule of one field into a tuple.
+
+    Rent of a mortgaged field is 0. Owner of the whole colour gets double
+    base rent on a field without buildings. Fields with the same rent
+    schedule share the same tuple.
+
+    Parameters
+    ----------
+    base_rent : int
+        Rent of the field without buildings.
+    other_rents : dict of str to int, optional
+        Rents with houses and hotel, required for streets.
+    street : bool, default = False
+        Can houses be built on the field. Levels above zero of other
+        fields have the base rent.
+
+    Returns
+    -------
+    tuple of int
+        Rents indexed by rent_index.
+    """
+    level_rents = [base_rent] * LEVELS_NUM
+    if street:
+        for level, key in enumerate(STREET_RENT_KEYS, start=1):
+            level_rents[level] = other_rents[key]
+    row = []
+    for level, rent in enumerate(level_rents):
+        monopoly_rent = 2 * rent if level == 0 else rent
+        row += [rent, monopoly_rent, 0, 0]
+    row = tuple(row)
+    return _rent_rows.setdefault(row, row)
+
+
+class RentTable:
+    """Rent schedules of all property fields of a board definition.
+
+    Attributes
+    ----------
+    _rows : tuple of tuple of int
+        Compiled rent row of every field index, None for fields without
+        rent.
+    """
+
+    __slots__ = ('_rows',)
+
+    def __init__(self, rows: tuple[tuple[int]]):
+        """Initiates object attributes.
+
+        Parameters
+        ----------
+        rows : tuple of tuple of int
+            Compiled rent row of every field index, None for fields
+            without rent.
+        """
+        self._rows = rows
+
+    @classmethod
+    def for_fields(cls, fields: list) -> RentTable:
+        """Gets rent table of given property fields.
+
+        Boards with the same rent schedules share one table.
+        """
+        size = max((field.field_id() for field in fields), default=-1) + 1
+        rows = [None] * size
+        for field in fields:
+            rows[field.field_id()] = field.rent_row()
+        rows = tuple(rows)
+        if rows not in _rent_tables:
+            _rent_tables[rows] = cls(rows)
+        return _rent_tables[rows]
+
+    def rent(self, field_id: int, level: int = 0, mortgaged: bool = False,
+             monopoly: bool = False) -> int:
+        """Gets rent of the field in given state."""
+        return self._rows[field_id][rent_index(level, mortgaged, monopoly)]
+
+    def row(self, field_id: int) -> tuple[int]:
+        """Gets compiled rent row of the field."""
+        return self._rows[field_id]
+
+    def field_ids(self) -> list[int]:
+        """Gets indices of fields in the table."""
+        return [field_id for field_id, row in enumerate(self._rows)
+                if row is not None]
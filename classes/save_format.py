@@ -0,0 +1,177 @@
+from __future__ import annotations
+from array import array
+import struct
+import sys
+from classes.board import Board
+from classes.board_loader import DATABASE_FILES, load_board_definition
+from classes.game import Game
+from classes.game_state import GameState, HEADER_SIZE, FIELD_SIZE
+from classes.game_state import PLAYER_SIZE
+from classes.player import Player
+from classes.rent_table import HOTEL_LEVEL
+
+SAVE_MAGIC = b'MSAV'
+SAVE_VERSION = 2
+SAVE_HEADER = struct.Struct('<4sH32sBH')
+DECK_SEED = struct.Struct('<?q')
+NAME_LENGTH = struct.Struct('<B')
+MAX_NAME_SIZE = 255
+
+
+class SaveFormatError(Exception):
+    """Raised when the save file is invalid or doesn't match the board."""
+    pass
+
+
+def encode_game(game: Game, board_hash: bytes) -> bytes:
+    """Encodes mutable state of the game.
+
+    Layout: header (magic, version, board definition hash, number of
+    players, number of state values), seed of the chance deck (flag if
+    the deck is shuffled and 64-bit seed), player names as length
+    prefixed utf-8 strings, GameState values as little endian 32-bit
+    integers.
+
+    Raises
+    ------
+    SaveFormatError
+        If a player's name is longer than MAX_NAME_SIZE bytes or the deck
+        seed doesn't fit in 64 bits.
+    """
+    values = GameState.capture(game).values()
+    data = bytearray(SAVE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION, board_hash,
+                                      len(game.players()), len(values)))
+    seed = game.board().chance_deck().seed()
+    try:
+        data += DECK_SEED.pack(seed is not None, seed or 0)
+    except struct.error:
+        raise SaveFormatError(f'Deck seed {seed} is too large to save')
+    for player in game.players():
+        name = player.name().encode('utf-8')
+        if len(name) > MAX_NAME_SIZE:
+            raise SaveFormatError(f'Name of {player.name()} is too long')
+        data += NAME_LENGTH.pack(len(name)) + name
+    if sys.byteorder == 'big':
+        values = array('i', values)
+        values.byteswap()
+    data += values.tobytes()
+    return bytes(data)
+
+
+def check_values(values: array, board: Board, players_num: int) -> None:
+    """Checks that decoded state values fit the board and the players.
+
+    Raises
+    ------
+    SaveFormatError
+        If the number of values or any index is out of range.
+    """
+    fields_num = len(board.property_field_ids())
+    if len(values) != HEADER_SIZE + FIELD_SIZE * fields_num + \
+            PLAYER_SIZE * players_num:
+        raise SaveFormatError('Save file does not match the board')
+    if not 0 <= values[0] < players_num:
+        raise SaveFormatError('Save file is corrupted')
+    fields_end = HEADER_SIZE + FIELD_SIZE * fields_num
+    for index in range(HEADER_SIZE, fields_end, FIELD_SIZE):
+        if not -1 <= values[index] < players_num or \
+                not 0 <= values[index + 1] <= HOTEL_LEVEL:
+            raise SaveFormatError('Save file is corrupted')
+    for index in range(fields_end, len(values), PLAYER_SIZE):
+        if not -1 <= values[index + 1] <= board.max_field_id():
+            raise SaveFormatError('Save file is corrupted')
+
+
+def decode_game(data: bytes, board: Board, board_hash: bytes) -> Game:
+    """Decodes game saved with encode_game onto a new board.
+
+    Parameters
+    ----------
+    data : bytes
+        Encoded game.
+    board : Board
+        New board created from the same definition as the saved game's.
+    board_hash : bytes
+        Hash of the definition the board was created from.
+
+    Raises
+    ------
+    SaveFormatError
+        If the data is invalid or was saved with another board definition.
+    """
+    try:
+        magic, version, saved_hash, players_num, values_num = \
+            SAVE_HEADER.unpack_from(data)
+    except struct.error:
+        raise SaveFormatError('Save file is too short')
+    if magic != SAVE_MAGIC:
+        raise SaveFormatError('File is not a saved game')
+    if version != SAVE_VERSION:
+        raise SaveFormatError(f'Unsupported save version {version}')
+    if saved_hash != board_hash:
+        raise SaveFormatError('Game was saved with another board')
+    offset = SAVE_HEADER.size
+    players = []
+    try:
+        shuffled, seed = DECK_SEED.unpack_from(data, offset)
+        offset += DECK_SEED.size
+        for _ in range(players_num):
+            (length,) = NAME_LENGTH.unpack_from(data, offset)
+            offset += NAME_LENGTH.size
+            name = data[offset:offset + length].decode('utf-8')
+            offset += length
+            players.append(Player(name))
+    except (struct.error, UnicodeDecodeError):
+        raise SaveFormatError('Save file is corrupted')
+    values = array('i')
+    if len(data) - offset != values_num * values.itemsize:
+        raise SaveFormatError('Save file is corrupted')
+    values.frombytes(data[offset:])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    check_values(values, board, players_num)
+    game = Game(board, players)
+    board.chance_deck().shuffle(seed if shuffled else None)
+    GameState(board.property_field_ids(), values).restore(game)
+    return game
+
+
+def save_game(game: Game, filename: str,
+              files: tuple[str] = DATABASE_FILES) -> None:
+    """Saves the game played on the board from given database files."""
+    save_games({filename: game}, files)
+
+
+def save_games(games: dict[str, Game],
+               files: tuple[str] = DATABASE_FILES) -> None:
+    """Saves many games at once, the board hash is computed once.
+
+    Parameters
+    ----------
+    games : dict of str to Game
+        Dictionary assigning file names to saved games.
+    files : tuple of str, optional
+        Database files the boards of the games were created from.
+    """
+    board_hash = load_board_definition(files).definition_hash()
+    for filename, game in games.items():
+        data = encode_game(game, board_hash)
+        with open(filename, 'wb') as fp:
+            fp.write(data)
+
+
+def load_game(filename: str, files: tuple[str] = DATABASE_FILES) -> Game:
+    """Loads game saved with save_game.
+
+    Static board data is read again from the database files.
+
+    Raises
+    ------
+    SaveFormatError
+        If the file is invalid or the database has changed since saving.
+    """
+    with open(filename, 'rb') as fp:
+        data = fp.read()
+    definition = load_board_definition(files)
+    return decode_game(data, definition.build_board(),
+                       definition.definition_hash())
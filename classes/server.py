@@ -0,0 +1,642 @@
+from __future__ import annotations
+from array import array
+from time import perf_counter
+import argparse
+import asyncio
+import logging
+from classes.board import Board, ColourError
+from classes.board_loader import BoardDefinition, load_board_definition
+from classes.field import PropertyField, SpecialField, Street
+from classes.field import HousesNumError, MortgageError
+from classes.game import Game
+from classes.game_constants import GameConstants
+from classes.game_events import EventType
+from classes.instrumentation import profiled
+from classes.player import Player
+from classes.tournament import game_seed
+from classes import simulation
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+ANSWER_TIMEOUT = 60.0
+TRUE_ANSWERS = ('yes', 'y')
+FALSE_ANSWERS = ('no', 'n')
+MENU_COMMANDS = ('BUILD', 'SELL', 'MORTGAGE', 'LIFT')
+RAISE_COMMANDS = ('SELL', 'MORTGAGE')
+
+logger = logging.getLogger(__name__)
+
+
+class ProtocolError(Exception):
+    """Raised when a client sends a line that is not allowed."""
+    pass
+
+
+class Seat:
+    """Connection of one player sitting at a table.
+
+    Attributes
+    ----------
+    _writer : asyncio.StreamWriter
+        Stream the lines for the player are written to, None after the
+        player disconnected.
+    _buffer : list of bytes
+        Lines waiting to be written with one call at the next flush.
+    _answer : asyncio.Future
+        Future waiting for the answer to the last question, None if the
+        player isn't asked.
+    _answered_at : float
+        perf_counter value of the moment the last answer was received.
+    """
+
+    __slots__ = ('_writer', '_buffer', '_answer', '_answered_at')
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        """Initiates object attributes."""
+        self._writer = writer
+        self._buffer = []
+        self._answer = None
+        self._answered_at = None
+
+    def connected(self) -> bool:
+        """Checks if the player is still connected."""
+        return self._writer is not None
+
+    def answered_at(self) -> float:
+        """Gets the moment the last answer was received."""
+        return self._answered_at
+
+    def send(self, line: str) -> None:
+        """Adds line to the lines sent at the next flush."""
+        self._buffer.append(line.encode('utf-8') + b'\n')
+
+    def send_bytes(self, data: bytes) -> None:
+        """Adds encoded line to the lines sent at the next flush."""
+        self._buffer.append(data)
+
+    def flush(self) -> None:
+        """Writes all buffered lines to the player with one call.
+
+        Every write is a system call, so lines produced while handling
+        one answer are sent together.
+        """
+        if self._writer is not None and self._buffer:
+            self._writer.write(b''.join(self._buffer))
+        self._buffer.clear()
+
+    async def ask(self, question: str, timeout: float = None) -> str:
+        """Sends the question and waits for the answer.
+
+        Other tables are played while waiting. A player who doesn't
+        answer in time is disconnected.
+
+        Parameters
+        ----------
+        question : str
+            Question sent after ASK.
+        timeout : float, optional
+            Seconds to wait for the answer (default is no limit).
+
+        Returns
+        -------
+        str
+            Answer of the player, None if he is disconnected.
+        """
+        if self._writer is None:
+            return None
+        self._answer = asyncio.get_running_loop().create_future()
+        self.send('ASK ' + question)
+        self.flush()
+        try:
+            await self._writer.drain()
+        except ConnectionError:
+            self.disconnect()
+        try:
+            answer = await asyncio.wait_for(self._answer, timeout)
+        except asyncio.TimeoutError:
+            self.send('ERR Answer timeout')
+            self.disconnect()
+            answer = None
+        self._answer = None
+        return answer
+
+    def answer(self, line: str) -> bool:
+        """Passes line received from the player as the answer.
+
+        Returns
+        -------
+        bool
+            False if the player wasn't asked any question.
+        """
+        if self._answer is None or self._answer.done():
+            return False
+        self._answered_at = perf_counter()
+        self._answer.set_result(line)
+        return True
+
+    def disconnect(self) -> None:
+        """Marks the player as disconnected and cancels the question."""
+        if self._writer is not None:
+            self.flush()
+            self._writer.close()
+            self._writer = None
+        if self._answer is not None and not self._answer.done():
+            self._answered_at = perf_counter()
+            self._answer.set_result(None)
+
+
+class Table:
+    """One game hosted by the server.
+
+    Turns are played with the same Game calls and in the same order as
+    in simulation.play. Decisions are awaited from the players, a player
+    who disconnects is played with the base simulation Policy. Every
+    recorded game transition is sent to all players as an EVENT line.
+
+    Attributes
+    ----------
+    _name : str
+        Name of the table.
+    _server : GameServer
+        Server hosting the table.
+    _players_num : int
+        Number of players needed to start the game.
+    _seed : int
+        Seed of the dice rolls, None for random seed.
+    _names : list of str
+        Names of joined players.
+    _seats : list of Seat
+        Connections of joined players.
+    _game : Game
+        The game, None before it is started.
+    _answered_at : float
+        perf_counter value of the moment the last answer was received at
+        the table, None before the first answer.
+    _task : asyncio.Task
+        Task playing the game, None before it is started.
+    """
+
+    __slots__ = ('_name', '_server', '_players_num', '_seed',
+                 '_names', '_seats', '_game', '_answered_at', '_task')
+
+    def __init__(self, name: str, players_num: int, server: GameServer,
+                 seed: int = None):
+        """Initiates object attributes."""
+        self._name = name
+        self._server = server
+        self._players_num = players_num
+        self._seed = seed
+        self._names = []
+        self._seats = []
+        self._game = None
+        self._answered_at = None
+        self._task = None
+
+    def name(self) -> str:
+        """Gets name of the table."""
+        return self._name
+
+    def game(self) -> Game:
+        """Gets the game played at the table."""
+        return self._game
+
+    def is_full(self) -> bool:
+        """Checks if all players have joined."""
+        return len(self._seats) == self._players_num
+
+    def join(self, name: str, writer: asyncio.StreamWriter) -> Seat:
+        """Adds new player to the table.
+
+        Raises
+        ------
+        ProtocolError
+            If the table is full or the name is already taken.
+        """
+        if self._game is not None or self.is_full():
+            raise ProtocolError('Table is full')
+        if name in self._names:
+            raise ProtocolError('Players must have unique names')
+        seat = Seat(writer)
+        self._names.append(name)
+        self._seats.append(seat)
+        return seat
+
+    def leave(self, seat: Seat) -> None:
+        """Removes player who disconnected before the game started."""
+        index = self._seats.index(seat)
+        del self._seats[index]
+        del self._names[index]
+
+    def is_empty(self) -> bool:
+        """Checks if nobody sits at the table."""
+        return not self._seats
+
+    def start(self) -> None:
+        """Creates the game and starts playing it in a new task."""
+        players = [Player(name) for name in self._names]
+        self._game = Game(self._server.new_board(), players, self._seed)
+        for index, seat in enumerate(self._seats):
+            seat.send(f'START {index} ' + ' '.join(self._names))
+        self._game.set_recorder(self)
+        self._game.prepare_game()
+        self._task = asyncio.get_running_loop().create_task(self.run())
+        self._server.add_table_task(self._task)
+
+    def record(self, event_type: EventType, player_index: int,
+               value: int = 0, amount: int = 0) -> None:
+        """Sends the game transition to every player."""
+        self.broadcast(
+            f'EVENT {event_type.name} {player_index} {value} {amount}')
+
+    def broadcast(self, line: str) -> None:
+        """Sends line to every player at the next flush."""
+        data = line.encode('utf-8') + b'\n'
+        for seat in self._seats:
+            seat.send_bytes(data)
+
+    async def run(self) -> None:
+        """Plays the game until it is over and closes the table."""
+        game = self._game
+        try:
+            while not game.win():
+                game.is_win()
+                await self.play_turn()
+            winner = game.find_winner()
+            self.broadcast('END ' + ('-' if winner is None
+                                     else winner.name()))
+        finally:
+            for seat in self._seats:
+                seat.disconnect()
+            self._server.close_table(self)
+
+    async def ask(self, seat: Seat, question: str) -> str:
+        """Asks player a question and records the server latency.
+
+        Lines buffered for every player are sent first. Latency is the
+        time from receiving the previous answer at the table to sending
+        the next question.
+        """
+        if self._answered_at is not None:
+            self._server.add_latency(perf_counter() - self._answered_at)
+        for other in self._seats:
+            if other is not seat:
+                other.flush()
+        answer = await seat.ask(question, self._server.answer_timeout())
+        self._answered_at = seat.answered_at()
+        return answer
+
+    async def play_turn(self) -> None:
+        """Lets current player manage properties and make his move."""
+        game = self._game
+        seat = self._seats[game.current_player_index()]
+        while True:
+            line = await self.ask(
+                seat, f'MENU {game.current_player().money()}')
+            if line is None:
+                break
+            command, *args = line.upper().split() or ['']
+            if command == 'ROLL':
+                break
+            self.property_action(seat, command, args, MENU_COMMANDS)
+        await self.make_move(seat)
+
+    def property_action(self, seat: Seat, command: str, args: list[str],
+                        allowed: tuple[str]) -> None:
+        """Builds, sells, mortgages or lifts mortgage as player asked.
+
+        Sends OK with current player's money or ERR with the reason.
+        """
+        game = self._game
+        try:
+            if command not in allowed or len(args) != 1:
+                raise ProtocolError('Unknown command')
+            try:
+                field_id = int(args[0])
+            except ValueError:
+                raise ProtocolError('Field id must be an integer')
+            if not game.player_is_owner(field_id):
+                raise ProtocolError('You are not owner of this field')
+            field = game.get_field_by_id(field_id)
+            if command == 'BUILD':
+                if type(field) is not Street:
+                    raise ProtocolError('This field is not a Street')
+                if game.is_enough_houses(field):
+                    game.build_hotel(field)
+                else:
+                    game.build_house(field)
+            elif command == 'SELL':
+                if type(field) is not Street:
+                    raise ProtocolError('This field is not a Street')
+                if field.hotel():
+                    game.sell_hotel(field)
+                elif game.is_house_to_sell(field):
+                    game.sell_house(field)
+                else:
+                    raise ProtocolError('There is no house to sell')
+            elif command == 'MORTGAGE':
+                if field.is_mortgaged():
+                    raise ProtocolError('This field is already mortgaged')
+                game.mortgage(field)
+            else:
+                if not field.is_mortgaged():
+                    raise ProtocolError('This field is not mortgaged')
+                game.lift_mortgage(field)
+        except (ProtocolError, HousesNumError,
+                MortgageError, ColourError) as error:
+            seat.send(f'ERR {error}')
+            return
+        seat.send(f'OK {game.current_player().money()}')
+
+    async def make_move(self, seat: Seat) -> None:
+        """Makes whole move of current player and changes player.
+
+        Follows the same order of Game calls as simulation.make_move.
+        """
+        game = self._game
+        game.dice_roll()
+        game.move_pawn_number_of_dots()
+        field = game.current_field()
+        if game.current_player().passed_start_field:
+            game.start_field_bonus()
+        if isinstance(field, PropertyField) and \
+                field.owner() is None:
+            if game.can_afford(field.price()) and \
+                    await self.buy_property(seat, field):
+                game.buy_current_property()
+        elif isinstance(field, PropertyField) and \
+                not game.player_is_owner() and \
+                not field.is_mortgaged():
+            amount = field.current_rent()
+            if game.can_afford(amount) or \
+                    await self.make_money_from_properties(seat, amount):
+                game.pay_rent()
+        elif type(field) == SpecialField and field.name() == 'chance':
+            card = game.get_new_chance_card()
+            amount = game.chance_card_amount(card)
+            if not amount or game.can_afford(amount) or \
+                    await self.make_money_from_properties(seat, amount):
+                game.chance_field_action(card)
+        game.change_player()
+
+    async def buy_property(self, seat: Seat, field: PropertyField) -> bool:
+        """Asks player if he buys the field, yes if he is disconnected."""
+        while True:
+            line = await self.ask(seat,
+                                  f'BUY {field.field_id()} {field.price()}')
+            if line is None:
+                return True
+            words = line.strip().lower().split()
+            if not words or words[0] in TRUE_ANSWERS:
+                return True
+            if words[0] in FALSE_ANSWERS:
+                return False
+            seat.send('ERR Please enter yes or no')
+
+    async def make_money_from_properties(self, seat: Seat,
+                                         amount: int) -> bool:
+        """Makes player raise amount or go bancrupt.
+
+        Player sells and mortgages his properties until he can afford
+        the amount. AUTO answer or disconnection lets simulation.liquidate
+        choose the rest.
+
+        Returns
+        -------
+        bool
+            Indicates if the player got the required amount.
+        """
+        game = self._game
+        if game.total_fortune() > amount:
+            while not game.can_afford(amount):
+                line = await self.ask(seat, f'RAISE {amount}')
+                command, *args = (line or 'AUTO').upper().split() or ['']
+                if command == 'AUTO':
+                    simulation.liquidate(game, amount)
+                    break
+                self.property_action(seat, command, args, RAISE_COMMANDS)
+            if game.can_afford(amount):
+                return True
+        game.make_bancrupt()
+        return False
+
+
+class GameServer:
+    """Asyncio server hosting many tables over a line based protocol.
+
+    Every line is utf-8 text ended with a new line. Client sends
+    JOIN <table> <name> [<players number>] and waits for START; the game
+    starts when the table is full. Server sends questions:
+        ASK MENU <money> - answer ROLL, BUILD <id>, SELL <id>,
+            MORTGAGE <id> or LIFT <id>
+        ASK BUY <field id> <price> - answer yes or no
+        ASK RAISE <amount> - answer SELL <id>, MORTGAGE <id> or AUTO
+    Property actions are confirmed with OK <money> or ERR <reason>.
+    A player who doesn't answer in time gets ERR Answer timeout and is
+    disconnected.
+    Game transitions are sent as EVENT <type> <player> <value> <amount>
+    and the game ends with END <winner name>.
+
+    Attributes
+    ----------
+    _players_num : int
+        Default number of players at a table.
+    _seed : int
+        Base seed of the tables, None for random dice.
+    _tables : dict of str to Table
+        Tables waiting for players or playing.
+    _tables_num : int
+        Number of tables created so far.
+    _latencies : array.array
+        Server latencies of all answers in seconds.
+    _server : asyncio.Server
+        Listening server, None before start.
+    _definition : BoardDefinition
+        Board definition loaded at start, every table builds its board
+        from it.
+    _answer_timeout : float
+        Seconds a player has to answer, None for no limit.
+    _table_tasks : set of asyncio.Task
+        Tasks of the tables being played.
+    """
+
+    def __init__(self, players_num: int = 2, seed: int = None,
+                 answer_timeout: float = ANSWER_TIMEOUT):
+        """Initiates object attributes.
+
+        Parameters
+        ----------
+        players_num : int, default = 2
+            Number of players at a table if the client doesn't choose it.
+        seed : int, optional
+            Base seed, table number i gets seed game_seed(seed, i)
+            (default is random dice).
+        answer_timeout : float, default = ANSWER_TIMEOUT
+            Seconds a player has to answer before he is disconnected and
+            played by the computer, None for no limit.
+        """
+        self._players_num = players_num
+        self._seed = seed
+        self._tables = {}
+        self._tables_num = 0
+        self._latencies = array('d')
+        self._server = None
+        self._definition = None
+        self._answer_timeout = answer_timeout
+        self._table_tasks = set()
+
+    async def start(self, host: str = DEFAULT_HOST,
+                    port: int = DEFAULT_PORT) -> None:
+        """Loads the board definition and starts listening.
+
+        The database files are read in a thread, so the event loop isn't
+        blocked. Port 0 picks a free port.
+        """
+        self._definition = await asyncio.to_thread(load_board_definition)
+        self._server = await asyncio.start_server(
+            self.handle_connection, host, port)
+
+    def port(self) -> int:
+        """Gets the port the server listens on."""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Serves clients until cancelled."""
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self) -> None:
+        """Stops listening."""
+        self._server.close()
+
+    def new_board(self) -> Board:
+        """Creates new board from the definition loaded at start."""
+        return self._definition.build_board()
+
+    def answer_timeout(self) -> float:
+        """Gets seconds a player has to answer, None for no limit."""
+        return self._answer_timeout
+
+    def add_table_task(self, task: asyncio.Task) -> None:
+        """Keeps the task of a table until it ends."""
+        self._table_tasks.add(task)
+        task.add_done_callback(self._table_task_done)
+
+    def _table_task_done(self, task: asyncio.Task) -> None:
+        """Forgets the ended task of a table and logs its error."""
+        self._table_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error('Table task failed', exc_info=task.exception())
+
+    def tables_num(self) -> int:
+        """Gets number of open tables."""
+        return len(self._tables)
+
+    def latencies(self) -> array:
+        """Gets server latencies of all answers in seconds."""
+        return self._latencies
+
+    def add_latency(self, latency: float) -> None:
+        """Records latency of one answer."""
+        self._latencies.append(latency)
+
+    def close_table(self, table: Table) -> None:
+        """Removes finished table."""
+        self._tables.pop(table.name(), None)
+
+    def join(self, line: str, writer: asyncio.StreamWriter
+             ) -> tuple[Table, Seat]:
+        """Handles the JOIN line of a new client.
+
+        Raises
+        ------
+        ProtocolError
+            If the line is not a correct JOIN or the table is full.
+        """
+        words = line.split()
+        if len(words) not in (3, 4) or words[0].upper() != 'JOIN':
+            raise ProtocolError('Expected JOIN <table> <name> [<players>]')
+        players_num = self._players_num
+        if len(words) == 4:
+            try:
+                players_num = int(words[3])
+            except ValueError:
+                raise ProtocolError('Number of players must be an integer')
+            if players_num not in range(2, GameConstants.MAX_PLAYERS_NUM + 1):
+                raise ProtocolError('Incorrect number of players')
+        table = self._tables.get(words[1])
+        if table is None:
+            seed = None
+            if self._seed is not None:
+                seed = game_seed(self._seed, self._tables_num)
+            table = Table(words[1], players_num, self, seed)
+            self._tables[words[1]] = table
+            self._tables_num += 1
+        seat = table.join(words[2], writer)
+        return table, seat
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """Reads lines of one client until he disconnects."""
+        table = None
+        seat = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                line = line.decode('utf-8', 'replace').strip()
+                if seat is None:
+                    try:
+                        table, seat = self.join(line, writer)
+                    except ProtocolError as error:
+                        writer.write(f'ERR {error}\n'.encode('utf-8'))
+                        continue
+                    writer.write(f'OK {table.name()}\n'.encode('utf-8'))
+                    if table.is_full():
+                        table.start()
+                elif not seat.answer(line):
+                    seat.send('ERR Not your turn')
+                    seat.flush()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            if seat is not None:
+                seat.disconnect()
+                if table.game() is None:
+                    table.leave(seat)
+                    if table.is_empty():
+                        self.close_table(table)
+            writer.close()
+
+
+async def serve(host: str, port: int, players_num: int,
+                answer_timeout: float = ANSWER_TIMEOUT) -> None:
+    """Runs the server until interrupted."""
+    server = GameServer(players_num, answer_timeout=answer_timeout)
+    await server.start(host, port)
+    print(f'Serving on {host}:{server.port()}')
+    await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--players', type=int, default=2,
+                        help="default number of players at a table")
+    parser.add_argument('--timeout', type=float, default=ANSWER_TIMEOUT,
+                        help="seconds a player has to answer")
+    parser.add_argument('--profile', metavar='FILE',
+                        help="measure game phases and write folded stacks "
+                        "to the file")
+    args = parser.parse_args()
+    with profiled(args.profile):
+        try:
+            asyncio.run(serve(args.host, args.port, args.players,
+                              args.timeout))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
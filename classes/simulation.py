@@ -0,0 +1,231 @@
+from classes.game import Game
+from classes.field import PropertyField, SpecialField, Street
+from classes.liquidation import plan_liquidation, execute_plan
+from classes.player import Player
+
+
+class Policy:
+    """Decision policy used by the headless engine in place of a human.
+
+    The base policy buys every property the player can afford, never
+    builds and raises money by selling hotels, houses and then mortgaging
+    fields. Subclasses override the hooks they want to change.
+    """
+
+    def buy_property(self, game: Game, field: PropertyField) -> bool:
+        """Decides if current player buys the field he landed on.
+
+        Called only when the player can afford the field.
+        """
+        return True
+
+    def manage_properties(self, game: Game) -> None:
+        """Builds, sells or mortgages before current player throws dice."""
+        pass
+
+    def raise_money(self, game: Game, amount: int) -> None:
+        """Sells buildings or mortgages fields to be able to pay amount.
+
+        Called only when the total fortune of current player is greater
+        than the amount, so the debt can always be paid.
+        """
+        liquidate(game, amount)
+
+
+class PassivePolicy(Policy):
+    """Policy of a player who never buys any property."""
+
+    def buy_property(self, game: Game, field: PropertyField) -> bool:
+        """Never buys the field."""
+        return False
+
+
+class BuilderPolicy(Policy):
+    """Policy of a player who develops every street he is allowed to.
+
+    Attributes
+    ----------
+    _reserve : int
+        Amount of money player keeps in cash instead of spending it on
+        houses and hotels.
+    """
+
+    def __init__(self, reserve: int = 200):
+        """Initiates object attributes.
+
+        Parameters
+        ----------
+        reserve : int, default = 200
+            Amount of money that is never spent on buildings.
+        """
+        self._reserve = reserve
+
+    def manage_properties(self, game: Game) -> None:
+        """Builds houses and hotels while money stays above the reserve."""
+        player = game.current_player()
+        built = True
+        while built:
+            built = False
+            for field_id in sorted(player.owned_property_fields()):
+                field = game.get_field_by_id(field_id)
+                if type(field) is not Street or field.hotel() \
+                        or not game.owns_all_of_colour(field):
+                    continue
+                if game.is_enough_houses(field):
+                    cost = field.hotel_cost()
+                    build = game.build_hotel
+                    allowed = game.hotels_build_evenly(field)
+                else:
+                    cost = field.house_cost()
+                    build = game.build_house
+                    allowed = game.houses_build_evenly(field)
+                if allowed and not field.is_mortgaged() \
+                        and player.money() - cost > self._reserve:
+                    build(field)
+                    built = True
+
+
+class PlannerPolicy(Policy):
+    """Policy raising money with the least costly liquidation plan."""
+
+    def raise_money(self, game: Game, amount: int) -> None:
+        """Executes the plan found by liquidation.plan_liquidation."""
+        plan = plan_liquidation(game, amount)
+        if plan is not None:
+            execute_plan(game, plan)
+
+
+def liquidate(game: Game, amount: int) -> None:
+    """Makes current player sell and mortgage until he can afford amount.
+
+    Hotels are sold first, then houses evenly from the most developed
+    fields, then fields without houses are mortgaged. Stops when no legal
+    action is left.
+    """
+    player = game.current_player()
+    while not game.can_afford(amount):
+        fields = [game.get_field_by_id(f_id)
+                  for f_id in sorted(player.owned_property_fields())]
+        streets = [f for f in fields if type(f) is Street]
+        hotel = next((f for f in streets if f.hotel()), None)
+        if hotel is not None:
+            game.sell_hotel(hotel)
+            continue
+        house = next((f for f in streets if game.is_house_to_sell(f)
+                      and game.houses_removed_evenly(f)), None)
+        if house is not None:
+            game.sell_house(house)
+            continue
+        to_mortgage = next((f for f in fields if not f.is_mortgaged()
+                            and not game.is_house_to_sell(f)), None)
+        if to_mortgage is None:
+            return
+        game.mortgage(to_mortgage)
+
+
+def make_money_from_properties(game: Game, amount: int,
+                               policy: Policy) -> bool:
+    """Makes current player raise amount or go bancrupt.
+
+    Headless counterpart of interface.make_money_from_properties.
+
+    Returns
+    -------
+    bool
+        Indicates if the player got the required amount.
+    """
+    if game.total_fortune() > amount:
+        policy.raise_money(game, amount)
+        if not game.can_afford(amount):
+            liquidate(game, amount)
+        if game.can_afford(amount):
+            return True
+    game.make_bancrupt()
+    return False
+
+
+def make_property_transaction(game: Game, policy: Policy) -> None:
+    """Asks the policy if current player buys the field he is on."""
+    field = game.current_field()
+    if game.can_afford(field.price()) and policy.buy_property(game, field):
+        game.buy_current_property()
+
+
+def pay_rent(game: Game, policy: Policy) -> None:
+    """Makes current player pay rent, raising money first if needed."""
+    amount = game.current_field().current_rent()
+    if not game.can_afford(amount):
+        if not make_money_from_properties(game, amount, policy):
+            return
+    game.pay_rent()
+
+
+def chance_field_action(game: Game, policy: Policy) -> None:
+    """Draws chance cards the same way interface.chance_field_action does."""
+    card = game.get_new_chance_card()
+    amount = game.chance_card_amount(card)
+    if amount and not game.can_afford(amount):
+        if not make_money_from_properties(game, amount, policy):
+            return
+    game.chance_field_action(card)
+
+
+def make_move(game: Game, policy: Policy) -> None:
+    """Makes whole move of current player and changes player.
+
+    Follows the same order of Game calls as interface.make_move.
+    """
+    game.dice_roll()
+    game.move_pawn_number_of_dots()
+    field = game.current_field()
+    if game.current_player().passed_start_field:
+        game.start_field_bonus()
+    if isinstance(field, PropertyField) and \
+            field.owner() is None:
+        make_property_transaction(game, policy)
+    elif isinstance(field, PropertyField) and \
+            not game.player_is_owner() and \
+            not field.is_mortgaged():
+        pay_rent(game, policy)
+    elif type(field) == SpecialField and field.name() == 'chance':
+        chance_field_action(game, policy)
+    game.change_player()
+
+
+def play_turn(game: Game, policies: list[Policy]) -> None:
+    """Lets current player manage properties and make his move."""
+    policy = policies[game.current_player_index()]
+    policy.manage_properties(game)
+    make_move(game, policy)
+
+
+def play(game: Game, policies: list[Policy] = None,
+         resumed: bool = False) -> Player:
+    """Plays the game until it is over.
+
+    Headless counterpart of interface.play. Every loop iteration is one
+    turn of current player.
+
+    Parameters
+    ----------
+    game : Game
+        game object that contains current game state.
+    policies : list of Policy, optional
+        Policy of every player, in the order of players in the game
+        (default is the base Policy for everyone).
+    resumed : bool, default = False
+        indicates whether the game has already been prepared.
+
+    Returns
+    -------
+    Player
+        The winner of the game.
+    """
+    if not resumed:
+        game.prepare_game()
+    if policies is None:
+        policies = [Policy()] * len(game.players())
+    while not game.win():
+        game.is_win()
+        play_turn(game, policies)
+    return game.find_winner()
@@ -0,0 +1,410 @@
+from __future__ import annotations
+from array import array
+from queue import Queue
+from threading import Thread
+from typing import Callable
+import json
+import struct
+import sys
+import zlib
+from classes.board import Board
+from classes.game import Game
+from classes.game_events import EventType
+from classes.simulation import Policy
+from classes.tournament import default_board, new_game
+from classes import simulation
+
+TELEMETRY_MAGIC = b'MTEL'
+TELEMETRY_VERSION = 1
+TELEMETRY_HEADER = struct.Struct('<4sH')
+TELEMETRY_TRAILER = struct.Struct('<Q4s')
+DEFAULT_CHUNK_ROWS = 65536
+DEFAULT_COMPRESSION = 1
+MAX_PENDING_CHUNKS = 4
+
+COLUMNS = (
+    ('game', 'q'),
+    ('turn', 'i'),
+    ('player', 'b'),
+    ('dice1', 'b'),
+    ('dice2', 'b'),
+    ('position', 'i'),
+    ('cash', 'q'),
+    ('field', 'i'),
+    ('rent', 'i'),
+    ('actions', 'I'),
+)
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+
+_turn_end_events = (EventType.CHANGE_PLAYER, EventType.END_GAME)
+
+
+class TelemetryError(Exception):
+    """Raised when telemetry file is invalid."""
+    pass
+
+
+class TelemetryWriter:
+    """Writer of per-turn rows to a columnar, chunked, compressed file.
+
+    Rows are appended to one array per column. A full chunk of rows is
+    handed to a background thread that compresses every column with zlib
+    and writes it, so the simulation only pays for the appends. The file
+    starts with a header and ends with a json footer describing position
+    of every column of every chunk, its length and the file trailer.
+
+    Attributes
+    ----------
+    _fp : BinaryIO
+        Written file.
+    _chunk_rows : int
+        Number of rows in a full chunk.
+    _compression : int
+        zlib compression level.
+    _columns : list of array.array
+        Column buffers of the current chunk.
+    _rows : int
+        Number of rows written, including the current chunk.
+    _chunks : list of dict
+        Footer entries of the written chunks, filled by the thread.
+    _queue : queue.Queue
+        Chunks waiting for the thread, None ends it.
+    _thread : threading.Thread
+        Thread compressing and writing the chunks.
+    _error : BaseException
+        Error raised in the thread, raised again by close.
+    """
+
+    def __init__(self, filename: str, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 compression: int = DEFAULT_COMPRESSION):
+        """Opens the file and starts the writing thread.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the created file.
+        chunk_rows : int, default = DEFAULT_CHUNK_ROWS
+            Number of rows compressed together, a reader loads at least
+            one chunk of a column at once.
+        compression : int, default = DEFAULT_COMPRESSION
+            zlib compression level, from 1 (fastest) to 9.
+        """
+        self._fp = open(filename, 'wb')
+        self._fp.write(TELEMETRY_HEADER.pack(TELEMETRY_MAGIC,
+                                             TELEMETRY_VERSION))
+        self._chunk_rows = chunk_rows
+        self._compression = compression
+        self._columns = self._new_columns()
+        self._rows = 0
+        self._chunks = []
+        self._queue = Queue(MAX_PENDING_CHUNKS)
+        self._error = None
+        self._thread = Thread(target=self._write_chunks, daemon=True)
+        self._thread.start()
+
+    def _new_columns(self) -> list[array]:
+        """Gets empty column buffers."""
+        return [array(typecode) for _, typecode in COLUMNS]
+
+    def rows_num(self) -> int:
+        """Gets number of rows added."""
+        return self._rows
+
+    def add_row(self, game_id: int, turn: int, player: int, dice1: int,
+                dice2: int, position: int, cash: int, field: int,
+                rent: int, actions: int) -> None:
+        """Adds one row, values in the order of COLUMNS."""
+        columns = self._columns
+        columns[0].append(game_id)
+        columns[1].append(turn)
+        columns[2].append(player)
+        columns[3].append(dice1)
+        columns[4].append(dice2)
+        columns[5].append(position)
+        columns[6].append(cash)
+        columns[7].append(field)
+        columns[8].append(rent)
+        columns[9].append(actions)
+        self._rows += 1
+        if len(columns[0]) >= self._chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hands the current chunk to the writing thread."""
+        if not len(self._columns[0]):
+            return
+        if self._error is not None:
+            raise TelemetryError('Writing telemetry failed') from self._error
+        self._queue.put(self._columns)
+        self._columns = self._new_columns()
+
+    def _write_chunks(self) -> None:
+        """Compresses and writes chunks from the queue until None."""
+        while True:
+            columns = self._queue.get()
+            if columns is None:
+                return
+            if self._error is not None:
+                continue
+            try:
+                entry = {'rows': len(columns[0]), 'columns': {}}
+                for (name, _), column in zip(COLUMNS, columns):
+                    data = zlib.compress(column.tobytes(), self._compression)
+                    entry['columns'][name] = [self._fp.tell(), len(data)]
+                    self._fp.write(data)
+                self._chunks.append(entry)
+            except BaseException as error:
+                self._error = error
+
+    def close(self) -> None:
+        """Writes the remaining rows and the footer and closes the file.
+
+        Raises
+        ------
+        TelemetryError
+            If writing in the background thread failed.
+        """
+        if self._fp.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+        try:
+            if self._error is not None:
+                raise TelemetryError(
+                    'Writing telemetry failed') from self._error
+            footer = json.dumps({
+                'version': TELEMETRY_VERSION,
+                'byteorder': sys.byteorder,
+                'columns': [list(column) for column in COLUMNS],
+                'rows': self._rows,
+                'chunks': self._chunks}).encode()
+            self._fp.write(footer)
+            self._fp.write(TELEMETRY_TRAILER.pack(len(footer),
+                                                  TELEMETRY_MAGIC))
+        finally:
+            self._fp.close()
+
+    def __enter__(self) -> TelemetryWriter:
+        """Returns the writer for the with block."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Closes the writer."""
+        self.close()
+
+
+class TelemetryReader:
+    """Reader of files written by TelemetryWriter, column by column.
+
+    Only the footer is read when opening, a column is loaded by reading
+    and decompressing its parts of every chunk.
+
+    Attributes
+    ----------
+    _filename : str
+        Name of the read file.
+    _footer : dict
+        Decoded json footer.
+    _typecodes : dict of str to str
+        Array typecode of every column.
+    """
+
+    def __init__(self, filename: str):
+        """Reads the footer of the file.
+
+        Raises
+        ------
+        TelemetryError
+            If the file is not a complete telemetry file.
+        """
+        self._filename = filename
+        with open(filename, 'rb') as fp:
+            header = fp.read(TELEMETRY_HEADER.size)
+            if len(header) < TELEMETRY_HEADER.size or \
+                    TELEMETRY_HEADER.unpack(header) != \
+                    (TELEMETRY_MAGIC, TELEMETRY_VERSION):
+                raise TelemetryError('Unknown telemetry format')
+            end = fp.seek(0, 2)
+            if end < TELEMETRY_HEADER.size + TELEMETRY_TRAILER.size:
+                raise TelemetryError('Telemetry file is truncated')
+            fp.seek(end - TELEMETRY_TRAILER.size)
+            footer_size, magic = TELEMETRY_TRAILER.unpack(
+                fp.read(TELEMETRY_TRAILER.size))
+            if magic != TELEMETRY_MAGIC:
+                raise TelemetryError('Telemetry file is truncated')
+            fp.seek(end - TELEMETRY_TRAILER.size - footer_size)
+            self._footer = json.loads(fp.read(footer_size))
+        self._typecodes = dict(self._footer['columns'])
+
+    def column_names(self) -> tuple[str]:
+        """Gets names of the columns in the file."""
+        return tuple(self._typecodes)
+
+    def rows_num(self) -> int:
+        """Gets number of rows in the file."""
+        return self._footer['rows']
+
+    def chunks_num(self) -> int:
+        """Gets number of chunks in the file."""
+        return len(self._footer['chunks'])
+
+    def column(self, name: str, chunks: range = None) -> array:
+        """Loads values of one column.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+        chunks : range, optional
+            Indices of the loaded chunks (default is all chunks).
+
+        Returns
+        -------
+        array.array
+
+        Raises
+        ------
+        KeyError
+            If there is no column with given name.
+        """
+        values = array(self._typecodes[name])
+        entries = self._footer['chunks']
+        if chunks is not None:
+            entries = [entries[index] for index in chunks]
+        with open(self._filename, 'rb') as fp:
+            for entry in entries:
+                offset, length = entry['columns'][name]
+                fp.seek(offset)
+                values.frombytes(zlib.decompress(fp.read(length)))
+        if self._footer['byteorder'] != sys.byteorder:
+            values.byteswap()
+        return values
+
+    def columns(self, names: tuple[str] = COLUMN_NAMES
+                ) -> dict[str, array]:
+        """Loads given columns."""
+        return {name: self.column(name) for name in names}
+
+
+class TurnRecorder:
+    """Game recorder turning game events into per-turn telemetry rows.
+
+    Attached like EventLog, it receives every transition of the game and
+    adds a row when the player changes or the game ends: dice, field
+    landed on, rent paid and a bit mask of EventType of all events of the
+    turn, with position and cash of the player at the end of the turn.
+
+    Attributes
+    ----------
+    _writer : TelemetryWriter
+        Writer the rows are added to.
+    _game_id : int
+        Value of the game column.
+    _game : Game
+        Recorded game, None when nothing is being recorded.
+    _turn : int
+        Index of the current turn.
+    _player : int
+        Index of the player of the current turn, None before his first
+        event.
+    _dice : tuple of int
+        Dice rolled in the turn, zeros if none.
+    _field : int
+        Field landed on in the turn, -1 if the pawn did not move.
+    _rent : int
+        Rent paid in the turn.
+    _actions : int
+        Bit mask of types of events of the turn.
+    """
+
+    def __init__(self, writer: TelemetryWriter, game_id: int = 0):
+        """Initiates recorder adding rows to the writer."""
+        self._writer = writer
+        self._game_id = game_id
+        self._game = None
+        self._turn = 0
+        self._new_turn()
+
+    def _new_turn(self) -> None:
+        """Clears values gathered for the current turn."""
+        self._player = None
+        self._dice = (0, 0)
+        self._field = -1
+        self._rent = 0
+        self._actions = 0
+
+    def attach(self, game: Game) -> None:
+        """Starts recording given game."""
+        self._game = game
+        game.set_recorder(self)
+
+    def detach(self) -> None:
+        """Stops recording the game, adding row of an unfinished turn."""
+        if self._game is not None:
+            self._end_turn()
+            self._game.set_recorder(None)
+        self._game = None
+
+    def record(self, event_type: EventType, player_index: int,
+               value: int = 0, amount: int = 0) -> None:
+        """Gathers values of the event, see EventLog.record."""
+        if event_type in _turn_end_events:
+            self._end_turn()
+            return
+        if self._player is None:
+            self._player = player_index
+        self._actions |= 1 << event_type
+        if event_type == EventType.DICE_ROLL:
+            self._dice = (value, amount)
+        elif event_type == EventType.MOVE:
+            self._field = value
+        elif event_type == EventType.PAY_RENT:
+            self._rent += amount
+
+    def _end_turn(self) -> None:
+        """Adds row of the finished turn if its player did anything."""
+        if self._player is not None:
+            player = self._game.players()[self._player]
+            position = player.current_pawn_position()
+            self._writer.add_row(
+                self._game_id, self._turn, self._player, self._dice[0],
+                self._dice[1], -1 if position is None else position,
+                player.money(), self._field, self._rent, self._actions)
+            self._turn += 1
+        self._new_turn()
+
+
+def record_games(filename: str, seeds: list[int], policies: list[Policy],
+                 board_factory: Callable[[], Board] = default_board,
+                 chunk_rows: int = DEFAULT_CHUNK_ROWS) -> int:
+    """Plays headless games and writes their per-turn telemetry.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the created telemetry file.
+    seeds : list of int
+        Seed of every game, also used as its game column.
+    policies : list of Policy
+        Policy of every player.
+    board_factory : callable, optional
+        Function creating new board (default is the shipped board).
+    chunk_rows : int, default = DEFAULT_CHUNK_ROWS
+        Number of rows compressed together.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+    """
+    with TelemetryWriter(filename, chunk_rows) as writer:
+        for seed in seeds:
+            game = new_game(seed, len(policies), board_factory)
+            recorder = TurnRecorder(writer, seed)
+            recorder.attach(game)
+            simulation.play(game, policies, resumed=True)
+            recorder.detach()
+        return writer.rows_num()
@@ -0,0 +1,247 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, NamedTuple
+import os
+from classes.board import Board
+from classes.board_loader import BoardDefinition, load_board_definition
+from classes.game import Game
+from classes.player import Player
+from classes.simulation import Policy
+from classes import simulation
+
+_definition: BoardDefinition = None
+
+
+class GameResult(NamedTuple):
+    """Result of one simulated game.
+
+    Attributes
+    ----------
+    seed : int
+        Seed of the game, enough to replay it.
+    winner : int
+        Index of the winner in players list, None if nobody won.
+    rounds : int
+        Number of rounds played.
+    fortunes : tuple of float
+        Final total fortune of every player.
+    """
+    seed: int
+    winner: int
+    rounds: int
+    fortunes: tuple
+
+
+class TournamentStats:
+    """Aggregate statistics of many simulated games.
+
+    Attributes
+    ----------
+    _players_num : int
+        Number of players in every game.
+    _games : int
+        Number of games added to the statistics.
+    _wins : list of int
+        Number of wins of every seat.
+    _no_winner : int
+        Number of games without a winner.
+    _rounds_sum : int
+        Sum of rounds of all games.
+    _fortunes_sum : list of float
+        Sum of final fortunes of every seat.
+    """
+
+    def __init__(self, players_num: int):
+        """Initiates empty statistics for games of players_num players."""
+        self._players_num = players_num
+        self._games = 0
+        self._wins = [0] * players_num
+        self._no_winner = 0
+        self._rounds_sum = 0
+        self._fortunes_sum = [0] * players_num
+
+    def add(self, result: GameResult) -> None:
+        """Adds result of one game to the statistics."""
+        self._games += 1
+        if result.winner is None:
+            self._no_winner += 1
+        else:
+            self._wins[result.winner] += 1
+        self._rounds_sum += result.rounds
+        for seat, fortune in enumerate(result.fortunes):
+            self._fortunes_sum[seat] += fortune
+
+    def merge(self, other: TournamentStats) -> None:
+        """Adds statistics gathered by another runner."""
+        self._games += other._games
+        self._no_winner += other._no_winner
+        self._rounds_sum += other._rounds_sum
+        for seat in range(self._players_num):
+            self._wins[seat] += other._wins[seat]
+            self._fortunes_sum[seat] += other._fortunes_sum[seat]
+
+    def games(self) -> int:
+        """Gets number of games."""
+        return self._games
+
+    def wins(self) -> list[int]:
+        """Gets number of wins of every seat."""
+        return self._wins
+
+    def no_winner(self) -> int:
+        """Gets number of games without a winner."""
+        return self._no_winner
+
+    def win_rates(self) -> list[float]:
+        """Gets fraction of games won by every seat."""
+        return [wins / self._games for wins in self._wins]
+
+    def mean_rounds(self) -> float:
+        """Gets mean number of rounds in a game."""
+        return self._rounds_sum / self._games
+
+    def mean_fortunes(self) -> list[float]:
+        """Gets mean final fortune of every seat."""
+        return [fortune / self._games for fortune in self._fortunes_sum]
+
+
+def default_board() -> Board:
+    """Creates new board from the shipped json database.
+
+    The database is read and validated once per process, every board is
+    built from the same definition.
+    """
+    global _definition
+    if _definition is None:
+        _definition = load_board_definition()
+    return _definition.build_board()
+
+
+def game_seed(base_seed: int, game_index: int) -> int:
+    """Gets seed of game with given index in the tournament."""
+    return (base_seed << 32) + game_index
+
+
+def new_game(seed: int, players_num: int,
+             board_factory: Callable[[], Board] = default_board) -> Game:
+    """Creates prepared game with given seed and unnamed players."""
+    players = [Player(f'player{seat}') for seat in range(players_num)]
+    game = Game(board_factory(), players, seed)
+    game.prepare_game()
+    return game
+
+
+def play_seeded_game(seed: int, policies: list[Policy],
+                     board_factory: Callable[[], Board] = default_board
+                     ) -> GameResult:
+    """Plays one headless game and returns its result.
+
+    Parameters
+    ----------
+    seed : int
+        Seed of the game.
+    policies : list of Policy
+        Policy of every player, number of policies is number of players.
+    board_factory : callable, optional
+        Function creating new board (default is the shipped board).
+
+    Returns
+    -------
+    GameResult
+    """
+    game = new_game(seed, len(policies), board_factory)
+    winner = simulation.play(game, policies, resumed=True)
+    players = game.players()
+    return GameResult(
+        seed,
+        None if winner is None else players.index(winner),
+        game.get_round_num(),
+        tuple(game.total_fortune(player) for player in players))
+
+
+def replay_game(seed: int, policies: list[Policy],
+                board_factory: Callable[[], Board] = default_board) -> Game:
+    """Plays again the game with given seed and returns its final state."""
+    game = new_game(seed, len(policies), board_factory)
+    simulation.play(game, policies, resumed=True)
+    return game
+
+
+def play_batch(seeds: list[int], policies: list[Policy],
+               board_factory: Callable[[], Board] = default_board
+               ) -> tuple[TournamentStats, list[GameResult]]:
+    """Plays games with given seeds one after another.
+
+    Returns
+    -------
+    tuple of TournamentStats and list of GameResult
+        Statistics of the batch and results of its games.
+    """
+    stats = TournamentStats(len(policies))
+    results = []
+    for seed in seeds:
+        result = play_seeded_game(seed, policies, board_factory)
+        stats.add(result)
+        results.append(result)
+    return stats, results
+
+
+def run_tournament(games_num: int,
+                   policies: list[Policy] = None,
+                   base_seed: int = 0,
+                   workers: int = None,
+                   batch_size: int = 256,
+                   board_factory: Callable[[], Board] = default_board
+                   ) -> tuple[TournamentStats, list[GameResult]]:
+    """Plays many headless games spread over worker processes.
+
+    Games are split into batches of batch_size games, so the cost of
+    sending work to the processes is paid once per batch. Every batch
+    gathers its own statistics, which are merged by this process. Game
+    with index i gets seed game_seed(base_seed, i), so the results do not
+    depend on number of workers and every game can be replayed with
+    replay_game.
+
+    Parameters
+    ----------
+    games_num : int
+        Number of games to play.
+    policies : list of Policy, optional
+        Policy of every player (default is two players with base Policy).
+        Policies and board_factory must be picklable.
+    base_seed : int, default = 0
+        Seed of the whole tournament.
+    workers : int, optional
+        Number of worker processes (default is number of cpu cores).
+        With one worker games are played in the current process.
+    batch_size : int, default = 256
+        Number of games sent to a worker at once.
+    board_factory : callable, optional
+        Function creating new board (default is the shipped board).
+
+    Returns
+    -------
+    tuple of TournamentStats and list of GameResult
+        Aggregate statistics and results of every game in seed order.
+    """
+    if policies is None:
+        policies = [Policy(), Policy()]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    seeds = [game_seed(base_seed, index) for index in range(games_num)]
+    batches = [seeds[start:start + batch_size]
+               for start in range(0, games_num, batch_size)]
+    if workers == 1:
+        batch_results = [play_batch(batch, policies, board_factory)
+                         for batch in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(play_batch, batch, policies,
+                                       board_factory) for batch in batches]
+            batch_results = [future.result() for future in futures]
+    stats = TournamentStats(len(policies))
+    results = []
+    for batch_stats, batch in batch_results:
+        stats.merge(batch_stats)
+        results += batch
+    return stats, results
@@ -0,0 +1,13 @@
+from itertools import count
+
+_versions = count(1)
+
+
+def new_version() -> int:
+    """Gets state version number never given before.
+
+    Numbers are unique among all fields and players, also copied and
+    forked ones, so a table rendered for one version is valid only for
+    the state it was rendered in.
+    """
+    return next(_versions)
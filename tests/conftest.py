@@ -0,0 +1,16 @@
+from classes.board_loader import load_board
+from classes.game import Game
+from classes.player import Player
+import pytest
+
+
+@pytest.fixture
+def new_game():
+    """Gets a function creating games on the shipped board."""
+    def create_game(players_num=2, seed=None, prepared=False):
+        players = [Player(f'player{i}') for i in range(players_num)]
+        game = Game(load_board(), players, seed)
+        if prepared:
+            game.prepare_game()
+        return game
+    return create_game
@@ -0,0 +1,34 @@
+from benchmarks.cases import BENCHMARKS
+from benchmarks.run import measure, run_benchmarks, compare
+from benchmarks.run import save_results, load_results
+import json
+import pytest
+
+
+def test_every_benchmark_runs():
+    for benchmark in BENCHMARKS:
+        for fields_num in (10, 30):
+            result = measure(benchmark, fields_num, repeats=1, min_time=0)
+            assert result['ops'] > 0
+            assert result['best_ns'] > 0
+
+
+def test_compare_flags_regressions(tmp_path):
+    results = run_benchmarks((10,), ['total_fortune', 'pay_rent'],
+                             repeats=1, min_time=0)
+    filename = str(tmp_path / 'results.json')
+    save_results(results, filename)
+    baseline = load_results(filename)
+    baseline['results']['total_fortune/10']['best_ns'] /= 10
+    baseline['results']['pay_rent/10']['best_ns'] *= 10
+    statuses = {row[0]: row[4] for row in compare(results, baseline)}
+    assert statuses == {'total_fortune/10': 'regression',
+                        'pay_rent/10': 'improvement'}
+    assert all(row[4] == 'ok' for row in compare(results, results))
+
+
+def test_load_results_version(tmp_path):
+    filename = tmp_path / 'results.json'
+    filename.write_text(json.dumps({'version': 0, 'results': {}}))
+    with pytest.raises(ValueError):
+        load_results(str(filename))
@@ -63,3 +63,39 @@ class TestBoard:
                       self.chance_cards)
         assert board.get_new_chance_card() == self.chance_cards[0]
         assert board.get_new_chance_card() == self.chance_cards[1]
+
+    def test_get_colour_group_ids(self):
+        board = Board(self.property_fields, self.num_of_colour)
+        assert board.get_colour_group_ids(5) == (5, 7)
+        assert board.get_colour_group_ids(7) is board.get_colour_group_ids(5)
+        with pytest.raises(ColourError):
+            board.get_colour_group_ids(0)
+
+    def test_colour_groups_built_once(self):
+        board = Board(self.property_fields, self.num_of_colour)
+        assert board.get_all_fields_of_colour(self.colour) is \
+            board.get_all_fields_of_colour(self.colour)
+
+    def test_fork_shares_fields_until_used(self):
+        board = Board(ffjson.property_fields_from_json(self.PROPERTY_FIELDS),
+                      self.num_of_colour,
+                      ffjson.special_fields_from_json(self.SPECIAL_FIELDS))
+        player = Player()
+        forked_player = Player()
+        board.get_field_by_id(6).set_owner(player)
+        forked = board.fork({player: forked_player})
+        assert forked._all_fields == {}
+        assert forked.get_field_by_id(0) is board.get_field_by_id(0)
+        field = forked.get_field_by_id(6)
+        assert field is not board.get_field_by_id(6)
+        assert field is forked.get_field_by_id(6)
+        assert field.owner() is forked_player
+        assert board.get_fields_owner(6) is player
+        field.do_mortgage()
+        assert not board.get_field_by_id(6).is_mortgaged()
+        assert forked.get_all_fields_of_colour('yellow')[0] is field
+        assert len(forked.colour_groups()) == len(board.colour_groups())
+        with pytest.raises(KeyError):
+            forked.get_field_by_id(100)
+        with pytest.raises(ColourError):
+            forked.get_all_fields_of_colour('turqoise')
@@ -0,0 +1,98 @@
+from classes.board_generator import synthetic_board_data, synthetic_board
+from classes.board_generator import write_board_files
+from classes.board_loader import load_board_definition
+from classes.chance_card import ChanceFieldAction, chance_action_values
+from classes.game import Game
+from classes.landing_analysis import transition_matrix
+from classes.player import Player
+from classes.simulation import BuilderPolicy, Policy
+from classes import simulation
+import classes.fields_from_json as ffjson
+import pytest
+
+
+def test_synthetic_board_data():
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        synthetic_board_data(100)
+    field_ids = [field['field_id']
+                 for field in property_fields + special_fields]
+    assert sorted(field_ids) == list(range(100))
+    colours = {}
+    for field in property_fields:
+        colours[field['colour']] = colours.get(field['colour'], 0) + 1
+    assert colours == number_of_colour
+    assert synthetic_board_data(100) == synthetic_board_data(100)
+
+
+def test_group_sizes_and_deck():
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        synthetic_board_data(21, group_sizes=(2, 4), special_every=0,
+                             property_group_every=0, cards_num=3,
+                             card_money_step=25)
+    assert special_fields == [{'field_id': 0, 'name': 'start'}]
+    assert list(number_of_colour.values()) == [2, 4, 2, 4, 2, 4, 2]
+    assert all(field['type'] == 'street' for field in property_fields)
+    assert [card['money'] for card in chance_cards] == [25, 50, 75]
+
+
+def test_all_card_actions_are_playable():
+    actions = tuple(chance_action_values())
+    board = synthetic_board(60, cards_num=70, card_actions=actions)
+    cards = board.chance_deck().cards()
+    assert [card.action() for card in cards[:len(actions)]] == list(actions)
+    assert all(card.field_id() < 60 for card in cards
+               if card.action() == ChanceFieldAction.MOVE.value)
+    for seed in range(5):
+        game = Game(synthetic_board(60, special_every=2, cards_num=70,
+                                    card_actions=actions),
+                    [Player('a'), Player('b'), Player('c')], seed)
+        simulation.play(game, [Policy(), BuilderPolicy(), Policy()])
+        assert game.board().chance_card_position() > 0
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        synthetic_board_data(1)
+    with pytest.raises(ValueError):
+        synthetic_board_data(10, group_sizes=(3, 0))
+    with pytest.raises(ValueError):
+        synthetic_board_data(10, card_actions=('bancrupt',))
+    with pytest.raises(ValueError):
+        synthetic_board_data(3, card_actions=('go to jail',))
+
+
+def test_synthetic_board_files(tmp_path):
+    files = write_board_files(str(tmp_path), 50)
+    fields = ffjson.property_fields_from_json(files[0])
+    board = synthetic_board(50)
+    assert [field.field_id() for field in fields] == \
+        list(board.property_field_ids())
+
+
+def test_generated_files_pass_validation(tmp_path):
+    files = write_board_files(str(tmp_path), 2000, group_sizes=(2, 3, 4))
+    board = load_board_definition(files).build_board()
+    assert board.max_field_id() == 1999
+
+
+def test_pawns_walk_the_whole_board():
+    board = synthetic_board(1000)
+    game = Game(board, [Player('a'), Player('b')], seed=0)
+    game.prepare_game()
+    player = game.current_player()
+    player.set_position(995, board.max_field_id())
+    player.set_dice_roll_sum(12)
+    player.move_pawn(board.max_field_id())
+    assert player.current_pawn_position() == 7
+    assert player.passed_start_field
+    positions = set()
+    for _ in range(200):
+        game.dice_roll()
+        game.move_pawn_number_of_dots()
+        positions.add(player.current_pawn_position())
+    assert max(positions) > 100
+
+
+def test_landing_analysis_board_size():
+    matrix = transition_matrix(synthetic_board(40))
+    assert matrix.shape == (40, 40)
@@ -0,0 +1,112 @@
+from classes.board_image import BoardImage, BoardImageError, ImageBoardFactory
+from classes.board_image import board_image_file, image_bytes
+from classes.board_image import image_directory, IMAGE_HEADER
+from classes.board_image import IMAGE_MAGIC, IMAGE_VERSION
+from classes.board_image import open_board_image, write_board_image
+from classes.board_generator import write_board_files
+from classes.board_loader import load_board, load_board_definition
+from classes.field import PropertyField, Street
+from classes.simulation import BuilderPolicy, Policy
+from classes.tournament import play_seeded_game, run_tournament
+import os
+import pickle
+import pytest
+
+
+def field_data(board):
+    data = []
+    for field_id in range(board.max_field_id() + 1):
+        field = board.get_field_by_id(field_id)
+        row = [type(field), field.name()]
+        if isinstance(field, PropertyField):
+            row += [field.colour(), field.price(), field.mortgage_price(),
+                    field.rent_row()]
+        if isinstance(field, Street):
+            row += [field.house_cost(), field.hotel_cost()]
+        data.append(row)
+    return data
+
+
+def card_data(card):
+    return (card.card_id(), str(card), card.action(), card.money(),
+            card.field_id(), card._house_cost, card._hotel_cost)
+
+
+def test_image_builds_same_board(tmp_path):
+    filename = str(tmp_path / 'board.img')
+    write_board_image(load_board_definition(), filename)
+    board = BoardImage(filename).build_board()
+    shipped = load_board()
+    assert field_data(board) == field_data(shipped)
+    assert board.property_field_ids() == shipped.property_field_ids()
+    assert board.colour_groups().keys() == shipped.colour_groups().keys()
+    assert [card_data(card) for card in board.chance_deck().cards()] == \
+        [card_data(card) for card in shipped.chance_deck().cards()]
+
+
+def test_synthetic_board_image(tmp_path):
+    files = write_board_files(str(tmp_path), 500, group_sizes=(2, 3))
+    filename = board_image_file(files, str(tmp_path))
+    image = open_board_image(filename)
+    assert open_board_image(filename) is image
+    assert image.definition_hash() == \
+        load_board_definition(files).definition_hash()
+    assert field_data(image.build_board()) == field_data(load_board(files))
+
+
+def test_image_file_named_by_hash(tmp_path):
+    first = board_image_file(directory=str(tmp_path))
+    second = board_image_file(directory=str(tmp_path))
+    assert first == second
+    assert load_board_definition().definition_hash().hex() in first
+
+
+def test_stale_image_file_rewritten(tmp_path):
+    filename = board_image_file(directory=str(tmp_path))
+    data = open(filename, 'rb').read()
+    stale = IMAGE_HEADER.pack(IMAGE_MAGIC, IMAGE_VERSION - 1,
+                              *IMAGE_HEADER.unpack_from(data)[2:])
+    with open(filename, 'wb') as fp:
+        fp.write(stale + data[IMAGE_HEADER.size:])
+    assert board_image_file(directory=str(tmp_path)) == filename
+    assert open(filename, 'rb').read() == data
+    other = image_bytes(load_board_definition(
+        write_board_files(str(tmp_path), 20)))
+    with open(filename, 'wb') as fp:
+        fp.write(other)
+    board_image_file(directory=str(tmp_path))
+    assert open(filename, 'rb').read() == data
+
+
+def test_default_image_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    filename = board_image_file()
+    assert os.path.dirname(filename) == image_directory()
+    assert image_directory().startswith(str(tmp_path))
+    assert f'-v{IMAGE_VERSION}-' in os.path.basename(filename)
+
+
+def test_invalid_images(tmp_path):
+    filename = tmp_path / 'board.img'
+    filename.write_bytes(b'')
+    with pytest.raises(BoardImageError):
+        BoardImage(str(filename))
+    data = image_bytes(load_board_definition())
+    filename.write_bytes(b'XXXX' + data[4:])
+    with pytest.raises(BoardImageError):
+        BoardImage(str(filename))
+    filename.write_bytes(data[:-1])
+    with pytest.raises(BoardImageError):
+        BoardImage(str(filename))
+
+
+def test_factory_plays_same_games(tmp_path):
+    factory = ImageBoardFactory(board_image_file(directory=str(tmp_path)))
+    factory = pickle.loads(pickle.dumps(factory))
+    policies = [BuilderPolicy(), Policy()]
+    for seed in range(5):
+        assert play_seeded_game(seed, policies, factory) == \
+            play_seeded_game(seed, policies)
+    stats, results = run_tournament(6, policies, workers=2, batch_size=3,
+                                    board_factory=factory)
+    assert results == run_tournament(6, policies, workers=1)[1]
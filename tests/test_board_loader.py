@@ -0,0 +1,124 @@
+from classes.board_loader import load_board, load_board_definition
+from classes.board_loader import BoardDefinition, BoardDefinitionError
+from classes.board_loader import DATABASE_FILES, read_files, definition_hash
+from classes.fields_from_json import property_fields_from_data
+from classes.fields_from_json import DoubleFieldIdError
+import json
+import pytest
+
+
+def shipped_data():
+    contents = read_files(DATABASE_FILES)
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        [json.loads(content) for content in contents]
+    return property_fields, number_of_colour[0], special_fields, chance_cards
+
+
+def test_load_board_definition_cached():
+    first = load_board_definition()
+    second = load_board_definition()
+    assert first is second
+    assert first.definition_hash() == \
+        definition_hash(read_files(DATABASE_FILES))
+
+
+def test_load_board_independent_boards():
+    first = load_board()
+    second = load_board()
+    field = first.get_field_by_id(5)
+    assert field is not second.get_field_by_id(5)
+    field.add_house()
+    assert second.get_field_by_id(5).houses_num() == 0
+    assert first.get_max_number_of_same_colour('grey') == 2
+
+
+def test_load_board_definition_changed_file(tmp_path):
+    files = []
+    for filename in DATABASE_FILES:
+        copy = tmp_path / filename.split('/')[-1]
+        with open(filename, 'rb') as fp:
+            copy.write_bytes(fp.read())
+        files.append(str(copy))
+    files = tuple(files)
+    original = load_board_definition(files)
+    assert original.definition_hash() == \
+        load_board_definition().definition_hash()
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        shipped_data()
+    property_fields[0]['rent'] += 1
+    with open(files[0], 'w') as fp:
+        json.dump(property_fields, fp)
+    changed = load_board_definition(files)
+    assert changed is not original
+    assert changed.definition_hash() != original.definition_hash()
+
+
+def test_validate_missing_field_id():
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        shipped_data()
+    special_fields = special_fields[1:]
+    with pytest.raises(BoardDefinitionError):
+        BoardDefinition(b'', property_fields, number_of_colour,
+                        special_fields, chance_cards)
+
+
+def test_validate_repeated_field_id():
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        shipped_data()
+    special_fields[0]['field_id'] = property_fields[0]['field_id']
+    with pytest.raises(BoardDefinitionError):
+        BoardDefinition(b'', property_fields, number_of_colour,
+                        special_fields, chance_cards)
+
+
+def test_validate_colour_mismatch():
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        shipped_data()
+    property_fields[0]['colour'] = 'Grey'
+    with pytest.raises(BoardDefinitionError):
+        BoardDefinition(b'', property_fields, number_of_colour,
+                        special_fields, chance_cards)
+
+
+def test_validate_repeated_card_id():
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        shipped_data()
+    chance_cards[1]['card_id'] = chance_cards[0]['card_id']
+    with pytest.raises(BoardDefinitionError):
+        BoardDefinition(b'', property_fields, number_of_colour,
+                        special_fields, chance_cards)
+
+
+def test_validate_card_actions():
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        shipped_data()
+    chance_cards[0]['action'] = 'bancrupt'
+    with pytest.raises(BoardDefinitionError):
+        BoardDefinition(b'', property_fields, number_of_colour,
+                        special_fields, chance_cards)
+    chance_cards[0]['action'] = 'move'
+    chance_cards[0]['field_id'] = len(property_fields + special_fields)
+    with pytest.raises(BoardDefinitionError):
+        BoardDefinition(b'', property_fields, number_of_colour,
+                        special_fields, chance_cards)
+
+
+def test_property_fields_from_data_repeated_id():
+    property_fields = shipped_data()[0]
+    property_fields.append(dict(property_fields[0]))
+    with pytest.raises(DoubleFieldIdError):
+        property_fields_from_data(property_fields)
+
+
+def test_validate_missing_keys():
+    for file_index, key in ((0, 'rent'), (2, 'name'), (3, 'action')):
+        data = list(shipped_data())
+        del data[file_index][0][key]
+        with pytest.raises(BoardDefinitionError):
+            BoardDefinition(b'', *data)
+    property_fields, number_of_colour, special_fields, chance_cards = \
+        shipped_data()
+    special_fields[0] = 'start'
+    with pytest.raises(BoardDefinitionError):
+        BoardDefinition(b'', property_fields, number_of_colour,
+                        special_fields, chance_cards)
@@ -1,4 +1,5 @@
 from classes.chance_card import ChanceCard, ChanceFieldAction, ActionError
+from classes.game_constants import GameConstants
 from classes.player import Player
 import pytest
 
@@ -33,3 +34,96 @@ def test_chance_card_description():
     card = ChanceCard(card_id=0, description="School tax",
                       action=ChanceFieldAction.EARN.value, money=150)
     assert card.description() == "School tax"
+
+
+def test_chance_card_move(new_game):
+    card = ChanceCard(0, 'Advance to Go', ChanceFieldAction.MOVE.value,
+                      field_id=0)
+    game = new_game(3, prepared=True)
+    player = game.current_player()
+    player.set_position(8)
+    money = player.money()
+    card.use_card(player, game)
+    assert player.current_pawn_position() == 0
+    assert player.money() == money + GameConstants.START_FIELD_BONUS
+    card = ChanceCard(1, 'Boardwalk', ChanceFieldAction.MOVE.value,
+                      field_id=7)
+    card.use_card(player, game)
+    assert player.current_pawn_position() == 7
+    assert player.money() == money + GameConstants.START_FIELD_BONUS
+    assert card.amount_due(player, game) == 0
+
+
+def test_chance_card_move_needs_field():
+    with pytest.raises(ActionError):
+        ChanceCard(0, 'Advance', ChanceFieldAction.MOVE.value)
+
+
+def test_chance_card_go_to_jail():
+    card = ChanceCard(0, 'Go to jail', ChanceFieldAction.GO_TO_JAIL.value)
+    player = Player()
+    player.set_position(6)
+    card.use_card(player)
+    assert not player.is_in_jail()
+    assert player.current_pawn_position() == GameConstants.JAIL_FIELD_ID
+    assert player.money() == 0
+
+
+def test_chance_card_pay_each(new_game):
+    card = ChanceCard(0, 'Chairman', ChanceFieldAction.PAY_EACH.value, 50)
+    game = new_game(4, prepared=True)
+    player, first, second, bancrupt = game.players()
+    bancrupt.is_bancrupt = True
+    money = [other.money() for other in game.players()]
+    assert card.amount_due(player, game) == 100
+    card.use_card(player, game)
+    assert [other.money() for other in game.players()] == \
+        [money[0] - 100, money[1] + 50, money[2] + 50, money[3]]
+    with pytest.raises(ActionError):
+        card.use_card(player)
+
+
+def test_chance_card_collect_each(new_game):
+    card = ChanceCard(0, 'Birthday', ChanceFieldAction.COLLECT_EACH.value,
+                      10)
+    game = new_game(3, prepared=True)
+    player, first, poor = game.players()
+    poor._money = 4
+    money = player.money()
+    assert card.amount_due(player, game) == 0
+    card.use_card(player, game)
+    assert player.money() == money + 14
+    assert poor.money() == 0
+
+
+def test_chance_card_repairs(new_game):
+    card = ChanceCard(0, 'Repairs', ChanceFieldAction.REPAIRS.value,
+                      house_cost=25, hotel_cost=100)
+    game = new_game(3, prepared=True)
+    player = game.current_player()
+    player._money = 10000
+    for field_id in (5, 7):
+        player.set_position(field_id)
+        game.buy_current_property()
+    for _ in range(4):
+        game.build_house(game.get_field_by_id(5))
+        game.build_house(game.get_field_by_id(7))
+    game.build_hotel(game.get_field_by_id(5))
+    game.get_field_by_id(7).remove_house()
+    assert card.amount_due(player, game) == 100 + 3 * 25
+    money = player.money()
+    card.use_card(player, game)
+    assert player.money() == money - 175
+
+
+def test_game_uses_drawn_card(new_game):
+    game = new_game(3, prepared=True)
+    player = game.current_player()
+    cards = game.board().chance_deck().cards()
+    card = game.get_new_chance_card()
+    assert card is cards[0]
+    money = player.money()
+    assert game.chance_field_action(card) == str(card)
+    assert player.money() == money + card.money()
+    assert game.board().chance_card_position() == 1
+    assert game.chance_card_amount(cards[1]) == cards[1].money()
@@ -0,0 +1,108 @@
+from classes.chance_card import ChanceCard, ChanceFieldAction
+from classes.chance_deck import ChanceDeck
+from classes.game_state import GameState
+import pytest
+
+
+def new_cards(cards_num=8):
+    return [ChanceCard(card_id, f'card {card_id}',
+                       ChanceFieldAction.EARN.value, card_id)
+            for card_id in range(cards_num)]
+
+
+def drawn_ids(deck, draws_num):
+    return [deck.draw().card_id() for _ in range(draws_num)]
+
+
+def test_unseeded_deck_keeps_order():
+    deck = ChanceDeck(new_cards(3))
+    assert drawn_ids(deck, 7) == [0, 1, 2, 0, 1, 2, 0]
+    assert deck.position() == 7
+
+
+def test_seeded_deck_is_shuffled_repeatably():
+    first = drawn_ids(ChanceDeck(new_cards(), seed=5), 8)
+    assert sorted(first) == list(range(8))
+    assert drawn_ids(ChanceDeck(new_cards(), seed=5), 8) == first
+    orders = {tuple(drawn_ids(ChanceDeck(new_cards(), seed), 8))
+              for seed in range(10)}
+    assert len(orders) > 1
+
+
+def test_deck_is_reshuffled_when_exhausted():
+    deck = ChanceDeck(new_cards(), seed=3)
+    passes = [drawn_ids(deck, 8) for _ in range(5)]
+    for deck_pass in passes:
+        assert sorted(deck_pass) == list(range(8))
+    assert len(set(map(tuple, passes))) > 1
+
+
+def test_shuffle_starts_deck_again():
+    deck = ChanceDeck(new_cards())
+    deck.draw()
+    deck.shuffle(5)
+    assert deck.position() == 0
+    assert deck.seed() == 5
+    assert drawn_ids(deck, 8) == drawn_ids(ChanceDeck(new_cards(), 5), 8)
+
+
+def test_set_position_restores_next_cards():
+    deck = ChanceDeck(new_cards(), seed=11)
+    drawn = drawn_ids(deck, 30)
+    for position in (0, 5, 8, 21):
+        other = ChanceDeck(new_cards(), seed=11)
+        other.set_position(position)
+        assert drawn_ids(other, 30 - position) == drawn[position:]
+    deck.set_position(2)
+    assert drawn_ids(deck, 3) == drawn[2:5]
+
+
+def test_copy_is_independent():
+    deck = ChanceDeck(new_cards(), seed=2)
+    drawn_ids(deck, 6)
+    copy = deck.copy()
+    assert copy.cards() is deck.cards()
+    assert drawn_ids(copy, 10) == drawn_ids(deck, 10)
+    copy.draw()
+    assert copy.position() == deck.position() + 1
+
+
+def test_empty_deck():
+    deck = ChanceDeck([], seed=1)
+    assert len(deck) == 0
+    with pytest.raises(IndexError):
+        deck.draw()
+
+
+def test_game_seed_shuffles_board_deck(new_game):
+    game = new_game(seed=7)
+    board = game.board()
+    assert board.chance_deck().seed() == 7
+    drawn = [board.get_new_chance_card().card_id() for _ in range(12)]
+    other = new_game(seed=7).board()
+    assert [other.get_new_chance_card().card_id()
+            for _ in range(12)] == drawn
+    unseeded = new_game().board()
+    assert unseeded.chance_deck().seed() is None
+    assert [unseeded.get_new_chance_card() for _ in range(2)] == \
+        list(unseeded.chance_deck().cards()[:2])
+
+
+def test_game_state_restores_deck_position(new_game):
+    game = new_game(seed=9)
+    board = game.board()
+    for _ in range(5):
+        board.get_new_chance_card()
+    state = GameState.capture(game)
+    drawn = [board.get_new_chance_card() for _ in range(10)]
+    state.restore(game)
+    assert board.chance_card_position() == 5
+    assert [board.get_new_chance_card() for _ in range(10)] == drawn
+
+
+def test_forked_game_has_own_deck(new_game):
+    game = new_game(seed=4)
+    fork = game.fork()
+    drawn = [fork.board().get_new_chance_card() for _ in range(3)]
+    assert game.board().chance_card_position() == 0
+    assert [game.board().get_new_chance_card() for _ in range(3)] == drawn
@@ -0,0 +1,39 @@
+from classes.dice_kernel import move_pawns, DiceBlock, BatchMovement
+from classes.game_constants import GameConstants
+from classes.player import Player
+import numpy as np
+
+
+def test_move_pawns_same_as_player():
+    positions = np.repeat(np.arange(GameConstants.MAX_FIELD_ID + 1), 11)
+    dice_sums = np.tile(np.arange(2, 13), GameConstants.MAX_FIELD_ID + 1)
+    new_positions, passed = move_pawns(positions, dice_sums)
+    for pos, dice_sum, new_pos, flag in zip(positions, dice_sums,
+                                            new_positions, passed):
+        player = Player()
+        player.set_position(int(pos))
+        player.set_dice_roll_sum(int(dice_sum))
+        player.move_pawn()
+        assert player.current_pawn_position() == new_pos
+        assert player.passed_start_field == flag
+
+
+def test_dice_block_range_and_seed():
+    dice1 = DiceBlock(100, seed=5, block_size=3)
+    dice2 = DiceBlock(100, seed=5, block_size=3)
+    for _ in range(7):
+        roll = dice1.roll()
+        assert roll.shape == (100, 2)
+        assert roll.min() >= 1 and roll.max() <= 6
+        assert (roll == dice2.roll()).all()
+
+
+def test_batch_movement_step():
+    movement = BatchMovement(2, 3)
+    movement.bancrupt[1, 1] = True
+    movement.step(np.array([[6, 6], [1, 2]]))
+    assert movement.positions.tolist() == [[2, 0, 0], [3, 0, 0]]
+    assert movement.passed_start_field.tolist() == [
+        [True, False, False], [False, False, False]]
+    assert movement.current_player.tolist() == [1, 2]
+    assert movement.total_moves.tolist() == [1, 1]
@@ -0,0 +1,60 @@
+from classes.event_log import EventLog, EventLogError, EVENT_FORMAT
+from classes.game_events import EventType
+from classes.game_state import GameState
+from classes import simulation
+import pytest
+
+
+def recorded_game(new_game, turns, seed=5, snapshot_interval=16):
+    game = new_game(3, seed)
+    log = EventLog(snapshot_interval)
+    log.attach(game)
+    game.prepare_game()
+    policies = [simulation.BuilderPolicy(), simulation.Policy(),
+                simulation.Policy()]
+    states = []
+    for _ in range(turns):
+        states.append(GameState.capture(game))
+        simulation.play_turn(game, policies)
+    states.append(GameState.capture(game))
+    log.detach()
+    return log, states
+
+
+def test_events_are_fixed_width(new_game):
+    log, _ = recorded_game(new_game, 3)
+    assert len(log.to_bytes()) % EVENT_FORMAT.size == 2
+    event_types = [event[0] for event in log.events()]
+    assert event_types[0] == EventType.PREPARE
+    assert event_types[1:3] == [EventType.DICE_ROLL, EventType.MOVE]
+    assert event_types.count(EventType.CHANGE_PLAYER) == 3
+
+
+def test_replay_every_turn(new_game):
+    log, states = recorded_game(new_game, 40)
+    game = new_game(3)
+    for turn in range(1, log.turns_num()):
+        log.replay_turn(game, turn)
+        assert GameState.capture(game) == states[turn]
+
+
+def test_replay_decoded_log(new_game):
+    log, states = recorded_game(new_game, 40)
+    initial = new_game(3)
+    decoded = EventLog.from_bytes(log.to_bytes(),
+                                  GameState.capture(initial), 16)
+    assert decoded.turns_num() == log.turns_num()
+    game = new_game(3)
+    decoded.build_snapshots(game)
+    decoded.replay(game)
+    assert GameState.capture(game) == states[-1]
+    decoded.replay_turn(game, 30)
+    assert GameState.capture(game) == states[30]
+
+
+def test_invalid_log(new_game):
+    with pytest.raises(EventLogError):
+        EventLog.from_bytes(b'abcdefghij', None)
+    log, _ = recorded_game(new_game, 1)
+    with pytest.raises(EventLogError):
+        EventLog.from_bytes(log.to_bytes()[:-1], None)
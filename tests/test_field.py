@@ -1,5 +1,6 @@
 from classes.field import PropertyField, Street
 from classes.field import HousesNumError
+from classes.field import DESCRIPTION, FULL_DESCRIPTION
 from classes.player import Player
 import pytest
 
@@ -44,6 +45,22 @@ class TestField:
         assert self.field.owner() is None
         assert not self.field.is_mortgaged()
 
+    def test_owner_assets_value(self):
+        field = PropertyField(1, 'line', 'grey', 25, {"base_price": 200},
+                              {"mortgage": 100})
+        player = Player()
+        other_player = Player()
+        field.set_owner(player)
+        assert player.assets_value() == 100
+        field.do_mortgage()
+        assert player.assets_value() == 0
+        field.lift_mortgage()
+        field.set_owner(other_player)
+        assert player.assets_value() == 0
+        assert other_player.assets_value() == 100
+        field.return_to_bank()
+        assert other_player.assets_value() == 0
+
     def test_total_value(self):
         assert self.field.total_value() == self.field.price() / 2
         self.field.do_mortgage()
@@ -148,6 +165,22 @@ class TestStreetField:
         assert street.owner() is None
         assert street.houses_num() == 0
 
+    def test_owner_assets_value(self):
+        street = Street(self.field_id, self.name, self.colour,
+                        self.rent, self.prices, self.other_rents)
+        player = Player()
+        street.set_owner(player)
+        for _ in range(4):
+            street.add_house()
+            assert player.assets_value() == street.total_value()
+        street.add_hotel()
+        assert player.assets_value() == street.total_value()
+        street.remove_hotel()
+        street.remove_house()
+        assert player.assets_value() == street.total_value()
+        street.return_to_bank()
+        assert player.assets_value() == 0
+
     def test_total_value(self):
         street = Street(self.field_id, self.name, self.colour,
                         self.rent, self.prices, self.other_rents)
@@ -156,3 +189,22 @@ class TestStreetField:
         street.add_house()
         assert street.total_value() == street.price() / 2 \
             + street.house_cost() * 2
+
+    def test_render_cached_until_changed(self):
+        street = Street(self.field_id, self.name, self.colour,
+                        self.rent, self.prices, self.other_rents)
+        text = street.render(DESCRIPTION)
+        assert street.render(DESCRIPTION) is text
+        assert street.render(FULL_DESCRIPTION) is not text
+        version = street.version()
+        street.add_house()
+        assert street.version() != version
+        changed = street.render(DESCRIPTION)
+        assert changed != text
+        assert '│ number of houses │ 1' in changed
+        version = street.version()
+        street.set_owner(Player('owner'))
+        assert street.version() != version
+        text = street.render(FULL_DESCRIPTION)
+        street.do_mortgage()
+        assert street.render(FULL_DESCRIPTION) != text
@@ -1,16 +1,23 @@
 import classes.fields_from_json as ffjson
-from classes.board import Board
+from classes.board import Board, ColourError, MAX_FORK_DEPTH
 from classes.field import PropertyField, SpecialField, Street
 from classes.field import HousesNumError, MortgageError
+from classes.field import DESCRIPTION, FULL_DESCRIPTION
 from classes.player import Player
-from classes.game import Game, StartFieldError
+from classes.game import Game, StartFieldError, FortuneError
+from classes import simulation
+from classes.game_actions import ActionKind, encode_action, decode_action
 from classes.game_constants import GameConstants
+from classes.game_state import GameState
 import pytest
 
 PROPERTY_FIELDS = "database/property_fields.json"
 NUM_OF_COLOUR = "database/number_of_colour.json"
 SPECIAL_FIELDS = "database/special_fields.json"
 CHANCE_CARDS = "database/chance_cards.json"
+MANAGEMENT_KINDS = (ActionKind.BUILD_HOUSE, ActionKind.BUILD_HOTEL,
+                    ActionKind.SELL_HOUSE, ActionKind.SELL_HOTEL,
+                    ActionKind.MORTGAGE, ActionKind.LIFT_MORTGAGE)
 
 
 class TestGame:
@@ -325,3 +332,207 @@ class TestMortgage:
         self.game.build_house(self.fld5)
         with pytest.raises(MortgageError):
             self.game.mortgage(self.fld5)
+
+
+class TestFortuneTracking:
+    def test_fortune_tracked_during_game(self, new_game):
+        policies = [simulation.BuilderPolicy(100), simulation.Policy(),
+                    simulation.BuilderPolicy(300)]
+        for seed in range(20):
+            game = new_game(3, seed, prepared=True)
+            game.set_fortune_check(True)
+            while not game.win():
+                game.is_win()
+                simulation.play_turn(game, policies)
+                for player in game.players():
+                    assert game.total_fortune(player) == \
+                        game.recomputed_fortune(player)
+            game.find_winner()
+
+    def test_fortune_check_error(self, new_game):
+        game = new_game(3, seed=0, prepared=True)
+        game.set_fortune_check(True)
+        player = game.current_player()
+        player.set_position(5)
+        game.buy_current_property()
+        assert game.total_fortune() == player.money() + \
+            game.get_field_by_id(5).price() / 2
+        player._assets_value += 1
+        with pytest.raises(FortuneError):
+            game.total_fortune()
+        game.update_assets_values()
+        assert game.total_fortune() == game.recomputed_fortune()
+
+
+class TestLegalActions:
+    def tried_actions(self, game):
+        actions = [ActionKind.ROLL]
+        state = GameState.capture(game)
+        for field_id in sorted(game.current_player().owned_property_fields()):
+            for kind in MANAGEMENT_KINDS:
+                code = encode_action(kind, field_id)
+                try:
+                    game.apply_action(code)
+                except (HousesNumError, MortgageError, ColourError,
+                        AttributeError):
+                    continue
+                finally:
+                    state.restore(game)
+                actions.append(code)
+        return sorted(actions)
+
+    def test_actions_same_as_game_methods(self, new_game):
+        policies = [simulation.BuilderPolicy(100), simulation.Policy(),
+                    simulation.BuilderPolicy(300)]
+        for seed in range(10):
+            game = new_game(3, seed, prepared=True)
+            while not game.win():
+                game.is_win()
+                assert sorted(game.legal_actions()) == \
+                    self.tried_actions(game)
+                simulation.play_turn(game, policies)
+
+    def test_buy_or_pass(self, new_game):
+        game = new_game(3, seed=0, prepared=True)
+        player = game.current_player()
+        player.set_position(5)
+        assert game.legal_actions(moved=True) == [ActionKind.BUY,
+                                                  ActionKind.PASS]
+        game.apply_action(ActionKind.BUY)
+        assert game.get_field_by_id(5).owner() is player
+        assert game.legal_actions(moved=True) == [ActionKind.PASS]
+        with pytest.raises(ValueError):
+            game.apply_action(ActionKind.BUY)
+        with pytest.raises(ValueError):
+            game.apply_action(ActionKind.ROLL)
+
+    def test_build_actions(self, new_game):
+        game = new_game(3, seed=0, prepared=True)
+        player = game.current_player()
+        for field_id in (5, 7):
+            player.set_position(field_id)
+            game.buy_current_property()
+        assert encode_action(ActionKind.BUILD_HOUSE, 5) in \
+            game.legal_actions()
+        game.apply_action(encode_action(ActionKind.BUILD_HOUSE, 5))
+        actions = game.legal_actions()
+        assert encode_action(ActionKind.BUILD_HOUSE, 5) not in actions
+        assert encode_action(ActionKind.BUILD_HOUSE, 7) in actions
+        assert encode_action(ActionKind.SELL_HOUSE, 5) in actions
+        assert encode_action(ActionKind.MORTGAGE, 5) not in actions
+        assert encode_action(ActionKind.MORTGAGE, 7) in actions
+
+    def test_only_owned_groups_checked(self, new_game, monkeypatch):
+        game = new_game(3, seed=0, prepared=True)
+        player = game.current_player()
+        for field_id in (5, 7):
+            player.set_position(field_id)
+            game.buy_current_property()
+        expected = game.legal_actions()
+
+        def colour_groups(board):
+            raise AssertionError('every colour group was scanned')
+        monkeypatch.setattr(Board, 'colour_groups', colour_groups)
+        assert game.legal_actions() == expected
+
+    def test_encode_decode(self):
+        for kind in ActionKind:
+            for field_id in (0, 1, 39, 1000):
+                code = encode_action(kind, field_id)
+                assert decode_action(code) == (kind, field_id)
+
+
+class TestFork:
+    def play_turns(self, game, turns):
+        policies = [simulation.BuilderPolicy(100)] * 3
+        for _ in range(turns):
+            if game.is_win():
+                return
+            simulation.play_turn(game, policies)
+
+    def test_fork_renders_own_fields(self, new_game):
+        game = new_game(3, seed=0, prepared=True)
+        player = game.current_player()
+        for field_id in (5, 7):
+            player.set_position(field_id)
+            game.buy_current_property()
+        status = game.show_player_status(player=player)
+        forked = game.fork()
+        forked.build_house(forked.get_field_by_id(5))
+        forked_status = forked.show_player_status(
+            player=forked.current_player())
+        assert forked_status != status
+        assert game.show_player_status(player=player) == status
+        assert forked.show_player_status(
+            player=forked.current_player()) == \
+            forked_status
+
+    def test_fork_is_independent(self, new_game):
+        game = new_game(3, seed=0, prepared=True)
+        self.play_turns(game, 30)
+        state = GameState.capture(game)
+        forked = game.fork()
+        assert GameState.capture(forked) == state
+        self.play_turns(forked, 30)
+        assert GameState.capture(game) == state
+        assert GameState.capture(forked) != state
+        for player in forked.players():
+            assert forked.total_fortune(player) == \
+                forked.recomputed_fortune(player)
+            for field_id in player.owned_property_fields():
+                assert forked.get_field_by_id(field_id).owner() is player
+
+    def test_fork_rolls_same_dice(self, new_game):
+        game = new_game(3, seed=1, prepared=True)
+        self.play_turns(game, 20)
+        forked = game.fork()
+        self.play_turns(game, 20)
+        self.play_turns(forked, 20)
+        assert GameState.capture(forked) == GameState.capture(game)
+        seeded = game.fork(seed=5)
+        again = game.fork(seed=5)
+        self.play_turns(seeded, 20)
+        self.play_turns(again, 20)
+        assert GameState.capture(seeded) == GameState.capture(again)
+
+    def test_chain_of_forks(self, new_game):
+        game = new_game(3, seed=2, prepared=True)
+        states = []
+        for _ in range(3 * MAX_FORK_DEPTH):
+            self.play_turns(game, 3)
+            states.append((game, GameState.capture(game)))
+            game = game.fork()
+        self.play_turns(game, 10)
+        for forked, state in states:
+            assert GameState.capture(forked) == state
+            for player in forked.players():
+                assert forked.total_fortune(player) == \
+                    forked.recomputed_fortune(player)
+
+
+class TestPlayerStatus:
+    def test_status_of_other_player(self, new_game):
+        game = new_game(3, seed=0, prepared=True)
+        owner = game.current_player()
+        for field_id in (1, 5):
+            owner.set_position(field_id)
+            game.buy_current_property()
+        fields = [game.get_field_by_id(1), game.get_field_by_id(5)]
+        full = game.show_player_status(player=owner)
+        assert full == '\n'.join(
+            [str(owner)] + [f.render(FULL_DESCRIPTION) for f in fields])
+        assert game.show_player_status(streets_only=True, player=owner) == \
+            '\n'.join([str(owner), fields[1].render(FULL_DESCRIPTION)])
+        game.change_player()
+        status = game.show_player_status(player=owner)
+        assert status != full
+        assert status == '\n'.join(
+            [str(owner)] + [f.render(DESCRIPTION) for f in fields])
+        game.change_player()
+        game.change_player()
+        assert game.current_player() is owner
+        assert game.show_player_status() == full
+        fields[0].do_mortgage()
+        assert game.show_player_status() != full
+        game.change_player()
+        assert game.show_player_status(player=owner) != status
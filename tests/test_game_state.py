@@ -0,0 +1,83 @@
+from classes.game_state import GameState
+from classes.field import PropertyField, Street
+from classes.player import Player
+from classes.chance_card import ChanceCard
+from classes import simulation
+import pytest
+
+
+def test_model_classes_have_no_dict():
+    field = Street(5, 'Park Place', 'deep blue', 35,
+                   {'base_price': 350, 'house_cost': 200, 'hotel_cost': 200},
+                   {'w_one_house': 175, 'w_two_houses': 500,
+                    'w_three_houses': 1100, 'w_four_houses': 1300,
+                    'w_hotel': 1500, 'mortgage': 175})
+    for obj in (field, Player(), ChanceCard(0, 'tax', 'pay', 50)):
+        with pytest.raises(AttributeError):
+            obj.__dict__
+
+
+def test_capture_and_restore(new_game):
+    game = new_game(seed=4)
+    game.prepare_game()
+    for _ in range(15):
+        simulation.play_turn(game, [simulation.Policy()] * 2)
+    state = GameState.capture(game)
+    money = [p.money() for p in game.players()]
+    owned = [set(p.owned_property_fields()) for p in game.players()]
+    rents = {f_id: game.get_field_by_id(f_id).current_rent()
+             for f_id in game.board().property_field_ids()}
+    for _ in range(15):
+        simulation.play_turn(game, [simulation.Policy()] * 2)
+    state.restore(game)
+    assert [p.money() for p in game.players()] == money
+    assert [p.owned_property_fields() for p in game.players()] == owned
+    for field_id in owned[0]:
+        assert game.get_field_by_id(field_id).owner() is game.players()[0]
+    for field_id, rent in rents.items():
+        assert game.get_field_by_id(field_id).current_rent() == rent
+    assert GameState.capture(game) == state
+
+
+def test_restore_houses_and_mortgage(new_game):
+    game = new_game()
+    game.prepare_game()
+    player = game.current_player()
+    for field_id in (5, 7, 1):
+        player.set_position(field_id)
+        game.buy_current_property()
+    state = GameState.capture(game)
+    field5 = game.get_field_by_id(5)
+    game.build_house(field5)
+    game.mortgage(game.get_field_by_id(1))
+    state.restore(game)
+    assert field5.houses_num() == 0
+    assert field5.current_rent() == field5.base_rent()
+    assert not game.get_field_by_id(1).is_mortgaged()
+    assert isinstance(game.get_field_by_id(1), PropertyField)
+
+
+def test_restore_changes_rendered_tables(new_game):
+    game = new_game()
+    game.prepare_game()
+    player = game.current_player()
+    for field_id in (5, 7):
+        player.set_position(field_id)
+        game.buy_current_property()
+    state = GameState.capture(game)
+    status = game.show_player_status(player=player)
+    field5 = game.get_field_by_id(5)
+    game.build_house(field5)
+    assert game.show_player_status(player=player) != status
+    state.restore(game)
+    assert game.show_player_status(player=player) == status
+
+
+def test_copy_is_independent_and_small(new_game):
+    game = new_game(players_num=4)
+    game.prepare_game()
+    state = GameState.capture(game)
+    copy = state.copy()
+    copy.values()[0] = 3
+    assert state.values()[0] == 0
+    assert state.nbytes() < 300
@@ -0,0 +1,83 @@
+from classes import field
+from classes import interface
+from classes import simulation
+from classes.game import Game
+from classes.instrumentation import Profiler, TURN, percentile, profiled
+from classes.simulation import BuilderPolicy
+
+
+def test_originals_restored():
+    total_fortune = Game.total_fortune
+    make_move = simulation.make_move
+    tabulate = field.tabulate
+    profiler = Profiler()
+    profiler.enable()
+    assert profiler.enabled()
+    assert Game.total_fortune is not total_fortune
+    profiler.disable()
+    assert not profiler.enabled()
+    assert Game.total_fortune is total_fortune
+    assert simulation.make_move is make_move
+    assert field.tabulate is tabulate
+
+
+def test_headless_game_turns(new_game):
+    game = new_game(3, seed=1)
+    with Profiler() as profiler:
+        simulation.play(game, [BuilderPolicy()] * 3)
+    stats = profiler.phase_stats()
+    # the last turn only checks that the game is over
+    assert profiler.turns() == game._total_moves + 1
+    assert stats[TURN]['turns'] == profiler.turns()
+    assert stats['play_turn']['calls'] == game._total_moves
+    assert stats['play_turn']['turns'] == game._total_moves
+    assert stats['Game.dice_roll']['calls'] == game._total_moves
+    assert stats['play_turn']['p50_us'] <= stats['play_turn']['p99_us'] <= \
+        stats['play_turn']['max_us']
+    assert sum(stats[TURN]['histogram_us'].values()) == profiler.turns()
+    assert 'play_turn' in profiler.report()
+
+
+def test_folded_stacks(new_game, tmp_path):
+    game = new_game(seed=2)
+    game.prepare_game()
+    with Profiler() as profiler:
+        for _ in range(5):
+            game.show_player_status()
+            simulation.play_turn(game, [BuilderPolicy()] * 2)
+    lines = profiler.folded_stacks().splitlines()
+    assert lines
+    for line in lines:
+        stack, self_time = line.rsplit(' ', 1)
+        assert int(self_time) >= 1
+        assert all(stack.split(';'))
+    assert any(line.startswith('Game.show_player_status;tabulate ')
+               for line in lines)
+    filename = tmp_path / 'stacks.folded'
+    profiler.write_folded_stacks(str(filename))
+    assert filename.read_text() == profiler.folded_stacks()
+
+
+def test_interface_turns(new_game, monkeypatch):
+    monkeypatch.setattr(interface, 'clear', lambda: None)
+    monkeypatch.setattr(interface, 'pause', lambda: None)
+    monkeypatch.setattr(interface, 'bool_input', lambda: True)
+    monkeypatch.setattr(interface, 'players_input_menu',
+                        lambda: interface.MenuOption.THROW_DICE)
+    monkeypatch.setattr('builtins.print', lambda *args, **kwargs: None)
+    game = new_game(seed=3)
+    game.prepare_game()
+    with profiled('/dev/null') as profiler:
+        interface.play(game, resumed=True)
+    stats = profiler.phase_stats()
+    # the last turn shows the results
+    assert stats['menu_action']['calls'] == profiler.turns() - 1
+    assert stats['make_move']['calls'] == profiler.turns() - 1
+    # tables are rendered again only after they change
+    assert 0 < stats['tabulate']['calls'] < profiler.turns()
+
+
+def test_percentile():
+    assert percentile([3, 1, 2, 4], 0.5) == 3
+    assert percentile([3, 1, 2, 4], 0.99) == 4
+    assert percentile([], 0.5) == 0
@@ -0,0 +1,45 @@
+from classes.landing_analysis import LandingAnalysis, transition_matrix
+from classes.landing_analysis import stationary_distribution
+from classes.landing_analysis import dice_sum_probabilities
+from classes.board import Board
+from classes.board_loader import load_board
+from classes.field import SpecialField
+from classes.game_constants import GameConstants
+import numpy as np
+import pytest
+
+
+def test_dice_sum_probabilities():
+    probabilities = dice_sum_probabilities()
+    assert sum(probabilities.values()) == pytest.approx(1)
+    assert probabilities[7] == pytest.approx(1 / 6)
+
+
+def test_transition_matrix_rows_sum_to_one():
+    matrix = transition_matrix(load_board())
+    fields_num = GameConstants.MAX_FIELD_ID + 1
+    assert matrix.shape == (fields_num, fields_num)
+    assert np.allclose(matrix.sum(axis=1), 1)
+
+
+def test_go_to_jail_is_never_landed_on():
+    analysis = LandingAnalysis(load_board(), jail_field_id=0)
+    assert analysis.landing_probability(3) == pytest.approx(0)
+    assert analysis.landing_probability(0) > 0.1
+    assert analysis.landing_probabilities().sum() == pytest.approx(1)
+
+
+def test_expected_rent():
+    analysis = LandingAnalysis(load_board())
+    probability = analysis.landing_probability(5)
+    assert analysis.expected_rent(5) == pytest.approx(35 * probability)
+    assert analysis.expected_rent(5, 5) == pytest.approx(1500 * probability)
+    assert analysis.expected_rent(0) == 0
+
+
+def test_large_board():
+    board = Board([], {}, [SpecialField(7, 'go to jail')])
+    matrix = transition_matrix(board, max_field_id=499, jail_field_id=20)
+    distribution = stationary_distribution(matrix)
+    assert distribution[7] == pytest.approx(0)
+    assert np.allclose(distribution @ matrix, distribution)
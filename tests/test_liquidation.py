@@ -0,0 +1,132 @@
+from classes.field import HousesNumError, MortgageError
+from classes.game_state import GameState
+from classes.game_events import EventType
+from classes.liquidation import plan_liquidation, brute_force_plan
+from classes.liquidation import execute_plan, rents_sum, group_moves
+from classes import simulation
+from random import Random
+import pytest
+
+
+def buy(game, field_ids):
+    player = game.current_player()
+    for field_id in field_ids:
+        player.set_position(field_id)
+        game.buy_current_property()
+
+
+def check_plan(game, amount):
+    plan = plan_liquidation(game, amount)
+    reference = brute_force_plan(game, amount)
+    assert (plan is None) == (reference is None)
+    if plan is None:
+        return
+    assert plan.cost() == reference.cost()
+    state = GameState.capture(game)
+    money = game.current_player().money()
+    fortune = game.total_fortune()
+    rent = rents_sum(game)
+    execute_plan(game, plan)
+    assert game.can_afford(amount)
+    assert game.current_player().money() - money == plan.cash
+    assert fortune - game.total_fortune() == plan.net_loss
+    assert rent - rents_sum(game) == plan.rent_loss
+    state.restore(game)
+
+
+def test_no_plan_needed(new_game):
+    game = new_game(prepared=True)
+    plan = plan_liquidation(game, 100)
+    assert plan.actions == ()
+    assert plan.cash == 0
+
+
+def test_mortgage_cheapest_rent(new_game):
+    game = new_game(prepared=True)
+    buy(game, [1, 5, 7])
+    game.build_house(game.get_field_by_id(5))
+    game.current_player()._money = 10
+    plan = plan_liquidation(game, 300)
+    assert plan.actions == ((EventType.MORTGAGE, 1), (EventType.MORTGAGE, 7))
+    assert plan.rent_loss == 25 + 50
+    check_plan(game, 300)
+
+
+def test_houses_sold_evenly(new_game):
+    game = new_game(prepared=True)
+    buy(game, [5, 7])
+    game.current_player()._money = 10000
+    for _ in range(4):
+        game.build_house(game.get_field_by_id(5))
+        game.build_house(game.get_field_by_id(7))
+    game.build_hotel(game.get_field_by_id(5))
+    game.current_player()._money = 0
+    for amount in (100, 500, 1200, 1900, 2300):
+        check_plan(game, amount)
+    plan = plan_liquidation(game, 1200)
+    assert plan.actions[0] == (EventType.SELL_HOTEL, 5)
+    assert not game.can_mortgage(game.get_field_by_id(5))
+    with pytest.raises(MortgageError):
+        game.mortgage(game.get_field_by_id(5))
+    fields = (game.get_field_by_id(5), game.get_field_by_id(7))
+    moves = list(group_moves(fields, (True, True), ((5, False), (4, False))))
+    assert [move[:2] for move in moves] == [(EventType.SELL_HOTEL, 0)]
+
+
+def test_not_enough_property(new_game):
+    game = new_game(prepared=True)
+    buy(game, [1, 2])
+    game.current_player()._money = 0
+    assert plan_liquidation(game, 200) is None
+    assert plan_liquidation(game, 199) is not None
+    check_plan(game, 200)
+
+
+def test_planner_same_as_brute_force_in_games(new_game):
+    for seed in range(6):
+        game = new_game(2, seed, prepared=True)
+        policies = [simulation.BuilderPolicy(0), simulation.BuilderPolicy(0)]
+        for _ in range(12):
+            if game.win():
+                break
+            simulation.play_turn(game, policies)
+        if game.current_player().is_bancrupt:
+            continue
+        game.current_player()._money = 0
+        for amount in (50, 400, 1000):
+            check_plan(game, amount)
+
+
+def test_planner_same_as_brute_force_random_holdings(new_game):
+    random = Random(7)
+    for _ in range(15):
+        game = new_game(prepared=True)
+        buy(game, random.sample([1, 2, 5, 6, 7, 8], random.randint(1, 6)))
+        player = game.current_player()
+        player._money = 10000
+        for _ in range(random.randint(0, 10)):
+            field = game.get_field_by_id(random.choice([5, 6, 7, 8]))
+            try:
+                if game.is_enough_houses(field):
+                    game.build_hotel(field)
+                else:
+                    game.build_house(field)
+            except HousesNumError:
+                pass
+        for field_id in sorted(player.owned_property_fields()):
+            field = game.get_field_by_id(field_id)
+            if not game.is_house_to_sell(field) and random.random() < 0.3:
+                game.mortgage(field)
+        player._money = random.randint(0, 100)
+        for amount in (random.randint(0, 500), random.randint(500, 2500)):
+            check_plan(game, amount)
+
+
+def test_planner_policy_plays_game(new_game):
+    for seed in range(10):
+        game = new_game(3, seed, prepared=True)
+        policies = [simulation.PlannerPolicy(), simulation.BuilderPolicy(),
+                    simulation.PlannerPolicy()]
+        winner = simulation.play(game, policies, resumed=True)
+        assert game.win()
+        assert winner in game.players()
@@ -0,0 +1,112 @@
+from classes.matchup import MatchupStats, wilson_interval, rotated_policies
+from classes.matchup import play_rotated_batch, run_matchup, round_robin
+from classes.matchup import looks_num, stopping_z
+from classes.simulation import Policy, PassivePolicy, BuilderPolicy
+from classes.tournament import GameResult, play_seeded_game
+from random import Random
+import pytest
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(5, 10, z=1.96)
+    assert low == pytest.approx(0.2366, abs=1e-4)
+    assert high == pytest.approx(0.7634, abs=1e-4)
+    low, high = wilson_interval(0, 10, z=1.96)
+    assert low == 0
+    assert high == pytest.approx(0.2775, abs=1e-4)
+    assert wilson_interval(0, 0) == (0, 1)
+
+
+def test_rotated_policies():
+    policies = ['a', 'b', 'c']
+    assert rotated_policies(policies, 0) == ['a', 'b', 'c']
+    assert rotated_policies(policies, 1) == ['b', 'c', 'a']
+
+
+def test_rotated_batch_indexed_by_strategy():
+    policies = [Policy(), PassivePolicy()]
+    results = play_rotated_batch([3], policies)
+    assert len(results) == 2
+    swapped = play_seeded_game(3, [PassivePolicy(), Policy()])
+    assert results[1].fortunes == swapped.fortunes[::-1]
+    assert results[1].winner == 1 - swapped.winner
+
+
+def test_same_strategies_share_wins():
+    results = play_rotated_batch([0, 1, 2], [Policy(), Policy()])
+    wins = [result.winner for result in results]
+    assert wins.count(0) == wins.count(1)
+
+
+def test_significance():
+    stats = MatchupStats(('a', 'b', 'c'))
+    for winner in [0] * 40 + [1] * 10 + [2] * 5:
+        stats.add(GameResult(0, winner, 20, (0, 0, 0)))
+    assert stats.leaders() == (0, 1)
+    assert stats.is_significant()
+    stats.add(GameResult(0, None, 20, (0, 0, 0)))
+    assert stats.no_winner() == 1
+    even = MatchupStats(('a', 'b'))
+    for winner in [0, 1] * 30:
+        even.add(GameResult(0, winner, 20, (0, 0)))
+    assert not even.is_significant()
+
+
+def test_stopping_z():
+    assert looks_num(1000, 100, 0) == 10
+    assert looks_num(1000, 128, 200) == 7
+    assert looks_num(10, 100, 50) == 1
+    assert stopping_z(0.05, 1, 2) == pytest.approx(1.96, abs=1e-3)
+    assert stopping_z(0.01, 78, 2) > stopping_z(0.01, 1, 2)
+    assert stopping_z(0.01, 1, 3) > stopping_z(0.01, 1, 2)
+
+
+def false_stops(z, matchups=200, games=2000, batch=64):
+    random = Random(1)
+    stops = 0
+    for _ in range(matchups):
+        stats = MatchupStats(('a', 'b'), z)
+        while stats.games() < games:
+            for _ in range(batch):
+                stats.add(GameResult(0, int(random.random() < 0.5), 20,
+                                     (0, 0)))
+            if stats.is_significant():
+                stops += 1
+                break
+    return stops / matchups
+
+
+def test_stopping_rule_error_rate():
+    z = stopping_z(0.05, looks_num(2000, 64, 0), 2)
+    assert false_stops(z) <= 0.05
+    assert false_stops(1.96) > 0.05
+
+
+def test_matchup_stops_early():
+    stats = run_matchup([BuilderPolicy(), PassivePolicy()], max_games=2000,
+                        min_games=40, workers=1, batch_size=10)
+    assert stats.stopped_early()
+    assert stats.games() < 2000
+    assert stats.leaders()[0] == 0
+    assert 'BuilderPolicy' in stats.table()
+    parallel = run_matchup([BuilderPolicy(), PassivePolicy()],
+                           max_games=2000, min_games=40, workers=2,
+                           batch_size=10)
+    assert parallel.wins() == stats.wins()
+
+
+def test_close_matchup_uses_all_games():
+    stats = run_matchup([Policy(), Policy()], max_games=41, min_games=0,
+                        workers=1)
+    assert stats.games() == 42
+    assert not stats.stopped_early()
+
+
+def test_round_robin():
+    matchups = round_robin({'base': Policy(), 'passive': PassivePolicy(),
+                            'builder': BuilderPolicy()},
+                           max_games=20, workers=1)
+    assert set(matchups) == {('base', 'passive'), ('base', 'builder'),
+                             ('passive', 'builder')}
+    with pytest.raises(ValueError):
+        run_matchup([Policy()])
@@ -0,0 +1,106 @@
+from classes import interface
+from classes import simulation
+from classes.game_actions import ActionKind
+from classes.game_state import GameState
+from classes.mcts import MCTSPolicy, search, best_action, fortune_share
+from classes.simulation import Policy
+import pytest
+
+
+def game_with_streets(new_game, seed=0):
+    game = new_game(seed=seed, prepared=True)
+    player = game.current_player()
+    for field_id in (5, 7):
+        player.set_position(field_id)
+        game.buy_current_property()
+    return game
+
+
+def test_search_restores_game(new_game):
+    game = game_with_streets(new_game)
+    state = GameState.capture(game)
+    random_state = game._random.getstate()
+    stats = search(game, False, iterations=200, time_budget=None, seed=1)
+    assert GameState.capture(game) == state
+    assert game._random.getstate() == random_state
+    assert sum(visits for visits, _ in stats.values()) == 200
+    assert set(stats) == set(game.legal_actions())
+
+
+def test_search_repeatable_with_seed(new_game):
+    game = game_with_streets(new_game)
+    first = search(game, False, iterations=100, time_budget=None, seed=5)
+    second = search(game, False, iterations=100, time_budget=None, seed=5)
+    assert first == second
+
+
+def test_search_limits(new_game):
+    game = game_with_streets(new_game)
+    with pytest.raises(ValueError):
+        search(game, False, iterations=None, time_budget=None)
+    stats = search(game, False, time_budget=0.05, seed=0)
+    assert sum(visits for visits, _ in stats.values()) > 0
+
+
+def test_best_action_sums_workers():
+    first = {ActionKind.ROLL: (10, 5.0), ActionKind.PASS: (8, 6.0)}
+    second = {ActionKind.ROLL: (2, 1.0), ActionKind.PASS: (5, 3.0)}
+    assert best_action([first]) == ActionKind.ROLL
+    assert best_action([first, second]) == ActionKind.PASS
+
+
+def test_fortune_share(new_game):
+    game = new_game(seed=0, prepared=True)
+    players = game.players()
+    assert fortune_share(game, players[0]) == 0.5
+    players[1].is_bancrupt = True
+    assert fortune_share(game, players[0]) == 1
+    assert fortune_share(game, players[1]) == 0
+
+
+def test_single_action_without_search(new_game):
+    game = new_game(seed=0, prepared=True)
+    policy = MCTSPolicy(time_budget=None, iterations=1000)
+    assert policy.choose_action(game) == ActionKind.ROLL
+    game.current_player().set_position(4)
+    assert policy.choose_action(game, moved=True) == ActionKind.PASS
+
+
+def test_buys_street(new_game):
+    game = new_game(seed=0, prepared=True)
+    game.current_player().set_position(5)
+    policy = MCTSPolicy(time_budget=None, iterations=300, seed=0)
+    assert policy.buy_property(game, game.current_field())
+
+
+def test_mcts_plays_game(new_game):
+    game = new_game(seed=4, prepared=True)
+    policies = [MCTSPolicy(time_budget=None, iterations=20, seed=0),
+                Policy()]
+    winner = simulation.play(game, policies, resumed=True)
+    assert game.win()
+    assert winner in game.players()
+
+
+def test_parallel_search(new_game):
+    game = game_with_streets(new_game)
+    policy = MCTSPolicy(time_budget=None, iterations=50, workers=2, seed=0)
+    try:
+        action = policy.choose_action(game)
+    finally:
+        policy.close()
+    assert action in game.legal_actions()
+
+
+def test_interface_computer_turn(new_game, monkeypatch):
+    monkeypatch.setattr('builtins.print', lambda *args, **kwargs: None)
+    game = game_with_streets(new_game)
+    policy = MCTSPolicy(time_budget=None, iterations=50, seed=0)
+    interface.set_computer_player('player0', policy)
+    try:
+        assert interface.computer_policy(game) is policy
+        interface.computer_turn(game, policy)
+    finally:
+        interface.set_computer_player('player0', None)
+    assert game.current_player_name() == 'player1'
+    assert interface.computer_policy(game) is None
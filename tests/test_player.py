@@ -87,3 +87,29 @@ def test_passed_start_field():
     player1.move_pawn()
     assert player1.current_pawn_position() == 1
     assert player1.passed_start_field is False
+
+
+def test_str_cached_until_changed():
+    player1 = Player('player1')
+    text = str(player1)
+    assert str(player1) is text
+    player1.earn_money(100)
+    assert str(player1) != text
+    text = str(player1)
+    player1.set_position(3)
+    assert '│ current position │ 3' in str(player1) or \
+        '| current position | 3' in str(player1)
+    player1._money = 0
+    player1.changed()
+    assert '| money            | 0' in str(player1)
+
+
+def test_str_changed_by_put_in_jail():
+    player1 = Player('player1')
+    player1.set_position(1)
+    version = player1.version()
+    text = str(player1)
+    player1.put_in_jail()
+    assert player1.version() != version
+    assert str(player1) != text
+    assert str(GameConstants.JAIL_FIELD_ID) in str(player1)
@@ -0,0 +1,52 @@
+from classes.rent_table import RentTable, compile_rent_row, HOTEL_LEVEL
+from classes.board_loader import load_board
+from classes.field import Street
+
+OTHER_RENTS = {
+    "w_one_house": 10,
+    "w_two_houses": 20,
+    "w_three_houses": 30,
+    "w_four_houses": 40,
+    "w_hotel": 50,
+    "mortgage": 30
+}
+PRICES = {"base_price": 60, "house_cost": 50, "hotel_cost": 50}
+
+
+def test_same_rents_share_row():
+    row1 = compile_rent_row(5, OTHER_RENTS, street=True)
+    row2 = compile_rent_row(5, dict(OTHER_RENTS), street=True)
+    assert row1 is row2
+
+
+def test_boards_share_rent_table():
+    assert load_board().rent_table() is load_board().rent_table()
+
+
+def test_rent_table_values():
+    table = load_board().rent_table()
+    assert table.rent(5) == 35
+    assert table.rent(5, monopoly=True) == 70
+    assert table.rent(5, level=2) == 500
+    assert table.rent(5, level=HOTEL_LEVEL) == 1500
+    assert table.rent(5, mortgaged=True) == 0
+    assert table.rent(1, level=HOTEL_LEVEL) == 25
+    assert table.field_ids() == [1, 2, 5, 6, 7, 8]
+
+
+def test_table_matches_street_rent():
+    street = Street(1, 'street', 'brown', 5, PRICES, OTHER_RENTS)
+    table = RentTable.for_fields([street])
+    for level in range(1, 5):
+        street.add_house()
+        assert street.current_rent() == table.rent(1, level)
+    street.add_hotel()
+    assert street.current_rent() == table.rent(1, HOTEL_LEVEL)
+
+
+def test_mortgaged_street_rent():
+    street = Street(1, 'street', 'brown', 5, PRICES, OTHER_RENTS)
+    street.do_mortgage()
+    assert street.current_rent() == 0
+    street.lift_mortgage()
+    assert street.current_rent() == 5
@@ -0,0 +1,104 @@
+from classes.save_format import save_game, save_games, load_game
+from classes.save_format import encode_game, decode_game, SaveFormatError
+from classes.save_format import SAVE_HEADER
+from classes.board_loader import load_board, load_board_definition
+from classes.game import Game
+from classes.game_state import GameState, HEADER_SIZE
+from classes.player import Player
+from classes import simulation
+import pytest
+
+
+def played_game(seed=3, turns=25):
+    players = [Player('Ala'), Player('Ola'), Player('Żaneta')]
+    game = Game(load_board(), players, seed)
+    game.prepare_game()
+    for _ in range(turns):
+        simulation.play_turn(game, [simulation.BuilderPolicy()] * 3)
+    return game
+
+
+def test_save_and_load(tmp_path):
+    game = played_game()
+    filename = tmp_path / 'game.sav'
+    save_game(game, filename)
+    loaded = load_game(filename)
+    assert [p.name() for p in loaded.players()] == ['Ala', 'Ola', 'Żaneta']
+    assert GameState.capture(loaded) == GameState.capture(game)
+    assert loaded.current_player_name() == game.current_player_name()
+    for field_id in game.board().property_field_ids():
+        field = loaded.get_field_by_id(field_id)
+        if field.owner() is not None:
+            assert field.owner() in loaded.players()
+
+
+def test_save_many_games(tmp_path):
+    games = {tmp_path / f'{seed}.sav': played_game(seed) for seed in range(5)}
+    save_games(games)
+    for filename, game in games.items():
+        assert GameState.capture(load_game(filename)) == \
+            GameState.capture(game)
+
+
+def test_save_is_small():
+    definition_hash = load_board_definition().definition_hash()
+    assert len(encode_game(played_game(), definition_hash)) < 300
+
+
+def test_other_board_rejected():
+    data = encode_game(played_game(), b'\x00' * 32)
+    with pytest.raises(SaveFormatError):
+        decode_game(data, load_board(),
+                    load_board_definition().definition_hash())
+
+
+def test_corrupted_save_rejected():
+    board_hash = load_board_definition().definition_hash()
+    data = encode_game(played_game(), board_hash)
+    with pytest.raises(SaveFormatError):
+        decode_game(data[:-3], load_board(), board_hash)
+    with pytest.raises(SaveFormatError):
+        decode_game(b'pickle', load_board(), board_hash)
+
+
+def test_state_not_matching_board_rejected():
+    board_hash = load_board_definition().definition_hash()
+    game = played_game()
+    data = encode_game(game, board_hash)
+    values_start = len(data) - 4 * len(GameState.capture(game).values())
+    magic, version, saved_hash, players_num, values_num = \
+        SAVE_HEADER.unpack_from(data)
+    short = SAVE_HEADER.pack(magic, version, saved_hash, players_num,
+                             values_num - 4) + data[SAVE_HEADER.size:-16]
+    with pytest.raises(SaveFormatError):
+        decode_game(short, load_board(), board_hash)
+    for offset in (0, 4 * HEADER_SIZE):
+        garbled = bytearray(data)
+        garbled[values_start + offset] = 9
+        with pytest.raises(SaveFormatError):
+            decode_game(bytes(garbled), load_board(), board_hash)
+
+
+def test_long_name_rejected():
+    game = Game(load_board(), [Player('a' * 256), Player('Ola')])
+    game.prepare_game()
+    with pytest.raises(SaveFormatError):
+        encode_game(game, load_board_definition().definition_hash())
+
+
+def test_deck_seed_restored():
+    board_hash = load_board_definition().definition_hash()
+    for seed in (None, 7):
+        game = played_game(seed=seed, turns=0)
+        board = game.board()
+        for _ in range(3):
+            board.get_new_chance_card()
+        loaded = decode_game(encode_game(game, board_hash), load_board(),
+                             board_hash)
+        assert loaded.board().chance_deck().seed() == seed
+        assert [loaded.board().get_new_chance_card().card_id()
+                for _ in range(12)] == \
+            [board.get_new_chance_card().card_id() for _ in range(12)]
+    game = played_game(seed=2 ** 64, turns=0)
+    with pytest.raises(SaveFormatError):
+        encode_game(game, board_hash)
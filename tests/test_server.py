@@ -0,0 +1,186 @@
+from classes.server import GameServer, Seat, Table, MENU_COMMANDS
+from classes.board_loader import load_board
+from classes.game import Game
+from classes.player import Player
+from classes.load_client import run_load_test, percentile
+from classes.simulation import Policy
+from classes.tournament import play_seeded_game, game_seed
+from array import array
+import asyncio
+
+
+async def serve(players_num=2, seed=None, answer_timeout=5.0):
+    server = GameServer(players_num, seed, answer_timeout)
+    await server.start('127.0.0.1', 0)
+    return server
+
+
+async def connect(server):
+    reader, writer = await asyncio.open_connection('127.0.0.1', server.port())
+    return reader, writer
+
+
+async def send(writer, line):
+    writer.write(line.encode('utf-8') + b'\n')
+    await writer.drain()
+
+
+async def read_until(reader, prefix):
+    lines = []
+    while True:
+        line = (await reader.readline()).decode('utf-8')
+        lines.append(line.strip())
+        if not line or line.startswith(prefix):
+            return lines
+
+
+async def wait_for_tables(server, tables_num=0):
+    for _ in range(200):
+        if server.tables_num() == tables_num:
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_server_game_same_as_simulation():
+    async def play(seed):
+        server = await serve(seed=seed)
+        winners, round_trips = await run_load_test(
+            1, 2, '127.0.0.1', server.port())
+        server.close()
+        return winners[0], round_trips, server.latencies()
+
+    for seed in range(3):
+        winner, round_trips, latencies = asyncio.run(play(seed))
+        result = play_seeded_game(game_seed(seed, 0), [Policy(), Policy()])
+        assert winner == f'player{result.winner}'
+        assert len(round_trips) > 0
+        assert len(latencies) > 0
+
+
+def test_many_tables():
+    async def play():
+        server = await serve()
+        winners, round_trips = await run_load_test(
+            30, 3, '127.0.0.1', server.port())
+        await wait_for_tables(server)
+        server.close()
+        return winners, round_trips, server
+
+    winners, round_trips, server = asyncio.run(play())
+    assert len(winners) == 30
+    assert all(winner in ('player0', 'player1', 'player2')
+               for winner in winners)
+    assert server.tables_num() == 0
+
+
+def test_join_errors():
+    async def play():
+        server = await serve()
+        reader, writer = await connect(server)
+        await send(writer, 'HELLO')
+        error = await reader.readline()
+        await send(writer, 'JOIN t1 Ala 7')
+        wrong_num = await reader.readline()
+        await send(writer, 'JOIN t1 Ala')
+        joined = await reader.readline()
+        other_reader, other_writer = await connect(server)
+        await send(other_writer, 'JOIN t1 Ala')
+        same_name = await other_reader.readline()
+        writer.close()
+        other_writer.close()
+        await wait_for_tables(server)
+        server.close()
+        return error, wrong_num, joined, same_name, server.tables_num()
+
+    error, wrong_num, joined, same_name, tables_num = asyncio.run(play())
+    assert error.startswith(b'ERR')
+    assert wrong_num == b'ERR Incorrect number of players\n'
+    assert joined == b'OK t1\n'
+    assert same_name == b'ERR Players must have unique names\n'
+    assert tables_num == 0
+
+
+def test_menu_actions_and_disconnect():
+    async def play():
+        server = await serve()
+        first_reader, first_writer = await connect(server)
+        second_reader, second_writer = await connect(server)
+        await send(first_writer, 'JOIN t1 Ala')
+        await send(second_writer, 'JOIN t1 Ola')
+        await read_until(first_reader, 'ASK MENU')
+        await read_until(second_reader, 'START')
+        await send(second_writer, 'ROLL')
+        not_your_turn = await read_until(second_reader, 'ERR')
+        await send(first_writer, 'BUILD 5')
+        not_owner = await first_reader.readline()
+        await send(first_writer, 'FLY')
+        unknown = await read_until(first_reader, 'ERR')
+        first_writer.close()
+        second_writer.close()
+        await wait_for_tables(server)
+        server.close()
+        return not_your_turn, not_owner, unknown, server.tables_num()
+
+    not_your_turn, not_owner, unknown, tables_num = asyncio.run(play())
+    assert not_your_turn[-1] == 'ERR Not your turn'
+    assert not_owner == b'ERR You are not owner of this field\n'
+    assert unknown[-1] == 'ERR Unknown command'
+    assert tables_num == 0
+
+
+def test_idle_player_timed_out():
+    async def play():
+        server = await serve(answer_timeout=0.05)
+        first_reader, first_writer = await connect(server)
+        second_reader, second_writer = await connect(server)
+        await send(first_writer, 'JOIN t1 Ala')
+        await send(second_writer, 'JOIN t1 Ola')
+        await read_until(first_reader, 'ASK MENU')
+        timed_out = await read_until(first_reader, 'ERR')
+        other = await read_until(second_reader, 'END')
+        await wait_for_tables(server)
+        first_writer.close()
+        second_writer.close()
+        server.close()
+        return timed_out, other, server.tables_num()
+
+    timed_out, other, tables_num = asyncio.run(play())
+    assert timed_out[-1] == 'ERR Answer timeout'
+    assert 'ERR Answer timeout' in other
+    assert tables_num == 0
+
+
+def test_table_error_logged(caplog):
+    async def play():
+        server = GameServer()
+
+        async def broken_table():
+            raise RuntimeError('broken table')
+        task = asyncio.get_running_loop().create_task(broken_table())
+        server.add_table_task(task)
+        await asyncio.sleep(0.01)
+        return server
+
+    server = asyncio.run(play())
+    assert 'Table task failed' in caplog.text
+    assert 'broken table' in caplog.text
+    assert not server._table_tasks
+
+
+def test_sell_property_field():
+    table = Table('t1', 2, None)
+    game = Game(load_board(), [Player('Ala'), Player('Ola')])
+    game.prepare_game()
+    game.current_player().set_position(1)
+    game.buy_current_property()
+    table._game = game
+    seat = Seat(None)
+    table.property_action(seat, 'SELL', ['1'], MENU_COMMANDS)
+    assert seat._buffer == [b'ERR This field is not a Street\n']
+
+
+def test_percentile():
+    values = array('d', [0.3, 0.1, 0.2, 0.4])
+    assert percentile(values, 0.5) == 0.3
+    assert percentile(values, 0.99) == 0.4
+    assert percentile(array('d'), 0.5) == 0.0
@@ -0,0 +1,66 @@
+from classes import interface
+from classes import simulation
+from classes.simulation import Policy, PassivePolicy, BuilderPolicy
+
+
+def game_result(game):
+    return [(p.money(), sorted(p.owned_property_fields()), p.is_bancrupt)
+            for p in game.players()]
+
+
+def test_play_until_win(new_game):
+    game = new_game(3, seed=1)
+    winner = simulation.play(game)
+    assert game.win()
+    assert winner in game.players()
+
+
+def test_passive_policy_buys_nothing(new_game):
+    game = new_game(seed=2)
+    simulation.play(game, [PassivePolicy(), PassivePolicy()])
+    for player in game.players():
+        assert player.owned_property_fields() == set()
+
+
+def test_builder_policy_builds_houses(new_game):
+    game = new_game()
+    game.prepare_game()
+    player = game.current_player()
+    for field_id in (5, 7):
+        player.set_position(field_id)
+        game.buy_current_property()
+    BuilderPolicy(reserve=300).manage_properties(game)
+    assert game.get_field_by_id(5).houses_num() == 1
+    assert game.get_field_by_id(7).houses_num() == 1
+
+
+def test_liquidate_sells_houses_before_mortgage(new_game):
+    game = new_game()
+    game.prepare_game()
+    player = game.current_player()
+    for field_id in (5, 7):
+        player.set_position(field_id)
+        game.buy_current_property()
+    field5 = game.get_field_by_id(5)
+    game.build_house(field5)
+    player._money = 0
+    simulation.liquidate(game, 100)
+    assert game.can_afford(100)
+    assert field5.houses_num() == 0
+    assert not field5.is_mortgaged()
+
+
+def test_headless_game_matches_interface(new_game, monkeypatch):
+    monkeypatch.setattr(interface, 'clear', lambda: None)
+    monkeypatch.setattr(interface, 'pause', lambda: None)
+    monkeypatch.setattr(interface, 'bool_input', lambda: True)
+    monkeypatch.setattr(interface, 'players_input_menu',
+                        lambda: interface.MenuOption.THROW_DICE)
+    monkeypatch.setattr('builtins.print', lambda *args, **kwargs: None)
+    interactive = new_game(seed=3)
+    interactive.prepare_game()
+    interface.play(interactive, resumed=True)
+    headless = new_game(seed=3)
+    simulation.play(headless, [Policy(), Policy()])
+    assert game_result(headless) == game_result(interactive)
+    assert headless.get_round_num() == interactive.get_round_num()
@@ -0,0 +1,82 @@
+from classes.game_events import EventType
+from classes.simulation import BuilderPolicy, Policy
+from classes.telemetry import TelemetryWriter, TelemetryReader, TurnRecorder
+from classes.telemetry import TelemetryError, COLUMN_NAMES, record_games
+from classes.tournament import new_game
+from classes import simulation
+import pytest
+
+
+def test_rows_round_trip(tmp_path):
+    filename = str(tmp_path / 'rows.tel')
+    rows = [(game, turn, turn % 3, 1 + turn % 6, 6 - turn % 6, turn % 10,
+             1500 - turn, turn % 10, turn % 7 * 10, 1 << (turn % 17))
+            for game in range(3) for turn in range(100)]
+    with TelemetryWriter(filename, chunk_rows=64) as writer:
+        for row in rows:
+            writer.add_row(*row)
+        assert writer.rows_num() == 300
+    reader = TelemetryReader(filename)
+    assert reader.rows_num() == 300
+    assert reader.chunks_num() == 5
+    assert reader.column_names() == COLUMN_NAMES
+    columns = reader.columns()
+    assert list(zip(*(columns[name] for name in COLUMN_NAMES))) == rows
+    assert list(reader.column('cash', range(1, 2))) == \
+        [row[6] for row in rows[64:128]]
+
+
+def test_empty_file(tmp_path):
+    filename = str(tmp_path / 'empty.tel')
+    TelemetryWriter(filename).close()
+    reader = TelemetryReader(filename)
+    assert reader.rows_num() == 0
+    assert len(reader.column('game')) == 0
+
+
+def test_invalid_file(tmp_path):
+    filename = tmp_path / 'invalid.tel'
+    filename.write_bytes(b'not telemetry')
+    with pytest.raises(TelemetryError):
+        TelemetryReader(str(filename))
+    writer = TelemetryWriter(str(filename))
+    writer.add_row(0, 0, 0, 1, 1, 2, 1500, 2, 0, 0)
+    writer.close()
+    data = filename.read_bytes()
+    filename.write_bytes(data[:-3])
+    with pytest.raises(TelemetryError):
+        TelemetryReader(str(filename))
+
+
+def test_recorder_rows_follow_game(tmp_path):
+    filename = str(tmp_path / 'game.tel')
+    game = new_game(7, 2)
+    policies = [BuilderPolicy(), Policy()]
+    with TelemetryWriter(filename) as writer:
+        recorder = TurnRecorder(writer, game_id=7)
+        recorder.attach(game)
+        simulation.play(game, policies, resumed=True)
+        recorder.detach()
+    assert game._recorder is None
+    columns = TelemetryReader(filename).columns()
+    turns = len(columns['turn'])
+    assert list(columns['turn']) == list(range(turns))
+    assert set(columns['game']) == {7}
+    assert turns >= game._total_moves
+    for index in range(turns):
+        assert 2 <= columns['dice1'][index] + columns['dice2'][index] <= 12
+        assert columns['actions'][index] & (1 << EventType.DICE_ROLL)
+        if not columns['actions'][index] & (1 << EventType.USE_CHANCE_CARD):
+            assert columns['field'][index] == columns['position'][index]
+    last_player = game.players()[columns['player'][-1]]
+    assert columns['cash'][-1] == last_player.money()
+
+
+def test_record_games(tmp_path):
+    filename = str(tmp_path / 'games.tel')
+    rows = record_games(filename, [1, 2, 3], [Policy(), Policy()],
+                        chunk_rows=16)
+    reader = TelemetryReader(filename)
+    assert reader.rows_num() == rows
+    assert set(reader.column('game')) == {1, 2, 3}
+    assert reader.chunks_num() == -(-rows // 16)
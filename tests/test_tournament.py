@@ -0,0 +1,56 @@
+from classes.tournament import GameResult, TournamentStats
+from classes.tournament import run_tournament, replay_game, play_seeded_game
+from classes.board_loader import load_board_definition
+from classes.simulation import Policy, PassivePolicy
+from classes import tournament
+
+
+def test_same_seed_same_game():
+    policies = [Policy(), Policy()]
+    assert play_seeded_game(7, policies) == play_seeded_game(7, policies)
+
+
+def test_replay_game():
+    policies = [Policy(), PassivePolicy()]
+    result = play_seeded_game(11, policies)
+    game = replay_game(11, policies)
+    assert game.get_round_num() == result.rounds
+    assert tuple(game.total_fortune(p) for p in game.players()) == \
+        result.fortunes
+
+
+def test_results_do_not_depend_on_workers():
+    stats1, results1 = run_tournament(12, workers=1, batch_size=5)
+    stats2, results2 = run_tournament(12, workers=2, batch_size=5)
+    assert results1 == results2
+    assert stats1.wins() == stats2.wins()
+    assert stats1.games() == 12
+
+
+def test_stats_merge():
+    result1 = GameResult(0, 0, 20, (1500, 1000))
+    result2 = GameResult(1, None, 21, (500, 500))
+    stats1 = TournamentStats(2)
+    stats1.add(result1)
+    stats2 = TournamentStats(2)
+    stats2.add(result2)
+    stats1.merge(stats2)
+    assert stats1.games() == 2
+    assert stats1.wins() == [1, 0]
+    assert stats1.no_winner() == 1
+    assert stats1.mean_rounds() == 20.5
+    assert stats1.mean_fortunes() == [1000, 750]
+
+
+def test_default_board_reads_database_once(monkeypatch):
+    calls = []
+
+    def counted_definition():
+        calls.append(1)
+        return load_board_definition()
+    monkeypatch.setattr(tournament, '_definition', None)
+    monkeypatch.setattr(tournament, 'load_board_definition',
+                        counted_definition)
+    boards = [tournament.default_board() for _ in range(3)]
+    assert len(calls) == 1
+    assert boards[0] is not boards[1]